@@ -0,0 +1,51 @@
+"""Shared OpenAI client.
+
+One AsyncOpenAI client is created per process, so every chat request reuses
+the same HTTP connection pool instead of opening new connections per call.
+"""
+
+from typing import TYPE_CHECKING, Optional
+from config import settings
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+_client = None
+
+
+def get_openai_client() -> Optional["AsyncOpenAI"]:
+    """Get the process-wide AsyncOpenAI client.
+
+    Returns:
+        The shared client, or None if OPENAI_API_KEY is not configured.
+
+    Raises:
+        ImportError: If the openai package is not installed.
+    """
+    global _client
+
+    if _client is None and settings.OPENAI_API_KEY:
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        _client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.OPENAI_TIMEOUT,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+                ),
+            ),
+        )
+
+    return _client
+
+
+async def close_openai_client():
+    """Close the shared client's connection pool (on shutdown)."""
+    global _client
+
+    if _client is not None:
+        await _client.close()
+        _client = None
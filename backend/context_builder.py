@@ -0,0 +1,198 @@
+"""Token-budgeted chat context.
+
+A conversation's context is its rolling summary plus the messages not yet
+folded into it:
+
+    {"summary": str | None,
+     "summarized_through": int | None,  # last message ID in the summary
+     "messages": [{"id": int, "role": str, "content": str}, ...]}
+
+build_history packs the newest messages into CHAT_CONTEXT_TOKEN_BUDGET and
+returns the older ones that did not fit; once enough of them pile up
+(should_summarize) they are folded into the summary (summarize) after the
+turn, so prompt size stays bounded without dropping context outright.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from ai_client import get_openai_client
+from config import settings
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Most unsummarized messages loaded or cached per conversation. Summaries keep
+# the real tail far shorter; this only bounds a backlog (e.g. failed summaries).
+UNSUMMARIZED_LOAD_LIMIT = 100
+
+# Per-message framing tokens in the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Tokens of each message kept by the fallback (non-LLM) summary
+FALLBACK_SUMMARY_TOKENS = 50
+
+SUMMARY_PROMPT = """Update the running summary of a todo-assistant conversation.
+Keep facts that later turns may rely on: tasks mentioned (with IDs), actions
+taken, and the user's stated preferences. Be brief; plain sentences, no lists."""
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """tiktoken encoding for the chat model, or None if it can't be loaded.
+
+    The first load downloads the BPE file unless it is in tiktoken's cache,
+    so it is done at startup off the event loop (load_encoding). A failure
+    is cached like a success: tokens are estimated from length from then
+    on rather than retrying the download on every turn.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except ImportError:
+        logger.warning("tiktoken not installed, estimating tokens from length")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens from length: {e}")
+    return None
+
+
+async def load_encoding() -> None:
+    """Load the tiktoken encoding in a worker thread (on startup)."""
+    await asyncio.to_thread(_encoding)
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text (about 4 characters per token without tiktoken)."""
+    encoding = _encoding()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text))
+
+
+def truncate_tokens(text: str, max_tokens: int, keep_end: bool = False) -> str:
+    """Cut text to at most max_tokens, keeping its start (or its end)."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _encoding()
+    if encoding is None:
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text
+        return "…" + text[-max_chars:] if keep_end else text[:max_chars] + "…"
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    if keep_end:
+        return "…" + encoding.decode(tokens[-max_tokens:])
+    return encoding.decode(tokens[:max_tokens]) + "…"
+
+
+def message_tokens(message: Dict[str, Any]) -> int:
+    """Tokens a message costs in the prompt."""
+    return count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+def empty_context() -> Dict[str, Any]:
+    """Context of a conversation with no messages yet."""
+    return {"summary": None, "summarized_through": None, "messages": []}
+
+
+def build_history(
+    context: Dict[str, Any],
+    budget: Optional[int] = None,
+) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]]]:
+    """Pack a conversation's context into a token budget.
+
+    The summary (if any) goes first as a system message, then as many of the
+    newest messages as fit, up to CHAT_HISTORY_LIMIT. If the newest message
+    alone exceeds the budget it is truncated rather than dropped.
+
+    Returns:
+        (history in OpenAI format, older messages that did not fit)
+    """
+    budget = settings.CHAT_CONTEXT_TOKEN_BUDGET if budget is None else budget
+    messages = context["messages"]
+
+    prefix = []
+    if context.get("summary"):
+        summary = {
+            "role": "system",
+            "content": f"Summary of the earlier conversation:\n{context['summary']}",
+        }
+        prefix.append(summary)
+        budget -= message_tokens(summary)
+
+    packed: List[Dict[str, str]] = []
+    for message in reversed(messages):
+        if len(packed) >= settings.CHAT_HISTORY_LIMIT:
+            break
+        cost = message_tokens(message)
+        if cost > budget:
+            if packed or budget <= MESSAGE_OVERHEAD_TOKENS:
+                break
+            content = truncate_tokens(message["content"], budget - MESSAGE_OVERHEAD_TOKENS)
+            packed.append({"role": message["role"], "content": content})
+            budget = 0
+            continue
+        packed.append({"role": message["role"], "content": message["content"]})
+        budget -= cost
+
+    packed.reverse()
+    overflow = messages[:len(messages) - len(packed)]
+    return prefix + packed, overflow
+
+
+def should_summarize(overflow: List[Dict[str, Any]]) -> bool:
+    """Whether enough messages overflowed to be worth a summary call.
+
+    Waiting for CHAT_SUMMARY_MIN_MESSAGES messages (or CHAT_SUMMARY_MIN_TOKENS
+    tokens) batches the work, instead of a model call on every turn once a
+    conversation outgrows its window.
+    """
+    return len(overflow) >= settings.CHAT_SUMMARY_MIN_MESSAGES or (
+        sum(message_tokens(message) for message in overflow) >= settings.CHAT_SUMMARY_MIN_TOKENS
+    )
+
+
+async def summarize(previous: Optional[str], messages: List[Dict[str, Any]]) -> str:
+    """Fold messages into a rolling summary of at most CHAT_SUMMARY_MAX_TOKENS.
+
+    Uses the chat model when configured; otherwise (or if the call fails)
+    appends a clipped line per message and keeps the most recent part.
+    """
+    max_tokens = settings.CHAT_SUMMARY_MAX_TOKENS
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+
+    try:
+        client = get_openai_client()
+    except ImportError:
+        client = None
+
+    if client is not None:
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": SUMMARY_PROMPT},
+                    {
+                        "role": "user",
+                        "content": f"Current summary:\n{previous or '(none)'}\n\nNew messages:\n{transcript}",
+                    },
+                ],
+                temperature=0,
+                max_tokens=max_tokens,
+            )
+            summary = (response.choices[0].message.content or "").strip()
+            if summary:
+                return truncate_tokens(summary, max_tokens)
+        except Exception as e:
+            logger.warning(f"Summary generation failed, using fallback: {e}")
+
+    lines = [previous] if previous else []
+    lines += [
+        f"{m['role']}: {truncate_tokens(m['content'], FALLBACK_SUMMARY_TOKENS)}"
+        for m in messages
+    ]
+    return truncate_tokens("\n".join(lines), max_tokens, keep_end=True)
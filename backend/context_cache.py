@@ -0,0 +1,179 @@
+"""Conversation context cache.
+
+Keeps each conversation's context (rolling summary plus unsummarized
+messages, see context_builder) so a chat turn can reach the model without
+reloading history from Postgres. Entries are keyed by conversation ID and
+scoped by user: a lookup for another user's conversation is always a miss.
+
+By default contexts live in a bounded in-process LRU with TTL eviction. When
+CHAT_CONTEXT_REDIS_URL is set, a shared Redis store is used instead, so
+every worker process sees the same (write-through) contexts.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol
+from config import settings
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+Window = Dict[str, Any]
+
+
+class ContextStore(Protocol):
+    """Storage backend for cached conversation contexts."""
+
+    async def get(self, key: str) -> Optional[Window]: ...
+
+    async def set(self, key: str, window: Window) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class LRUContextStore:
+    """Bounded in-process LRU; entries expire ttl seconds after their last write."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Window]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Window]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, window = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return window
+
+    async def set(self, key: str, window: Window) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, window)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class RedisContextStore:
+    """Shared store: contexts as JSON strings with a Redis-side TTL."""
+
+    def __init__(self, url: str, ttl: float):
+        import redis.asyncio as redis
+
+        self.ttl = int(ttl)
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[Window]:
+        value = await self._redis.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, window: Window) -> None:
+        await self._redis.set(key, json.dumps(window), ex=self.ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+_store: Optional[ContextStore] = None
+
+
+def get_context_store() -> ContextStore:
+    """Get the process-wide context store, creating it on first use."""
+    global _store
+
+    if _store is None:
+        if settings.CHAT_CONTEXT_REDIS_URL:
+            _store = RedisContextStore(settings.CHAT_CONTEXT_REDIS_URL, settings.CHAT_CONTEXT_CACHE_TTL)
+        else:
+            _store = LRUContextStore(settings.CHAT_CONTEXT_CACHE_SIZE, settings.CHAT_CONTEXT_CACHE_TTL)
+
+    return _store
+
+
+def set_context_store(store: Optional[ContextStore]) -> None:
+    """Replace the context store (None resets to the configured default)."""
+    global _store
+    _store = store
+
+
+async def close_context_store():
+    """Close the shared store's connections (on shutdown)."""
+    global _store
+
+    if _store is not None and hasattr(_store, "close"):
+        await _store.close()
+    _store = None
+
+
+def _key(user_id: str, conversation_id: int) -> str:
+    return f"chat:context:v2:{user_id}:{conversation_id}"
+
+
+async def get_window(user_id: str, conversation_id: int) -> Optional[Window]:
+    """Get a cached context, or None on a miss. Cache errors count as misses."""
+    try:
+        return await get_context_store().get(_key(user_id, conversation_id))
+    except Exception as e:
+        logger.warning(f"Context cache read failed: {e}")
+        return None
+
+
+async def put_window(user_id: str, conversation_id: int, window: Window) -> None:
+    """Cache a conversation's context."""
+    try:
+        await get_context_store().set(_key(user_id, conversation_id), window)
+    except Exception as e:
+        logger.warning(f"Context cache write failed: {e}")
+
+
+async def append_to_window(
+    user_id: str,
+    conversation_id: int,
+    messages: List[Dict[str, Any]],
+    limit: int,
+) -> None:
+    """Write-through: add newly saved messages to a cached context.
+
+    Only contexts already in the cache are extended, never replaced, so a
+    summary applied while a turn ran is kept. A missing one is left for the
+    next read to load in full.
+    """
+    window = await get_window(user_id, conversation_id)
+    if window is not None:
+        window = dict(window, messages=(window["messages"] + messages)[-limit:])
+        await put_window(user_id, conversation_id, window)
+
+
+async def apply_summary(
+    user_id: str,
+    conversation_id: int,
+    summary: str,
+    summarized_through: int,
+) -> None:
+    """Write-through: store a new summary and drop the messages it covers."""
+    window = await get_window(user_id, conversation_id)
+    if window is not None:
+        window = {
+            "summary": summary,
+            "summarized_through": summarized_through,
+            "messages": [m for m in window["messages"] if m["id"] > summarized_through],
+        }
+        await put_window(user_id, conversation_id, window)
+
+
+async def invalidate(user_id: str, conversation_id: int) -> None:
+    """Drop a conversation's cached context (e.g. after deleting it)."""
+    try:
+        await get_context_store().delete(_key(user_id, conversation_id))
+    except Exception as e:
+        logger.warning(f"Context cache delete failed: {e}")
@@ -1,23 +1,141 @@
 """Database connection and session management."""
 
-from sqlmodel import create_engine, Session, SQLModel
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from config import settings
 
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
+def _async_database_url(database_url: str):
+    """Rewrite a sync Postgres URL to use the asyncpg driver.
+
+    asyncpg does not understand libpq's ``sslmode`` query parameter, so it is
+    translated to the equivalent ``ssl`` parameter.
+    """
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgres", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+
+    if url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        query = dict(url.query)
+        query["ssl"] = query.pop("sslmode")
+        query.pop("channel_binding", None)
+        url = url.set(query=query)
+
+    return url
+
+
+def asyncpg_connect_args() -> dict:
+    """Keyword arguments for a raw asyncpg.connect to DATABASE_URL.
+
+    For connections outside the pool (e.g. LISTEN). The URL is normalized
+    as for the engine, and its query parameters become connect arguments,
+    the way SQLAlchemy's asyncpg dialect passes them.
+    """
+    url = _async_database_url(settings.DATABASE_URL)
+    return {**url.translate_connect_args(username="user"), **dict(url.query)}
+
+
+class PoolMetrics:
+    """Counters describing how requests wait on the connection pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.pre_ping_failures = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        """Record the time one checkout spent waiting for a connection."""
+        self.checkouts += 1
+        self.wait_time_total += seconds
+        self.wait_time_max = max(self.wait_time_max, seconds)
+        if timed_out:
+            self.checkout_timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        return {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "wait_time_avg_ms": round(self.wait_time_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+            "pre_ping_failures": self.pre_ping_failures,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+# Create async database engine
+engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
     echo=settings.ENVIRONMENT == "development",
-    pool_pre_ping=True,
+    poolclass=InstrumentedPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
 
-def create_db_and_tables():
+@event.listens_for(engine.sync_engine, "handle_error")
+def _count_pre_ping_failures(context):
+    """Count stale connections detected (and replaced) by pre-ping."""
+    if getattr(context, "is_pre_ping", False):
+        pool_metrics.pre_ping_failures += 1
+
+
+# Session factory; objects stay usable after commit (no implicit lazy reloads)
+async_session = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def get_pool_status() -> dict:
+    """Report current pool occupancy alongside the checkout metrics."""
+    pool = engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool_metrics.snapshot(),
+    }
+
+
+async def create_db_and_tables():
     """Create database tables."""
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
 
-def get_db():
-    """Get database session dependency."""
-    with Session(engine) as session:
+async def get_db():
+    """Get async database session dependency."""
+    async with async_session() as session:
         yield session
@@ -0,0 +1,125 @@
+"""Deterministic fast path for unambiguous chat commands.
+
+Messages like "complete task 3", "delete tasks 4 and 5" or "show my pending
+tasks" map to exactly one MCP tool call, so the chat endpoints run them
+directly instead of asking the model. Anything the grammar doesn't match
+exactly (or that carries extra words) goes to the model as before, and so
+does an "add task" whose text mentions a date, time or priority (the model
+turns those into fields rather than leaving them in the title) or lists
+several items (the model may split them into one add_tasks call).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import re
+
+Intent = Tuple[str, Dict[str, Any]]
+
+# One or more task IDs: "3", "#3", "3, 4 and 5", "3 & 4"
+_IDS = r"(?P<ids>#?\d+(?:\s*(?:,\s*(?:and\s+)?|and\s+|&\s*)#?\d+)*)"
+_TASKS = r"(?:tasks?\s+)?"
+_DONE_WORDS = r"done|complete|completed|finished"
+_PENDING_WORDS = r"pending|incomplete|not done|undone|open"
+
+# Polite wrapping that doesn't change the meaning
+_PREFIX = re.compile(r"^(?:please\s+|can you\s+|could you\s+)+", re.IGNORECASE)
+_SUFFIX = re.compile(r"(?:,?\s+please)?\s*[.!?]*$", re.IGNORECASE)
+
+# Scheduling and priority details in a new task's text (the fast path can't parse them)
+_DETAIL_WORDS = re.compile(
+    r"\b(?:today|tonight|tomorrow|yesterday|weekend|weekday"
+    r"|(?:mon|tues|wednes|thurs|fri|satur|sun)day"
+    r"|january|february|march|april|june|july|august|september|october|november|december"
+    r"|jan|feb|apr|aug|sept?|oct|nov|dec"
+    r"|next|due|deadline|by|before|until|noon|midnight|morning|afternoon|evening"
+    r"|priority|urgent|important|asap)\b"
+    r"|\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b"
+    r"|\b\d{1,2}[/.-]\d{1,2}(?:[/.-]\d{2,4})?\b"
+    r"|\bin\s+(?:a|an|\d+)\s+(?:minutes?|hours?|days?|weeks?|months?)\b",
+    re.IGNORECASE
+)
+
+# Separators that may join several tasks in one "add" ("milk, eggs and bread")
+_LIST_SEPARATORS = re.compile(r"[,;]|\band\b", re.IGNORECASE)
+
+STATUS_WORDS = {
+    "all": "all",
+    "pending": "pending", "incomplete": "pending", "open": "pending",
+    "completed": "completed", "done": "completed", "finished": "completed",
+}
+
+
+def _parse_ids(text: str) -> List[int]:
+    return list(dict.fromkeys(int(n) for n in re.findall(r"\d+", text)))
+
+
+def _complete(match: re.Match) -> Intent:
+    state = match.groupdict().get("state")
+    completed = state is None or re.fullmatch(_DONE_WORDS, state.lower()) is not None
+    return "complete_tasks", {"task_ids": _parse_ids(match["ids"]), "completed": completed}
+
+
+def _reopen(match: re.Match) -> Intent:
+    return "complete_tasks", {"task_ids": _parse_ids(match["ids"]), "completed": False}
+
+
+def _delete(match: re.Match) -> Intent:
+    return "delete_tasks", {"task_ids": _parse_ids(match["ids"])}
+
+
+def _list(match: re.Match) -> Intent:
+    return "list_tasks", {"status": STATUS_WORDS.get((match["status"] or "all").lower(), "all")}
+
+
+def _add(match: re.Match) -> Optional[Intent]:
+    title = match["title"].strip()
+    if _DETAIL_WORDS.search(title) or _LIST_SEPARATORS.search(title):
+        return None
+    return "add_task", {"title": title}
+
+
+# (pattern, intent builder); patterns must match the whole normalized message,
+# and a builder may still decline (None) to leave the message to the model
+GRAMMAR: List[Tuple[re.Pattern, Callable[[re.Match], Optional[Intent]]]] = [
+    (re.compile(rf"(?:complete|finish|check off)\s+{_TASKS}{_IDS}", re.IGNORECASE), _complete),
+    (re.compile(
+        rf"mark\s+{_TASKS}{_IDS}\s+as\s+(?P<state>{_DONE_WORDS}|{_PENDING_WORDS})", re.IGNORECASE
+    ), _complete),
+    (re.compile(rf"(?:reopen|uncomplete)\s+{_TASKS}{_IDS}", re.IGNORECASE), _reopen),
+    (re.compile(rf"(?:delete|remove)\s+{_TASKS}{_IDS}", re.IGNORECASE), _delete),
+    (re.compile(
+        r"(?:show|list|display|view|get|what are)\s+(?:me\s+)?(?:all\s+(?:of\s+)?)?(?:my\s+)?"
+        r"(?:(?P<status>all|pending|incomplete|open|completed|done|finished)\s+)?"
+        r"(?:tasks|todos|to-dos|todo list)",
+        re.IGNORECASE
+    ), _list),
+    (re.compile(
+        r"(?:add|create)\s+(?:a\s+)?(?:new\s+)?(?:task|todo)\s*(?::|-|called|named|to)?\s+(?P<title>\S.*)",
+        re.IGNORECASE
+    ), _add),
+]
+
+
+def match_intent(message: str) -> Optional[Intent]:
+    """
+    Resolve a chat message to a single tool call, if it is an exact command.
+
+    Args:
+        message: The user's message
+
+    Returns:
+        (function_name, arguments) for execute_tool, or None to use the model
+
+    Example:
+        >>> match_intent("Complete tasks 3 and 4, please")
+        ("complete_tasks", {"task_ids": [3, 4], "completed": True})
+    """
+    text = " ".join(message.split())
+    text = _PREFIX.sub("", _SUFFIX.sub("", text))
+
+    for pattern, build in GRAMMAR:
+        match = pattern.fullmatch(text)
+        if match:
+            intent = build(match)
+            if intent is not None:
+                return intent
+    return None
@@ -3,7 +3,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
-from database import create_db_and_tables
+from database import create_db_and_tables, get_pool_status
+from middleware.auth import token_cache
+from middleware.rate_limit import RateLimitMiddleware, close_rate_limit_store
+from ai_client import close_openai_client
+from context_builder import load_encoding
+from context_cache import close_context_store
+from response_cache import close_response_store
+from task_events import close_task_event_bus, get_task_event_bus
 from routes import tasks
 
 # Create FastAPI app
@@ -15,6 +22,9 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Per-user rate limiting (added before CORS so 429s still carry CORS headers)
+app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -27,9 +37,20 @@ app.add_middleware(
 
 
 @app.on_event("startup")
-def on_startup():
-    """Initialize database on startup."""
-    create_db_and_tables()
+async def on_startup():
+    """Initialize database and the token counter on startup."""
+    await create_db_and_tables()
+    await load_encoding()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Release the shared OpenAI connection pool, cache stores and task event bus."""
+    await close_openai_client()
+    await close_context_store()
+    await close_response_store()
+    await close_rate_limit_store()
+    await close_task_event_bus()
 
 
 @app.get("/health")
@@ -42,6 +63,37 @@ async def health_check():
     }
 
 
+@app.get("/health/db")
+async def database_health():
+    """Connection pool health: occupancy, overflow, wait time, pre-ping failures."""
+    pool = get_pool_status()
+    saturated = pool["checked_out"] >= pool["size"] + pool["max_overflow"]
+    return {
+        "status": "saturated" if saturated else "healthy",
+        "pool": pool,
+    }
+
+
+@app.get("/health/events")
+async def events_health():
+    """Task change feed: backend and open subscriptions."""
+    return {
+        "status": "healthy",
+        "backend": settings.TASK_EVENTS_BACKEND,
+        "subscriptions": get_task_event_bus().snapshot(),
+    }
+
+
+@app.get("/health/auth")
+async def auth_health():
+    """Verified-token cache: size and hit rate."""
+    return {
+        "status": "healthy",
+        "bypass": settings.AUTH_BYPASS,
+        "token_cache": token_cache.snapshot(),
+    }
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -18,7 +18,11 @@ from .tools import (
     complete_task,
     delete_task,
     update_task,
+    add_tasks,
+    complete_tasks,
+    delete_tasks,
 )
+from .registry import TOOL_REGISTRY, OPENAI_TOOLS, tool_stats
 
 __all__ = [
     "mcp_app",
@@ -27,4 +31,10 @@ __all__ = [
     "complete_task",
     "delete_task",
     "update_task",
+    "add_tasks",
+    "complete_tasks",
+    "delete_tasks",
+    "TOOL_REGISTRY",
+    "OPENAI_TOOLS",
+    "tool_stats",
 ]
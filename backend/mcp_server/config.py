@@ -12,6 +12,9 @@ MCP_SERVER_NAME = "todo-mcp-server"
 MCP_SERVER_VERSION = "1.0.0"
 MCP_SERVER_DESCRIPTION = "MCP tools for Todo task management"
 
+# Most items a batch tool (add_tasks, complete_tasks, delete_tasks) accepts per call
+MAX_BATCH_SIZE = 50
+
 # Database configuration (reuse from main app)
 DATABASE_URL = os.getenv("DATABASE_URL")
 
@@ -0,0 +1,273 @@
+"""
+MCP tool registry.
+
+Builds, once at import, one ToolSpec per tool in tools.py: the OpenAI
+function schema (parameter types and required fields come from the tool's
+signature, descriptions from TOOL_DOCS), an argument validator and the
+executor. Chat routes dispatch through TOOL_REGISTRY by name and send
+OPENAI_TOOLS to the model, so adding a tool means adding the function and
+its TOOL_DOCS entry.
+
+Following Constitution principles:
+- MCP-First Tool Design
+- Type Safety (arguments are checked before a tool runs)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union, get_args, get_origin
+import inspect
+import logging
+import time
+
+from . import tools
+
+logger = logging.getLogger(__name__)
+
+# Tool descriptions and per-parameter schema details (description, enum, items)
+TOOL_DOCS: Dict[str, Dict[str, Any]] = {
+    "add_task": {
+        "description": "Create a new task in the user's todo list",
+        "parameters": {
+            "title": {"description": "The task title or description"},
+            "description": {"description": "Optional detailed description"},
+        },
+    },
+    "list_tasks": {
+        "description": "Get the user's tasks, optionally filtered by status",
+        "parameters": {
+            "status": {
+                "enum": ["all", "pending", "completed"],
+                "description": "Filter tasks by status (default: all)",
+            },
+        },
+    },
+    "complete_task": {
+        "description": "Toggle the completion status of a task",
+        "parameters": {
+            "task_id": {"description": "The ID of the task to toggle"},
+        },
+    },
+    "delete_task": {
+        "description": "Delete a task from the user's todo list",
+        "parameters": {
+            "task_id": {"description": "The ID of the task to delete"},
+        },
+    },
+    "update_task": {
+        "description": "Update a task's title or description",
+        "parameters": {
+            "task_id": {"description": "The ID of the task to update"},
+            "title": {"description": "New title for the task"},
+            "description": {"description": "New description for the task"},
+        },
+    },
+    "add_tasks": {
+        "description": (
+            "Create several tasks at once. Use instead of repeated add_task calls "
+            "when the user lists multiple items"
+        ),
+        "parameters": {
+            "tasks": {
+                "description": "The tasks to create (max 50)",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "The task title"},
+                        "description": {"type": "string", "description": "Optional detailed description"},
+                    },
+                    "required": ["title"],
+                },
+            },
+        },
+    },
+    "complete_tasks": {
+        "description": "Mark several tasks as complete (or incomplete) at once",
+        "parameters": {
+            "task_ids": {"description": "The IDs of the tasks to update (max 50)"},
+            "completed": {"description": "True to mark complete, false to mark incomplete (default: true)"},
+        },
+    },
+    "delete_tasks": {
+        "description": "Delete several tasks from the user's todo list at once",
+        "parameters": {
+            "task_ids": {"description": "The IDs of the tasks to delete (max 50)"},
+        },
+    },
+}
+
+# Python annotation -> JSON schema type
+JSON_TYPES = {str: "string", int: "integer", bool: "boolean", float: "number", dict: "object", list: "array"}
+
+
+def _json_schema(annotation: Any) -> Dict[str, Any]:
+    """JSON schema for a tool parameter annotation (Optional[X] is treated as X)."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        origin = get_origin(annotation)
+
+    if origin in (list, List):
+        (item,) = get_args(annotation) or (Any,)
+        schema: Dict[str, Any] = {"type": "array"}
+        if item is not Any:
+            schema["items"] = _json_schema(item)
+        return schema
+    return {"type": JSON_TYPES[origin or annotation]}
+
+
+def _type_error(value: Any, schema: Dict[str, Any]) -> Optional[str]:
+    """Describe how value fails schema's type (and enum/items), or None if it matches."""
+    expected = schema.get("type")
+    if expected == "integer":
+        ok = isinstance(value, int) and not isinstance(value, bool)
+    elif expected == "number":
+        ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif expected == "string":
+        ok = isinstance(value, str)
+    elif expected == "boolean":
+        ok = isinstance(value, bool)
+    elif expected == "object":
+        ok = isinstance(value, dict)
+    elif expected == "array":
+        ok = isinstance(value, list)
+    else:
+        ok = True
+    if not ok:
+        return f"must be of type {expected}"
+
+    if "enum" in schema and value not in schema["enum"]:
+        return f"must be one of: {', '.join(map(str, schema['enum']))}"
+
+    if expected == "array" and "items" in schema:
+        for item in value:
+            error = _type_error(item, schema["items"])
+            if error:
+                return f"items {error}"
+
+    if expected == "object":
+        for name in schema.get("required", []):
+            if name not in value:
+                return f"missing '{name}'"
+        for name, prop in schema.get("properties", {}).items():
+            if name in value and value[name] is not None:
+                error = _type_error(value[name], prop)
+                if error:
+                    return f"'{name}' {error}"
+    return None
+
+
+@dataclass
+class ToolStats:
+    """Per-tool execution timing."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, elapsed_ms: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+@dataclass
+class ToolSpec:
+    """A registered tool: schema, validator and executor."""
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    description: str
+    properties: Dict[str, Dict[str, Any]]
+    required: List[str]
+    stats: ToolStats = field(default_factory=ToolStats)
+
+    @classmethod
+    def from_function(cls, func: Callable[..., Awaitable[Any]]) -> "ToolSpec":
+        """Build a spec from a tool's signature (user_id excluded) and its TOOL_DOCS entry."""
+        docs = TOOL_DOCS[func.__name__]
+        signature = inspect.signature(func)
+        hints = inspect.get_annotations(func, eval_str=True)
+
+        properties: Dict[str, Dict[str, Any]] = {}
+        required: List[str] = []
+        for name, parameter in signature.parameters.items():
+            if name == "user_id":
+                continue
+            properties[name] = {**_json_schema(hints[name]), **docs["parameters"].get(name, {})}
+            if parameter.default is inspect.Parameter.empty:
+                required.append(name)
+
+        return cls(func.__name__, func, docs["description"], properties, required)
+
+    def openai_schema(self) -> Dict[str, Any]:
+        """The tool in OpenAI function-calling format."""
+        parameters: Dict[str, Any] = {"type": "object", "properties": self.properties}
+        if self.required:
+            parameters["required"] = self.required
+        return {
+            "type": "function",
+            "function": {"name": self.name, "description": self.description, "parameters": parameters},
+        }
+
+    def validate(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """Check arguments against the schema. Returns an error message, or None if valid."""
+        for name in self.required:
+            if arguments.get(name) is None:
+                return f"{name} is required"
+        for name, value in arguments.items():
+            if name not in self.properties or value is None:
+                continue
+            error = _type_error(value, self.properties[name])
+            if error:
+                return f"{name} {error}"
+        return None
+
+    async def execute(self, user_id: str, arguments: Dict[str, Any]) -> Any:
+        """Validate and run the tool, recording its timing. Unknown arguments are ignored."""
+        error = self.validate(arguments)
+        if error:
+            logger.warning(f"Rejected {self.name} call: {error}")
+            return {"error": error}
+
+        started = time.perf_counter()
+        failed = True
+        try:
+            kwargs = {k: v for k, v in arguments.items() if k in self.properties and v is not None}
+            result = await self.func(user_id, **kwargs)
+            failed = isinstance(result, dict) and "error" in result
+            return result
+        finally:
+            self.stats.record((time.perf_counter() - started) * 1000, failed)
+
+
+TOOL_REGISTRY: Dict[str, ToolSpec] = {
+    spec.name: spec
+    for spec in map(ToolSpec.from_function, (
+        tools.add_task,
+        tools.list_tasks,
+        tools.complete_task,
+        tools.delete_task,
+        tools.update_task,
+        tools.add_tasks,
+        tools.complete_tasks,
+        tools.delete_tasks,
+    ))
+}
+
+# Function schemas sent to the model with every chat completion
+OPENAI_TOOLS: List[Dict[str, Any]] = [spec.openai_schema() for spec in TOOL_REGISTRY.values()]
+
+
+def tool_stats() -> Dict[str, Dict[str, Any]]:
+    """Timing per tool, for health checks."""
+    return {name: spec.stats.snapshot() for name, spec in TOOL_REGISTRY.items()}
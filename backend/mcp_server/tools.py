@@ -16,14 +16,17 @@ All tools follow these Constitution principles:
 """
 
 from typing import Dict, List, Any, Optional
-from database import get_db
+from pydantic import ValidationError
+from database import async_session
 from services.task_service import TaskService
+from schemas.task import TaskCreate
+from .config import MAX_BATCH_SIZE
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def add_task(
+async def add_task(
     user_id: str,
     title: str,
     description: Optional[str] = None
@@ -68,11 +71,11 @@ def add_task(
         return {"error": "Description must be max 1000 characters"}
 
     # Get database session
-    db = next(get_db())
+    db = async_session()
 
     try:
         # Call service layer
-        task = TaskService.create_task(
+        task = await TaskService.create_task(
             db=db,
             user_id=user_id,
             title=title,
@@ -96,11 +99,11 @@ def add_task(
         return {"error": "Failed to create task. Please try again."}
 
     finally:
-        db.close()
+        await db.close()
 
 
 
-def list_tasks(
+async def list_tasks(
     user_id: str,
     status: str = "all"
 ) -> List[Dict[str, Any]]:
@@ -144,11 +147,11 @@ def list_tasks(
         return [{"error": "status must be 'all', 'pending', or 'completed'"}]
 
     # Get database session
-    db = next(get_db())
+    db = async_session()
 
     try:
         # Call service layer
-        tasks = TaskService.list_tasks(
+        tasks, _ = await TaskService.list_tasks(
             db=db,
             user_id=user_id,
             status=status
@@ -179,11 +182,11 @@ def list_tasks(
         return [{"error": "Failed to retrieve tasks. Please try again."}]
 
     finally:
-        db.close()
+        await db.close()
 
 
 
-def complete_task(
+async def complete_task(
     user_id: str,
     task_id: int
 ) -> Dict[str, Any]:
@@ -220,11 +223,11 @@ def complete_task(
         return {"error": "task_id is required"}
 
     # Get database session
-    db = next(get_db())
+    db = async_session()
 
     try:
         # Call service layer
-        task = TaskService.toggle_complete(
+        task = await TaskService.toggle_complete(
             db=db,
             user_id=user_id,
             task_id=task_id
@@ -251,11 +254,11 @@ def complete_task(
         return {"error": "Failed to complete task. Please try again."}
 
     finally:
-        db.close()
+        await db.close()
 
 
 
-def delete_task(
+async def delete_task(
     user_id: str,
     task_id: int
 ) -> Dict[str, Any]:
@@ -292,11 +295,11 @@ def delete_task(
         return {"error": "task_id is required"}
 
     # Get database session
-    db = next(get_db())
+    db = async_session()
 
     try:
         # Get task first to return title (and verify ownership)
-        task = TaskService.get_task(
+        task = await TaskService.get_task(
             db=db,
             user_id=user_id,
             task_id=task_id
@@ -309,7 +312,7 @@ def delete_task(
         title = task.title
 
         # Delete task
-        success = TaskService.delete_task(
+        success = await TaskService.delete_task(
             db=db,
             user_id=user_id,
             task_id=task_id
@@ -335,11 +338,11 @@ def delete_task(
         return {"error": "Failed to delete task. Please try again."}
 
     finally:
-        db.close()
+        await db.close()
 
 
 
-def update_task(
+async def update_task(
     user_id: str,
     task_id: int,
     title: Optional[str] = None,
@@ -386,7 +389,7 @@ def update_task(
         return {"error": "At least one field (title or description) must be provided"}
 
     # Get database session
-    db = next(get_db())
+    db = async_session()
 
     try:
         # Build updates dictionary
@@ -402,7 +405,7 @@ def update_task(
             updates["description"] = description
 
         # Call service layer
-        task = TaskService.update_task(
+        task = await TaskService.update_task(
             db=db,
             user_id=user_id,
             task_id=task_id,
@@ -430,8 +433,244 @@ def update_task(
         return {"error": "Failed to update task. Please try again."}
 
     finally:
-        db.close()
+        await db.close()
+
+
+def _batch_error(items: Any, name: str) -> Optional[str]:
+    """Validate the list argument of a batch tool; returns an error or None."""
+    if not isinstance(items, list) or not items:
+        return f"{name} must be a non-empty list"
+    if len(items) > MAX_BATCH_SIZE:
+        return f"At most {MAX_BATCH_SIZE} {name} per call"
+    return None
+
+
+def _task_ids(task_ids: List[Any]) -> List[int]:
+    """Keep the positive integer IDs of a batch, in order and without duplicates."""
+    return list(dict.fromkeys(
+        task_id for task_id in task_ids
+        if isinstance(task_id, int) and not isinstance(task_id, bool) and task_id > 0
+    ))
+
+
+async def add_tasks(
+    user_id: str,
+    tasks: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Create several tasks for the user in one transaction.
+
+    Constitution: MCP-First Tool Design, User Authorization
+
+    Args:
+        user_id: User ID who owns the tasks (required)
+        tasks: List of {"title": str, "description": str (optional)}
+
+    Returns:
+        list: One result per input item, in order. Each is the add_task
+        result ({"task_id", "status": "created", "title"}) or {"error": str}
+        for an item that failed validation; valid items are still created.
+
+        Or on error: [{"error": str}]
+
+    Example:
+        >>> await add_tasks("user123", [{"title": "Buy milk"}, {"title": "Call mom"}])
+        [{"task_id": 6, "status": "created", "title": "Buy milk"},
+         {"task_id": 7, "status": "created", "title": "Call mom"}]
+    """
+    # Validation
+    if not user_id:
+        return [{"error": "user_id is required"}]
+
+    error = _batch_error(tasks, "tasks")
+    if error:
+        return [{"error": error}]
+
+    results: List[Dict[str, Any]] = []
+    valid: List[TaskCreate] = []
+    for item in tasks:
+        try:
+            valid.append(TaskCreate(
+                title=item.get("title") or "",
+                description=item.get("description"),
+            ))
+            results.append({})
+        except (AttributeError, ValidationError):
+            results.append({"error": "Each task needs a title of 1-200 characters and a description of max 1000"})
+
+    if not valid:
+        return results
+
+    # Get database session
+    db = async_session()
+
+    try:
+        # Call service layer
+        created = iter(await TaskService.create_tasks(db=db, user_id=user_id, items=valid))
+
+        logger.info(f"Tasks created via MCP: user={user_id}, count={len(valid)}")
+
+        for result in results:
+            if "error" not in result:
+                task = next(created)
+                result.update({"task_id": task.id, "status": "created", "title": task.title})
+        return results
+
+    except ValueError as e:
+        logger.warning(f"Validation error in add_tasks: {e}")
+        return [{"error": str(e)}]
+
+    except Exception as e:
+        logger.error(f"Unexpected error in add_tasks: {e}")
+        return [{"error": "Failed to create tasks. Please try again."}]
+
+    finally:
+        await db.close()
+
+
+
+async def complete_tasks(
+    user_id: str,
+    task_ids: List[int],
+    completed: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Mark several tasks complete (or pending) in one transaction.
+
+    Unlike complete_task this sets, rather than toggles, the status, so
+    repeating the call is harmless.
+
+    Constitution: User Authorization, Graceful Error Handling
+
+    Args:
+        user_id: User ID (required, for authorization)
+        task_ids: Task IDs to update (required)
+        completed: True to complete, False to reopen (default: True)
+
+    Returns:
+        list: One result per task ID, in order: {"task_id", "status":
+        "completed" or "pending", "title"} or {"task_id", "error": "Task not found"}
+
+        Or on error: [{"error": str}]
+
+    Example:
+        >>> await complete_tasks("user123", [3, 4])
+        [{"task_id": 3, "status": "completed", "title": "Call mom"},
+         {"task_id": 4, "error": "Task not found"}]
+    """
+    # Validation
+    if not user_id:
+        return [{"error": "user_id is required"}]
+
+    error = _batch_error(task_ids, "task_ids")
+    if error:
+        return [{"error": error}]
+
+    ids = _task_ids(task_ids)
+    status = "completed" if completed else "pending"
+
+    # Get database session
+    db = async_session()
+
+    try:
+        # Call service layer
+        found = await TaskService.complete_tasks(
+            db=db,
+            user_id=user_id,
+            task_ids=ids,
+            completed=completed
+        ) if ids else {}
+
+        logger.info(f"Tasks completed via MCP: user={user_id}, count={len(found)}, completed={completed}")
+
+        # Don't reveal if a task doesn't exist or user doesn't own it
+        return [
+            {"task_id": task_id, "status": status, "title": found[task_id]}
+            if task_id in found else {"task_id": task_id, "error": "Task not found"}
+            for task_id in task_ids
+        ]
+
+    except ValueError as e:
+        logger.warning(f"Validation error in complete_tasks: {e}")
+        return [{"error": str(e)}]
+
+    except Exception as e:
+        logger.error(f"Unexpected error in complete_tasks: {e}")
+        return [{"error": "Failed to complete tasks. Please try again."}]
+
+    finally:
+        await db.close()
+
+
+
+async def delete_tasks(
+    user_id: str,
+    task_ids: List[int]
+) -> List[Dict[str, Any]]:
+    """
+    Delete several tasks from the user's list with one statement.
+
+    Constitution: User Authorization, Security (don't reveal task existence)
+
+    Args:
+        user_id: User ID (required, for authorization)
+        task_ids: Task IDs to delete (required)
+
+    Returns:
+        list: One result per task ID, in order: {"task_id", "status":
+        "deleted", "title"} or {"task_id", "error": "Task not found"}
+
+        Or on error: [{"error": str}]
+
+    Example:
+        >>> await delete_tasks("user123", [2, 5])
+        [{"task_id": 2, "status": "deleted", "title": "Old task"},
+         {"task_id": 5, "status": "deleted", "title": "Older task"}]
+    """
+    # Validation
+    if not user_id:
+        return [{"error": "user_id is required"}]
+
+    error = _batch_error(task_ids, "task_ids")
+    if error:
+        return [{"error": error}]
+
+    ids = _task_ids(task_ids)
+
+    # Get database session
+    db = async_session()
+
+    try:
+        # Call service layer
+        deleted = await TaskService.delete_tasks(
+            db=db,
+            user_id=user_id,
+            task_ids=ids
+        ) if ids else {}
+
+        logger.info(f"Tasks deleted via MCP: user={user_id}, count={len(deleted)}")
+
+        # Don't reveal if a task doesn't exist or user doesn't own it
+        return [
+            {"task_id": task_id, "status": "deleted", "title": deleted[task_id]}
+            if task_id in deleted else {"task_id": task_id, "error": "Task not found"}
+            for task_id in task_ids
+        ]
+
+    except ValueError as e:
+        logger.warning(f"Validation error in delete_tasks: {e}")
+        return [{"error": str(e)}]
+
+    except Exception as e:
+        logger.error(f"Unexpected error in delete_tasks: {e}")
+        return [{"error": "Failed to delete tasks. Please try again."}]
+
+    finally:
+        await db.close()
 
 
 # Log tool registration
-logger.info("MCP Tools registered: add_task, list_tasks, complete_task, delete_task, update_task")
+logger.info(
+    "MCP Tools registered: add_task, list_tasks, complete_task, delete_task, update_task, "
+    "add_tasks, complete_tasks, delete_tasks"
+)
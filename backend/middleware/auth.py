@@ -1,12 +1,60 @@
 """JWT authentication middleware."""
 
-from fastapi import Header
+from fastapi import Header, HTTPException
+from jose import jwt, JWTError, ExpiredSignatureError
+from typing import List
+from config import settings
+from middleware.jwt_cache import VerifiedTokenCache
+
+# Verified tokens shared by every request in this worker process
+token_cache = VerifiedTokenCache(settings.JWT_CACHE_SIZE)
+
+
+def signing_secrets() -> List[str]:
+    """Secrets a token may be signed with: the current one first, then the previous one.
+
+    During a key rotation BETTER_AUTH_SECRET holds the new secret and
+    BETTER_AUTH_SECRET_PREVIOUS the old one, so tokens issued before the
+    switch stay valid until they expire.
+    """
+    return [s for s in (settings.BETTER_AUTH_SECRET, settings.BETTER_AUTH_SECRET_PREVIOUS) if s]
+
+
+def verify_token(token: str) -> dict:
+    """Verify a JWT, using the verified-token cache.
+
+    Args:
+        token: Encoded JWT (without the "Bearer " prefix)
+
+    Returns:
+        Decoded JWT payload
+
+    Raises:
+        HTTPException: 401 if the token is expired or no secret verifies it
+    """
+    secrets = signing_secrets()
+    payload = token_cache.get(token, secrets)
+    if payload is not None:
+        return dict(payload)
+
+    for secret in secrets:
+        try:
+            payload = jwt.decode(token, secret, algorithms=[settings.JWT_ALGORITHM])
+        except ExpiredSignatureError:
+            raise HTTPException(status_code=401, detail="Token expired") from None
+        except JWTError:
+            continue  # Wrong key (or malformed token); try the next secret
+        token_cache.put(token, secret, payload)
+        return dict(payload)
+
+    raise HTTPException(status_code=401, detail="Invalid token")
 
 
 async def verify_jwt(authorization: str = Header(None)) -> dict:
     """Verify JWT token and return payload.
 
-    TEMPORARILY BYPASSED FOR TESTING - Remove this before production!
+    While AUTH_BYPASS is set (the default, for testing) every request is
+    the demo user. Remove the bypass before production!
 
     Args:
         authorization: Authorization header with Bearer token
@@ -18,15 +66,14 @@ async def verify_jwt(authorization: str = Header(None)) -> dict:
         HTTPException: 401 if token missing, invalid, or expired
     """
     # TEMPORARY BYPASS FOR TESTING
-    # TODO: Re-enable proper JWT verification before production
-    return {
-        "user_id": "demo-user",
-        "email": "demo@example.com",
-        "name": "Demo User"
-    }
-
-    # Original code below (commented out for testing)
-    """
+    # TODO: Disable AUTH_BYPASS before production
+    if settings.AUTH_BYPASS:
+        return {
+            "user_id": "demo-user",
+            "email": "demo@example.com",
+            "name": "Demo User"
+        }
+
     # Check authorization header
     if not authorization:
         raise HTTPException(
@@ -41,32 +88,4 @@ async def verify_jwt(authorization: str = Header(None)) -> dict:
             detail="Invalid authorization header format"
         )
 
-    # Extract token
-    token = authorization.replace("Bearer ", "")
-
-    try:
-        # Decode and verify JWT
-        payload = jwt.decode(
-            token,
-            settings.BETTER_AUTH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-
-        # Check expiry
-        exp = payload.get("exp")
-        if exp and exp < datetime.utcnow().timestamp():
-            raise HTTPException(status_code=401, detail="Token expired")
-
-        return payload
-
-    except JWTError as e:
-        raise HTTPException(
-            status_code=401,
-            detail=f"Invalid token: {str(e)}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=401,
-            detail="Token verification failed"
-        )
-    """
+    return verify_token(authorization[len("Bearer "):])
@@ -0,0 +1,79 @@
+"""Cache of already-verified JWTs.
+
+Every task route runs verify_jwt, and a client sends the same token on
+every request until it expires. Re-checking the signature and re-parsing the
+claims each time is wasted CPU, so verified payloads are kept in a bounded
+LRU keyed by the token's SHA-256 and dropped at the token's own exp.
+
+Entries are also keyed by the secret that verified them, and a lookup only
+considers the secrets currently configured: once a rotated-out secret is
+removed, tokens it signed stop being served from the cache too.
+
+Only successfully verified tokens are cached; a bad token is re-checked
+(and rejected) every time, so garbage tokens cannot fill the cache.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+import hashlib
+import time
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified JWT payloads, each valid until its exp."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str, secret: str) -> bytes:
+        return hashlib.sha256(secret.encode() + b"\0" + token.encode()).digest()
+
+    def get(self, token: str, secrets: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Get the payload of a token verified by one of secrets, or None if not cached (or expired)."""
+        now = time.time()
+        for secret in secrets:
+            key = self._key(token, secret)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            expires_at, payload = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, token: str, secret: str, payload: Dict[str, Any]) -> None:
+        """Cache a payload verified with secret until its exp (tokens without exp are not cached)."""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+        key = self._key(token, secret)
+        self._entries[key] = (float(exp), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached token (e.g. after revoking a signing key)."""
+        self._entries.clear()
+
+    def snapshot(self) -> dict:
+        """Size and hit rate, for health checks."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
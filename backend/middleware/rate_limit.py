@@ -0,0 +1,230 @@
+"""Per-user rate limiting for the API.
+
+Each user (the verified JWT's user_id, or the client address when there is
+no valid token) has a token bucket holding up to RATE_LIMIT_BURST tokens and
+refilling at RATE_LIMIT_REFILL_PER_SECOND. A request spends tokens by route
+(ROUTE_COSTS): a chat turn or an import costs far more than a GET. When the
+bucket can't cover a request it is answered 429 with Retry-After before
+it opens a DB session or reaches the model.
+
+Buckets live in an in-process store by default. When RATE_LIMIT_REDIS_URL
+is set they live in Redis, so every worker process shares one budget.
+
+Anonymous buckets are keyed by the client address uvicorn reports. Behind
+a proxy or load balancer that is the proxy's address unless uvicorn runs
+with --proxy-headers (as the Procfile and Dockerfile do) and
+FORWARDED_ALLOW_IPS lists the proxy; otherwise every anonymous client
+shares one bucket.
+"""
+
+from collections import OrderedDict
+from typing import Callable, List, Optional, Protocol, Tuple
+from fastapi.responses import JSONResponse
+from config import settings
+from middleware.auth import signing_secrets, token_cache
+import logging
+import math
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# (method, path pattern, cost); the first match wins
+ROUTE_COSTS: List[Tuple[str, re.Pattern, float]] = [
+    ("POST", re.compile(r"/api/[^/]+/chat(?:/stream)?/?"), 10),
+    ("POST", re.compile(r"/api/[^/]+/tasks/import(?:/json)?/?"), 20),
+    ("GET", re.compile(r"/api/[^/]+/tasks/export/\w+/?"), 5),
+    ("POST", re.compile(r"/api/[^/]+/tasks/bulk/[\w-]+/?"), 5),
+]
+DEFAULT_READ_COST = 1  # Any other GET/HEAD under /api
+DEFAULT_WRITE_COST = 2  # Any other write under /api
+
+
+def route_cost(method: str, path: str) -> float:
+    """Tokens a request costs (0 for paths that aren't rate limited)."""
+    if method == "OPTIONS" or not path.startswith("/api/"):
+        return 0
+    for route_method, pattern, cost in ROUTE_COSTS:
+        if method == route_method and pattern.fullmatch(path):
+            return cost
+    return DEFAULT_READ_COST if method in ("GET", "HEAD") else DEFAULT_WRITE_COST
+
+
+def rate_limit_enabled() -> bool:
+    """Whether requests are rate limited.
+
+    RATE_LIMIT_ENABLED when set; unset, limiting is on only once AUTH_BYPASS
+    is off. Under the bypass no token is verified, so every user would be
+    keyed by address and, behind a proxy, share a single bucket.
+    """
+    if settings.RATE_LIMIT_ENABLED is None:
+        return not settings.AUTH_BYPASS
+    return settings.RATE_LIMIT_ENABLED
+
+
+def client_key(scope: dict) -> str:
+    """Bucket key: the verified token's user, else the client address.
+
+    Never the {user_id} in the path: that is checked against the token only
+    after this runs, so keying on it would let anyone drain another user's
+    bucket (or dodge their own by rotating IDs). Only claims already in the
+    verified-token cache are used, so the limiter never verifies a signature
+    itself; a token's first request (before verify_jwt caches it) is keyed
+    by address. While AUTH_BYPASS is set the address is always used.
+    """
+    if not settings.AUTH_BYPASS:
+        authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+        if authorization.startswith("Bearer "):
+            payload = token_cache.get(authorization[len("Bearer "):], signing_secrets())
+            if payload and payload.get("user_id"):
+                return f"user:{payload['user_id']}"
+
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class BucketStore(Protocol):
+    """Storage backend for token buckets."""
+
+    async def take(self, key: str, cost: float, capacity: float, refill_rate: float) -> float:
+        """Spend cost tokens if available. Returns 0 if spent, else seconds until they would be."""
+        ...
+
+
+class MemoryBucketStore:
+    """In-process buckets, bounded to max_keys (least recently used dropped first).
+
+    clock is injectable so tests can drive refills without sleeping.
+    """
+
+    def __init__(self, max_keys: int, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, cost: float, capacity: float, refill_rate: float) -> float:
+        now = self.clock()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / refill_rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# Refill and spend atomically on the Redis side, timed by the Redis clock
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore:
+    """Shared buckets in Redis (one hash per key, expiring once refilled)."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._take = self._redis.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, cost: float, capacity: float, refill_rate: float) -> float:
+        wait = await self._take(keys=[f"ratelimit:{key}"], args=[capacity, refill_rate, cost])
+        return float(wait)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+_store: Optional[BucketStore] = None
+
+
+def get_rate_limit_store() -> BucketStore:
+    """Get the process-wide bucket store, creating it on first use."""
+    global _store
+
+    if _store is None:
+        if settings.RATE_LIMIT_REDIS_URL:
+            _store = RedisBucketStore(settings.RATE_LIMIT_REDIS_URL)
+        else:
+            _store = MemoryBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+
+    return _store
+
+
+def set_rate_limit_store(store: Optional[BucketStore]) -> None:
+    """Replace the bucket store (None resets to the configured default)."""
+    global _store
+    _store = store
+
+
+async def close_rate_limit_store():
+    """Close the shared store's connections (on shutdown)."""
+    global _store
+
+    if _store is not None and hasattr(_store, "close"):
+        await _store.close()
+    _store = None
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 + Retry-After once a user's bucket is empty.
+
+    Written as plain ASGI (not BaseHTTPMiddleware) so streaming chat
+    responses pass through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not rate_limit_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        cost = route_cost(scope["method"], scope["path"])
+        if cost:
+            capacity = settings.RATE_LIMIT_BURST
+            try:
+                wait = await get_rate_limit_store().take(
+                    client_key(scope), min(cost, capacity), capacity, settings.RATE_LIMIT_REFILL_PER_SECOND
+                )
+            except Exception as e:
+                # Fail open: a store outage shouldn't take the API down with it
+                logger.warning(f"Rate limit store failed: {e}")
+                wait = 0.0
+
+            if wait > 0:
+                response = JSONResponse(
+                    status_code=429,
+                    content={"detail": "Too many requests, please slow down"},
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
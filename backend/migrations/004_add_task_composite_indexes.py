@@ -0,0 +1,193 @@
+"""
+Migration: Add composite indexes for task list filter/sort combinations
+Created: October 2026
+Author: Evolution of Todo Project
+
+Every TaskService.list_tasks query filters on user_id (and on completed for
+the pending/completed views), then orders by the sort column with id as
+tiebreaker. These indexes return rows already in that order, so keyset pages
+are read straight off the index without a Sort step.
+
+Every index leads with user_id, so the single-column ix_tasks_user_id is
+redundant and is dropped.
+
+Write cost: each task INSERT, and each UPDATE touching an indexed column
+(title, priority, due_date, completed, updated_at - i.e. nearly every
+update, since updated_at always changes), now maintains ten more btrees.
+That trades slower writes for sort-free reads; it pays off because task
+lists are read far more often than tasks are written.
+
+The same indexes are declared in models.py for fresh databases.
+"""
+
+from sqlmodel import create_engine, select, text
+import json
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models import Task
+from services.task_service import SORT_COLUMNS
+
+# Load environment variables from .env file
+load_dotenv()
+
+# (index name, column list) - status=all first, then pending/completed
+INDEXES = [
+    ("idx_tasks_user_created", "user_id, created_at DESC, id DESC"),
+    ("idx_tasks_user_updated", "user_id, updated_at DESC, id DESC"),
+    ("idx_tasks_user_title", "user_id, title, id"),
+    ("idx_tasks_user_priority", "user_id, priority DESC, id DESC"),
+    ("idx_tasks_user_due", "user_id, due_date, id"),
+    ("idx_tasks_user_completed_created", "user_id, completed, created_at DESC, id DESC"),
+    ("idx_tasks_user_completed_updated", "user_id, completed, updated_at DESC, id DESC"),
+    ("idx_tasks_user_completed_title", "user_id, completed, title, id"),
+    ("idx_tasks_user_completed_priority", "user_id, completed, priority DESC, id DESC"),
+    ("idx_tasks_user_completed_due", "user_id, completed, due_date, id"),
+]
+
+# Single-column index made redundant by the composites (all lead with user_id)
+REDUNDANT_INDEX = ("ix_tasks_user_id", "user_id")
+
+
+def get_engine():
+    """Create a sync engine from DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    return create_engine(DATABASE_URL, echo=False, isolation_level="AUTOCOMMIT")
+
+
+def upgrade():
+    """
+    Apply migration: Add composite task indexes
+
+    Steps:
+    1. Create each index concurrently (no write lock on tasks)
+    2. Drop the redundant ix_tasks_user_id
+    3. Refresh planner statistics
+    """
+    engine = get_engine()
+
+    print("Creating composite task indexes...")
+
+    with engine.connect() as conn:
+        for name, columns in INDEXES:
+            conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON tasks ({columns})"))
+            print(f"  ✓ {name} ({columns})")
+
+        name, _ = REDUNDANT_INDEX
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        print(f"  ✓ Dropped {name}")
+
+        conn.execute(text("ANALYZE tasks"))
+
+    print("✓ Migration applied successfully!")
+
+
+def downgrade():
+    """
+    Rollback migration: Drop composite task indexes
+    """
+    engine = get_engine()
+
+    print("Rolling back composite task indexes...")
+
+    with engine.connect() as conn:
+        name, columns = REDUNDANT_INDEX
+        conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON tasks ({columns})"))
+        print(f"  ✓ Restored {name}")
+
+        for name, _ in INDEXES:
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            print(f"  ✓ Dropped {name}")
+
+    print("✓ Migration rolled back successfully!")
+
+
+def _plan_node_types(plan: dict) -> list:
+    """Flatten an EXPLAIN (FORMAT JSON) plan into its node types."""
+    nodes = [plan["Node Type"]]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_node_types(child))
+    return nodes
+
+
+def verify():
+    """
+    Check that every list_tasks filter/sort combination is served in index
+    order, i.e. its EXPLAIN plan contains no Sort node.
+
+    Sequential scans, bitmap scans and sorts are disabled for the check (on
+    this connection only), so the planner takes an ordered index path
+    whenever one exists, however many rows the table or the probed user
+    holds. For a user with few or no rows it would otherwise happily pick
+    any user_id index plus a Sort, failing the check against correctly
+    created indexes.
+    """
+    engine = get_engine()
+    failures = 0
+
+    with engine.connect() as conn:
+        conn.execute(text("SET enable_seqscan = off"))
+        conn.execute(text("SET enable_bitmapscan = off"))
+        conn.execute(text("SET enable_sort = off"))
+        conn.execute(text("SET enable_incremental_sort = off"))
+
+        for status in ("all", "pending", "completed"):
+            for sort_by, (column, descending) in SORT_COLUMNS.items():
+                statement = select(Task).where(Task.user_id == "explain-user")
+                if status == "pending":
+                    statement = statement.where(~Task.completed)
+                elif status == "completed":
+                    statement = statement.where(Task.completed)
+                if descending:
+                    statement = statement.order_by(column.desc(), Task.id.desc())
+                else:
+                    statement = statement.order_by(column.asc(), Task.id.asc())
+                statement = statement.limit(20)
+
+                sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+                plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                nodes = _plan_node_types(plan[0]["Plan"])
+
+                ok = "Sort" not in nodes and "Incremental Sort" not in nodes
+                failures += 0 if ok else 1
+                print(f"  {'✓' if ok else '✗'} status={status:<9} sort={sort_by:<8} {' -> '.join(nodes)}")
+
+    if failures:
+        print(f"✗ {failures} filter/sort combination(s) still need a Sort step")
+        sys.exit(1)
+
+    print("✓ All filter/sort combinations use index ordering")
+
+
+if __name__ == "__main__":
+    """
+    Run migration from command line.
+
+    Usage:
+        python backend/migrations/004_add_task_composite_indexes.py           # Apply migration
+        python backend/migrations/004_add_task_composite_indexes.py downgrade # Rollback migration
+        python backend/migrations/004_add_task_composite_indexes.py verify    # Check EXPLAIN plans
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+
+    if command == "downgrade":
+        print("\n=== Rolling Back Migration ===\n")
+        downgrade()
+    elif command == "verify":
+        print("\n=== Verifying Query Plans ===\n")
+        verify()
+    else:
+        print("\n=== Applying Migration ===\n")
+        upgrade()
+
+    print("")
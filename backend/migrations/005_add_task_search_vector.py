@@ -0,0 +1,101 @@
+"""
+Migration: Add full-text search vector to tasks
+Created: October 2026
+Author: Evolution of Todo Project
+
+Replaces the leading-wildcard ILIKE search in TaskService.list_tasks with a
+generated tsvector column (title weighted above description) and a GIN index,
+so search cost no longer grows with the size of the tasks table. Postgres
+maintains the column on every insert/update.
+
+Note: adding a stored generated column rewrites the tasks table once.
+"""
+
+from sqlmodel import create_engine, text
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models import TASK_SEARCH_EXPRESSION
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def get_engine():
+    """Create a sync engine from DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    return create_engine(DATABASE_URL, echo=False, isolation_level="AUTOCOMMIT")
+
+
+def upgrade():
+    """
+    Apply migration: Add search_vector column and GIN index
+
+    Steps:
+    1. Add the generated search_vector column (backfills existing rows)
+    2. Create the GIN index concurrently
+    """
+    engine = get_engine()
+
+    print("Adding task search vector...")
+
+    with engine.connect() as conn:
+        conn.execute(text(
+            "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({TASK_SEARCH_EXPRESSION}) STORED"
+        ))
+        print("  ✓ search_vector column")
+
+        conn.execute(text(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_search_vector "
+            "ON tasks USING gin (search_vector)"
+        ))
+        print("  ✓ idx_tasks_search_vector (gin)")
+
+        conn.execute(text("ANALYZE tasks"))
+
+    print("✓ Migration applied successfully!")
+
+
+def downgrade():
+    """
+    Rollback migration: Drop search_vector column and its index
+    """
+    engine = get_engine()
+
+    print("Rolling back task search vector...")
+
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_search_vector"))
+        print("  ✓ Dropped idx_tasks_search_vector")
+
+        conn.execute(text("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector"))
+        print("  ✓ Dropped search_vector column")
+
+    print("✓ Migration rolled back successfully!")
+
+
+if __name__ == "__main__":
+    """
+    Run migration from command line.
+
+    Usage:
+        python backend/migrations/005_add_task_search_vector.py           # Apply migration
+        python backend/migrations/005_add_task_search_vector.py downgrade # Rollback migration
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        print("\n=== Rolling Back Migration ===\n")
+        downgrade()
+    else:
+        print("\n=== Applying Migration ===\n")
+        upgrade()
+
+    print("")
@@ -0,0 +1,98 @@
+"""
+Migration: Add per-user task counters
+Created: October 2026
+Author: Evolution of Todo Project
+
+Adds the task_counters table (total, completed and per-priority counts per
+user). TaskService updates it in the same transaction as every task write, so
+stats reads become a primary-key lookup instead of a scan of the user's tasks.
+Existing users are backfilled from the tasks table.
+"""
+
+from sqlmodel import create_engine, text
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models import TaskCounter
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def get_engine():
+    """Create a sync engine from DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    return create_engine(DATABASE_URL, echo=False)
+
+
+def upgrade():
+    """
+    Apply migration: Create and backfill task_counters
+
+    Steps:
+    1. Create task_counters if it doesn't exist
+    2. Backfill one row per user from the tasks table
+    """
+    engine = get_engine()
+
+    print("Creating task_counters table...")
+    TaskCounter.__table__.create(engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        result = conn.execute(text("""
+            INSERT INTO task_counters
+                (user_id, total, completed, priority_high, priority_medium, priority_low, updated_at)
+            SELECT
+                user_id,
+                COUNT(*),
+                COUNT(*) FILTER (WHERE completed),
+                COUNT(*) FILTER (WHERE priority = 'high'),
+                COUNT(*) FILTER (WHERE priority = 'medium'),
+                COUNT(*) FILTER (WHERE priority = 'low'),
+                NOW()
+            FROM tasks
+            GROUP BY user_id
+            ON CONFLICT (user_id) DO NOTHING
+        """))
+
+    print(f"  ✓ Backfilled counters for {result.rowcount} user(s)")
+    print("✓ Migration applied successfully!")
+
+
+def downgrade():
+    """
+    Rollback migration: Drop task_counters
+    """
+    engine = get_engine()
+
+    print("Rolling back task counters migration...")
+
+    TaskCounter.__table__.drop(engine, checkfirst=True)
+    print("  ✓ Dropped task_counters table")
+
+    print("✓ Migration rolled back successfully!")
+
+
+if __name__ == "__main__":
+    """
+    Run migration from command line.
+
+    Usage:
+        python backend/migrations/006_add_task_counters.py           # Apply migration
+        python backend/migrations/006_add_task_counters.py downgrade # Rollback migration
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        print("\n=== Rolling Back Migration ===\n")
+        downgrade()
+    else:
+        print("\n=== Applying Migration ===\n")
+        upgrade()
+
+    print("")
@@ -0,0 +1,77 @@
+"""
+Migration: Add rolling summary columns to conversations
+Created: October 2026
+Author: Evolution of Todo Project
+
+Adds conversations.summary and conversations.summarized_through. The chat
+context builder packs recent messages into a token budget and folds older
+ones into the summary, so prompts stay bounded without dropping context.
+Both columns are nullable; existing conversations start without a summary.
+"""
+
+from sqlmodel import create_engine, text
+import os
+import sys
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def get_engine():
+    """Create a sync engine from DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    return create_engine(DATABASE_URL, echo=False)
+
+
+def upgrade():
+    """
+    Apply migration: Add summary and summarized_through to conversations
+    """
+    engine = get_engine()
+
+    print("Adding conversation summary columns...")
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE conversations ADD COLUMN IF NOT EXISTS summary TEXT"))
+        print("  ✓ summary column")
+        conn.execute(text("ALTER TABLE conversations ADD COLUMN IF NOT EXISTS summarized_through INTEGER"))
+        print("  ✓ summarized_through column")
+
+    print("✓ Migration applied successfully!")
+
+
+def downgrade():
+    """
+    Rollback migration: Drop the summary columns
+    """
+    engine = get_engine()
+
+    print("Rolling back conversation summary columns...")
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE conversations DROP COLUMN IF EXISTS summarized_through"))
+        conn.execute(text("ALTER TABLE conversations DROP COLUMN IF EXISTS summary"))
+    print("  ✓ Dropped summary and summarized_through columns")
+
+    print("✓ Migration rolled back successfully!")
+
+
+if __name__ == "__main__":
+    """
+    Run migration from command line.
+
+    Usage:
+        python backend/migrations/007_add_conversation_summary.py           # Apply migration
+        python backend/migrations/007_add_conversation_summary.py downgrade # Rollback migration
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        print("\n=== Rolling Back Migration ===\n")
+        downgrade()
+    else:
+        print("\n=== Applying Migration ===\n")
+        upgrade()
+
+    print("")
@@ -0,0 +1,75 @@
+"""
+Migration: Add a per-user task version to task_counters
+Created: October 2026
+Author: Evolution of Todo Project
+
+Adds task_counters.version. TaskService bumps it in the same transaction as
+every task write, so caches of a user's task views (e.g. cached read-only
+chat answers) can check they are still current with a primary-key lookup.
+"""
+
+from sqlmodel import create_engine, text
+import os
+import sys
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def get_engine():
+    """Create a sync engine from DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    return create_engine(DATABASE_URL, echo=False)
+
+
+def upgrade():
+    """
+    Apply migration: Add version to task_counters
+    """
+    engine = get_engine()
+
+    print("Adding task_counters.version...")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE task_counters ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0"
+        ))
+    print("  ✓ version column")
+
+    print("✓ Migration applied successfully!")
+
+
+def downgrade():
+    """
+    Rollback migration: Drop task_counters.version
+    """
+    engine = get_engine()
+
+    print("Rolling back task counter version...")
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE task_counters DROP COLUMN IF EXISTS version"))
+    print("  ✓ Dropped version column")
+
+    print("✓ Migration rolled back successfully!")
+
+
+if __name__ == "__main__":
+    """
+    Run migration from command line.
+
+    Usage:
+        python backend/migrations/008_add_task_counter_version.py           # Apply migration
+        python backend/migrations/008_add_task_counter_version.py downgrade # Rollback migration
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        print("\n=== Rolling Back Migration ===\n")
+        downgrade()
+    else:
+        print("\n=== Applying Migration ===\n")
+        upgrade()
+
+    print("")
@@ -1,7 +1,8 @@
 """Database models."""
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import ARRAY, String
+from sqlalchemy import ARRAY, Computed, Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from datetime import datetime
 from typing import Optional, Literal, List
 
@@ -15,7 +16,7 @@ class Task(SQLModel, table=True):
     __tablename__ = "tasks"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: str = Field(index=True)  # Removed foreign key for now (Better Auth manages users separately)
+    user_id: str  # Removed foreign key for now (Better Auth manages users separately); indexed by the composites below
     title: str = Field(max_length=200)
     description: Optional[str] = Field(default=None, max_length=1000)
     completed: bool = Field(default=False, index=True)
@@ -26,6 +27,49 @@ class Task(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+# Composite indexes matching TaskService.list_tasks: filter on user_id (and
+# completed for pending/completed views), then walk the sort column with id as
+# tiebreaker so no sort step is needed. Each one leads with user_id, which
+# is why user_id has no single-column index of its own. Mirrors migrations/004.
+Index("idx_tasks_user_created", Task.user_id, Task.created_at.desc(), Task.id.desc())
+Index("idx_tasks_user_updated", Task.user_id, Task.updated_at.desc(), Task.id.desc())
+Index("idx_tasks_user_title", Task.user_id, Task.title, Task.id)
+Index("idx_tasks_user_priority", Task.user_id, Task.priority.desc(), Task.id.desc())
+Index("idx_tasks_user_due", Task.user_id, Task.due_date, Task.id)
+Index("idx_tasks_user_completed_created", Task.user_id, Task.completed, Task.created_at.desc(), Task.id.desc())
+Index("idx_tasks_user_completed_updated", Task.user_id, Task.completed, Task.updated_at.desc(), Task.id.desc())
+Index("idx_tasks_user_completed_title", Task.user_id, Task.completed, Task.title, Task.id)
+Index("idx_tasks_user_completed_priority", Task.user_id, Task.completed, Task.priority.desc(), Task.id.desc())
+Index("idx_tasks_user_completed_due", Task.user_id, Task.completed, Task.due_date, Task.id)
+
+# Full-text search vector, generated by Postgres from title (weight A) and
+# description (weight B) so it stays current on every write. It is added to the
+# table only, not as a model field, so task reads and inserts never carry it.
+# Mirrors migrations/005.
+TASK_SEARCH_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+TASK_SEARCH_VECTOR = Column("search_vector", TSVECTOR, Computed(TASK_SEARCH_EXPRESSION, persisted=True))
+Task.__table__.append_column(TASK_SEARCH_VECTOR)
+Index("idx_tasks_search_vector", TASK_SEARCH_VECTOR, postgresql_using="gin")
+
+
+class TaskCounter(SQLModel, table=True):
+    """Per-user task counters, maintained by TaskService in the same transaction as each write."""
+
+    __tablename__ = "task_counters"
+
+    user_id: str = Field(primary_key=True)
+    total: int = Field(default=0)
+    completed: int = Field(default=0)
+    priority_high: int = Field(default=0)
+    priority_medium: int = Field(default=0)
+    priority_low: int = Field(default=0)
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})  # Bumped by every task write
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class Conversation(SQLModel, table=True):
     """Conversation model for chat sessions (Phase III)."""
 
@@ -33,6 +77,8 @@ class Conversation(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)  # Removed foreign key for now (Better Auth manages users separately)
+    summary: Optional[str] = Field(default=None)  # Rolling summary of turns no longer sent in full
+    summarized_through: Optional[int] = Field(default=None)  # Last message ID folded into summary
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
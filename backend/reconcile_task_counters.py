@@ -0,0 +1,31 @@
+"""
+Reconcile per-user task counters with the tasks table.
+
+TaskService keeps task_counters up to date on every write, but rows can drift
+after manual SQL fixes or writes that bypass the service. Run this
+periodically (e.g. a nightly cron) or after such changes:
+
+    python reconcile_task_counters.py            # every user
+    python reconcile_task_counters.py <user_id>  # a single user
+"""
+import asyncio
+import sys
+
+from database import async_session, engine
+from services.task_service import TaskService
+
+
+async def main(user_id: str | None = None):
+    async with async_session() as db:
+        fixed = await TaskService.reconcile_counters(db, user_id)
+    await engine.dispose()
+
+    if fixed:
+        print(f"✅ Rebuilt counters for {len(fixed)} user(s): {', '.join(fixed)}")
+    else:
+        print("✅ Task counters are consistent")
+
+
+if __name__ == "__main__":
+    print("Reconciling task counters...")
+    asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,162 @@
+"""Cache of read-only chat answers.
+
+A turn whose only tool calls were reads (e.g. "what are my pending tasks")
+is cached per user under its normalized message, tagged with the user's
+task version (TaskService.get_task_version). Every task write bumps that
+version, so a cached answer is replayed only while the tasks it describes
+are unchanged.
+
+Uses the same store types as context_cache: an in-process LRU by default,
+or Redis when CHAT_CONTEXT_REDIS_URL is set.
+
+Task versions themselves are kept in memory (get_task_version) and dropped
+whenever this process receives a task event for the user, so a hot
+conversation's turn checks the cache without a DB round-trip.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from config import settings
+from context_cache import ContextStore, LRUContextStore, RedisContextStore
+from services.task_service import TaskService
+from task_events import Event, TaskEventBus, get_task_event_bus
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Tools that never change tasks; a turn using only these can be cached
+READ_ONLY_TOOLS = frozenset({"list_tasks"})
+
+_store: Optional[ContextStore] = None
+
+# user_id -> task version, as last read from the DB (bounded LRU)
+_versions: "OrderedDict[str, int]" = OrderedDict()
+# Bumped by every invalidation; a DB read that raced one isn't cached
+_invalidations = 0
+# Bus whose events currently invalidate _versions
+_listening_bus: Optional[TaskEventBus] = None
+
+
+def get_response_store() -> ContextStore:
+    """Get the process-wide response store, creating it on first use."""
+    global _store
+
+    if _store is None:
+        if settings.CHAT_CONTEXT_REDIS_URL:
+            _store = RedisContextStore(settings.CHAT_CONTEXT_REDIS_URL, settings.CHAT_RESPONSE_CACHE_TTL)
+        else:
+            _store = LRUContextStore(settings.CHAT_RESPONSE_CACHE_SIZE, settings.CHAT_RESPONSE_CACHE_TTL)
+
+    return _store
+
+
+async def close_response_store():
+    """Close the shared store's connections (on shutdown)."""
+    global _store
+
+    if _store is not None and hasattr(_store, "close"):
+        await _store.close()
+    _store = None
+
+
+def _forget_version(user_id: Optional[str], event: Event) -> None:
+    """Task event listener: drop the user's version (everyone's for None)."""
+    global _invalidations
+
+    _invalidations += 1
+    if user_id is None:
+        _versions.clear()
+    else:
+        _versions.pop(user_id, None)
+
+
+async def _listen() -> bool:
+    """Subscribe _versions to the task event bus. False if events can't be received."""
+    global _listening_bus
+
+    bus = get_task_event_bus()
+    try:
+        await bus.listen()
+    except Exception as e:
+        logger.warning(f"Task event bus unavailable, not caching task versions: {e}")
+        return False
+
+    if bus is not _listening_bus:
+        bus.add_listener(_forget_version)
+        _forget_version(None, {})
+        _listening_bus = bus
+    return True
+
+
+async def get_task_version(db: AsyncSession, user_id: str) -> Optional[int]:
+    """
+    Get the user's task version, from memory when possible.
+
+    On a miss it is read with TaskService.get_task_version and kept until a
+    task event for the user arrives. It is not kept if this process isn't
+    receiving task events, or if one arrived during the read.
+    """
+    version = _versions.get(user_id)
+    if version is not None:
+        _versions.move_to_end(user_id)
+        return version
+
+    listening = await _listen()
+    seen = _invalidations
+    version = await TaskService.get_task_version(db, user_id)
+    if version is not None and listening and seen == _invalidations:
+        _versions[user_id] = version
+        while len(_versions) > settings.CHAT_RESPONSE_CACHE_SIZE:
+            _versions.popitem(last=False)
+    return version
+
+
+def normalize_message(message: str) -> str:
+    """Case-, whitespace- and trailing-punctuation-insensitive form of a message."""
+    return re.sub(r"[\s.!?]+$", "", " ".join(message.lower().split()))
+
+
+def _key(user_id: str, message: str) -> str:
+    digest = hashlib.sha256(normalize_message(message).encode()).hexdigest()
+    return f"chat:response:{user_id}:{digest}"
+
+
+def is_cacheable(tool_calls: List[Dict[str, Any]]) -> bool:
+    """Whether a turn's answer depends only on task reads."""
+    return bool(tool_calls) and all(call["tool"] in READ_ONLY_TOOLS for call in tool_calls)
+
+
+async def get_response(user_id: str, message: str, version: int) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached answer that is still current.
+
+    Returns:
+        {"response": str, "tool_calls": [...]} if cached at this task
+        version, else None. Cache errors count as misses.
+    """
+    try:
+        entry = await get_response_store().get(_key(user_id, message))
+    except Exception as e:
+        logger.warning(f"Response cache read failed: {e}")
+        return None
+    if entry is None or entry["version"] != version:
+        return None
+    return entry
+
+
+async def put_response(
+    user_id: str,
+    message: str,
+    version: int,
+    response: str,
+    tool_calls: List[Dict[str, Any]],
+) -> None:
+    """Cache an answer computed at the given task version (read before answering)."""
+    entry = {"version": version, "response": response, "tool_calls": tool_calls}
+    try:
+        await get_response_store().set(_key(user_id, message), entry)
+    except Exception as e:
+        logger.warning(f"Response cache write failed: {e}")
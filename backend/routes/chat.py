@@ -19,22 +19,30 @@ Following Constitution principles:
 - Error Handling: Graceful, user-friendly messages
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Optional, List, Dict, Any, AsyncIterator
-import os
+from contextlib import aclosing, suppress
+from datetime import datetime
 import logging
 import json
 import asyncio
 
-from database import get_db
+from ai_client import get_openai_client
+from config import settings
+import context_cache
+import response_cache
+from context_builder import UNSUMMARIZED_LOAD_LIMIT, build_history, empty_context, should_summarize, summarize
+from intent_router import match_intent
+from stream_limiter import StreamBusyError, stream_limiter
+from database import async_session
 from models import Conversation, Message
-from mcp_server.tools import add_task, list_tasks, complete_task, delete_task, update_task
-
-# OpenAI SDK (will be imported when available)
-# from openai import OpenAI
+from services.conversation_service import ConversationService
+from mcp_server.registry import OPENAI_TOOLS, TOOL_REGISTRY, tool_stats
+from mcp_server.tools import add_task, list_tasks, complete_task, delete_task
 
 logger = logging.getLogger(__name__)
 
@@ -66,8 +74,8 @@ class ChatResponse(BaseModel):
 async def get_or_create_conversation(
     user_id: str,
     conversation_id: Optional[int],
-    db: Session
-) -> int:
+    db: AsyncSession
+) -> Conversation:
     """
     Get existing conversation or create new one.
 
@@ -80,7 +88,7 @@ async def get_or_create_conversation(
         db: Database session
 
     Returns:
-        int: Conversation ID
+        Conversation: The user's conversation
     """
     if conversation_id:
         # Check if conversation exists and belongs to user
@@ -88,96 +96,439 @@ async def get_or_create_conversation(
             Conversation.id == conversation_id,
             Conversation.user_id == user_id
         )
-        conv = db.exec(statement).first()
+        conv = (await db.exec(statement)).first()
 
         if conv:
             logger.info(f"Using existing conversation: user={user_id}, conv_id={conversation_id}")
-            return conv.id
+            return conv
 
-    # Create new conversation
+    # Create new conversation; flushed for its ID, committed by the caller
     conv = Conversation(user_id=user_id)
     db.add(conv)
-    db.commit()
-    db.refresh(conv)
+    await db.flush()
 
     logger.info(f"Created new conversation: user={user_id}, conv_id={conv.id}")
-    return conv.id
+    return conv
 
 
 async def load_conversation_history(
     conversation_id: int,
-    limit: int = 10,
-    db: Session = None
-) -> List[Dict[str, str]]:
+    after: Optional[int] = None,
+    limit: int = UNSUMMARIZED_LOAD_LIMIT,
+    db: AsyncSession = None
+) -> List[Dict[str, Any]]:
     """
-    Load last N messages from conversation.
+    Load the messages not yet folded into the conversation's summary.
 
     Task: T-403 - Implement Conversation Management
     Constitution: Performance Principles - Minimize Database Queries
 
     Args:
         conversation_id: Conversation ID
-        limit: Number of messages to load (default: 10)
+        after: Last message ID covered by the summary (None: no summary)
+        limit: Most messages to load, newest kept
         db: Database session
 
     Returns:
-        list: Messages in OpenAI format [{"role": "user"|"assistant", "content": "..."}]
+        list: Messages [{"id": int, "role": "user"|"assistant", "content": "..."}]
 
     Note:
-        We limit to 10 messages to:
-        1. Reduce OpenAI token costs
-        2. Keep context window manageable
-        3. Improve response speed
+        Which of these reach the model is decided by the token budget in
+        context_builder.build_history; older ones end up in the summary.
     """
     # Load messages ordered by creation time (most recent first)
     statement = select(Message).where(
         Message.conversation_id == conversation_id
-    ).order_by(Message.created_at.desc()).limit(limit)
+    )
+    if after is not None:
+        statement = statement.where(Message.id > after)
+    statement = statement.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit)
 
-    messages = db.exec(statement).all()
+    messages = (await db.exec(statement)).all()
 
     # Reverse to chronological order (oldest first)
     messages = list(reversed(messages))
 
     logger.info(f"Loaded {len(messages)} messages for conversation {conversation_id}")
 
-    # Convert to OpenAI format
     return [
-        {"role": msg.role, "content": msg.content}
+        {"id": msg.id, "role": msg.role, "content": msg.content}
         for msg in messages
     ]
 
 
-async def save_message(
+async def get_conversation_context(
+    user_id: str,
+    conversation_id: Optional[int],
+    db: AsyncSession
+) -> tuple[int, Dict[str, Any]]:
+    """
+    Resolve the conversation and its context (summary + recent messages), cache first.
+
+    Constitution: Performance Principles - Minimize Database Queries
+
+    Args:
+        user_id: User ID who owns the conversation
+        conversation_id: Existing conversation ID (optional)
+        db: Database session
+
+    Returns:
+        tuple: (conversation_id, context as described in context_builder)
+
+    Note:
+        A cached context proves the conversation exists and belongs to the
+        user, so a hot conversation needs no database query before the
+        model is called. A context loaded on a miss is cached here, fresh
+        from the database.
+    """
+    if conversation_id:
+        context = await context_cache.get_window(user_id, conversation_id)
+        if context is not None:
+            logger.info(f"Context cache hit: user={user_id}, conv_id={conversation_id}")
+            return conversation_id, context
+
+    conv = await get_or_create_conversation(
+        user_id=user_id,
+        conversation_id=conversation_id,
+        db=db
+    )
+    if conv.id != conversation_id:
+        # Just created: nothing to load
+        context = empty_context()
+    else:
+        context = {
+            "summary": conv.summary,
+            "summarized_through": conv.summarized_through,
+            "messages": await load_conversation_history(conv.id, after=conv.summarized_through, db=db),
+        }
+
+    # Cache what was just read from the database; turns only ever extend it
+    await context_cache.put_window(user_id, conv.id, context)
+    return conv.id, context
+
+
+async def save_turn(
     conversation_id: int,
     user_id: str,
-    role: str,
-    content: str,
-    db: Session
+    user_message: str,
+    assistant_message: Optional[str],
+    tool_calls: List[ToolCall],
+    received_at: datetime
 ) -> None:
     """
-    Save a message to the database.
+    Save a chat turn (both messages, tool calls, conversation timestamp).
 
-    Task: T-403 - Implement Conversation Management
     Constitution: Database Principles - Conversation Persistence
 
     Args:
         conversation_id: Conversation ID
         user_id: User ID
-        role: Message role ("user" or "assistant")
-        content: Message content
-        db: Database session
+        user_message: The user's message
+        assistant_message: The assistant's reply (None if there was none)
+        tool_calls: Tools invoked while answering
+        received_at: When the user's message arrived
+
+    Note:
+        Everything is written in one transaction, so a turn costs a single
+        commit instead of one per message plus a conversation update. The
+        conversation's cached window is then updated write-through. The
+        session is opened here, only for the write.
     """
-    msg = Message(
-        conversation_id=conversation_id,
-        user_id=user_id,
-        role=role,
-        content=content
-    )
-    db.add(msg)
-    db.commit()
+    async with async_session() as db:
+        await ConversationService.save_turn(
+            db,
+            conversation_id=conversation_id,
+            user_id=user_id,
+            user_message=user_message,
+            assistant_message=assistant_message,
+            tool_calls=[call.model_dump() for call in tool_calls],
+            received_at=received_at,
+        )
+
+    logger.debug(f"Saved turn: conv={conversation_id}, tools={len(tool_calls)}")
+
+
+async def get_cached_response(
+    user_id: str,
+    message: str,
+    db: AsyncSession
+) -> tuple[Optional[int], Optional[Dict[str, Any]]]:
+    """
+    Look up a cached read-only answer for this message.
+
+    Returns:
+        tuple: (user's task version, cached answer or None). The version is
+        None for a user with no task counters yet; nothing is cached then.
+
+    Note:
+        The version usually comes from memory (response_cache.get_task_version),
+        so a hot conversation reaches the model without touching the DB.
+    """
+    version = await response_cache.get_task_version(db, user_id)
+    if version is None:
+        return None, None
+    cached = await response_cache.get_response(user_id, message, version)
+    if cached:
+        logger.info(f"Response cache hit: user={user_id}, version={version}")
+    return version, cached
+
+
+async def load_turn(
+    user_id: str,
+    conversation_id: Optional[int],
+    message: str
+) -> tuple[int, Dict[str, Any], Optional[int], Optional[Dict[str, Any]]]:
+    """
+    Load everything a turn needs before the model call, in one short session.
 
-    logger.debug(f"Saved message: conv={conversation_id}, role={role}, length={len(content)}")
+    Constitution: Performance Principles - Minimize Database Queries
+
+    Args:
+        user_id: User ID who owns the conversation
+        conversation_id: Existing conversation ID (optional)
+        message: The user's message (for the response cache)
+
+    Returns:
+        tuple: (conversation_id, context, task version, cached answer or None)
+
+    Note:
+        A new conversation is committed here and the session is closed
+        before returning, so no pooled connection is held while the model
+        runs; save_turn borrows one again afterwards.
+    """
+    async with async_session() as db:
+        conv_id, context = await get_conversation_context(
+            user_id=user_id,
+            conversation_id=conversation_id,
+            db=db
+        )
+        version, cached = await get_cached_response(user_id, message, db)
+        await db.commit()
+    return conv_id, context, version, cached
+
+
+async def cache_response(
+    user_id: str,
+    message: str,
+    version: Optional[int],
+    response: Optional[str],
+    tool_calls: List[ToolCall]
+) -> None:
+    """Cache the answer if the turn only read tasks (version read before answering)."""
+    calls = [call.model_dump() for call in tool_calls]
+    if version is not None and response and response_cache.is_cacheable(calls):
+        await response_cache.put_response(user_id, message, version, response, calls)
+
+
+# Summaries running in the background (referenced so they aren't collected)
+_summary_tasks: set = set()
+
+
+async def summarize_overflow(
+    user_id: str,
+    conversation_id: int,
+    context: Dict[str, Any],
+    overflow: List[Dict[str, Any]]
+) -> None:
+    """
+    Fold messages that no longer fit the token budget into the rolling summary.
+
+    Runs after the turn, in its own session, so it never delays a reply.
+    """
+    try:
+        summary = await summarize(context.get("summary"), overflow)
+        async with async_session() as db:
+            stored = await ConversationService.update_summary(
+                db,
+                user_id=user_id,
+                conversation_id=conversation_id,
+                summary=summary,
+                summarized_through=overflow[-1]["id"],
+                previous_through=context.get("summarized_through"),
+            )
+        logger.info(f"Summarized {len(overflow)} messages: conv={conversation_id}, stored={stored}")
+    except Exception as e:
+        logger.error(f"Summary update failed: conv={conversation_id}, error={e}", exc_info=True)
+
+
+def schedule_summary(
+    user_id: str,
+    conversation_id: int,
+    context: Dict[str, Any],
+    overflow: List[Dict[str, Any]]
+) -> None:
+    """Start summarize_overflow in the background once enough has overflowed."""
+    if not should_summarize(overflow):
+        return
+    task = asyncio.create_task(summarize_overflow(user_id, conversation_id, context, overflow))
+    _summary_tasks.add(task)
+    task.add_done_callback(_summary_tasks.discard)
+
+
+# Cap on tool calls from one assistant turn running at once; each holds a
+# pooled DB connection while it runs.
+MAX_PARALLEL_TOOL_CALLS = 8
+
+
+async def execute_tool(
+    function_name: str,
+    arguments: Dict[str, Any],
+    user_id: str
+) -> Any:
+    """
+    Run one MCP tool requested by the model.
+
+    Args:
+        function_name: Tool name from the model's tool call
+        arguments: Parsed tool arguments
+        user_id: User ID (tools are always scoped to the caller)
+
+    Returns:
+        The tool's result ({"error": ...} if the arguments don't match its
+        schema), or None for an unknown tool
+    """
+    tool = TOOL_REGISTRY.get(function_name)
+    if tool is not None:
+        return await tool.execute(user_id, arguments)
+
+    logger.warning(f"AI requested unknown tool: {function_name}")
+    return None
+
+
+async def execute_tool_calls(
+    tool_calls: List[tuple[str, Dict[str, Any]]],
+    user_id: str
+) -> AsyncIterator[tuple[str, Dict[str, Any], Any]]:
+    """
+    Run a turn's tool calls concurrently.
+
+    Every MCP tool opens its own session, so independent calls can run side
+    by side; a turn with five calls takes about as long as the slowest one.
+
+    Args:
+        tool_calls: (function_name, arguments) pairs in the model's order
+        user_id: User ID (for MCP tool calls)
+
+    Yields:
+        (function_name, arguments, result) in completion order
+    """
+    limit = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+
+    async def run(function_name: str, arguments: Dict[str, Any]):
+        async with limit:
+            try:
+                result = await execute_tool(function_name, arguments, user_id)
+            except Exception as e:
+                logger.error(f"Tool {function_name} failed: {str(e)}", exc_info=True)
+                result = {"error": f"Failed to run {function_name}"}
+        return function_name, arguments, result
+
+    pending = [asyncio.ensure_future(run(name, args)) for name, args in tool_calls]
+    try:
+        for next_done in asyncio.as_completed(pending):
+            yield await next_done
+    finally:
+        # Consumer went away (e.g. client disconnected): don't leak running tools
+        for task in pending:
+            task.cancel()
+
+
+# Confirmation text for the batch tools; they return one result per item
+BATCH_CONFIRMATIONS = {
+    "add_tasks": "✅ I've added {count} tasks: {titles}!",
+    "complete_tasks": "✅ Updated {count} tasks: {titles}!",
+    "delete_tasks": "🗑️ Deleted {count} tasks: {titles}!",
+}
+
+
+def tool_confirmation(function_name: str, result: Any) -> Optional[str]:
+    """
+    Build the user-facing confirmation line for a tool result.
+
+    Returns:
+        Confirmation text, or None if the result has nothing to confirm
+    """
+    if function_name == "list_tasks":
+        if not isinstance(result, list):
+            return None
+        if len(result) > 0:
+            task_list = "\n".join([f"• {t.get('title', 'Untitled')} {'✅' if t.get('completed') else '⭕'}" for t in result[:10]])
+            return f"Here are your tasks:\n{task_list}"
+        return "You don't have any tasks yet!"
+
+    if function_name in BATCH_CONFIRMATIONS:
+        if not isinstance(result, list):
+            return None
+        titles = [f"'{r['title']}'" for r in result if "title" in r]
+        if not titles:
+            return None
+        return BATCH_CONFIRMATIONS[function_name].format(
+            count=len(titles), titles=", ".join(titles[:10])
+        )
+
+    if not result or "title" not in result:
+        return None
+
+    if function_name == "add_task":
+        return f"✅ I've added '{result['title']}' to your tasks!"
+    elif function_name == "complete_task":
+        status = "completed" if result.get("completed") else "incomplete"
+        return f"✅ Marked '{result['title']}' as {status}!"
+    elif function_name == "delete_task":
+        return f"🗑️ Deleted '{result['title']}'!"
+    elif function_name == "update_task":
+        return f"✏️ Updated '{result['title']}'!"
+    return None
+
+
+# Reply templates for commands answered by the fast path
+FAST_PATH_TEMPLATES = {
+    "add_task": "✅ I've added {titles} to your tasks!",
+    "complete_tasks": "✅ Marked {titles} as {status}!",
+    "delete_tasks": "🗑️ Deleted {titles}!",
+}
+
+
+def fast_path_intent(messages: List[Dict[str, str]]) -> Optional[tuple[str, Dict[str, Any]]]:
+    """Match the latest user message against the intent router, if enabled."""
+    if not settings.CHAT_FAST_PATH_ENABLED or not messages or messages[-1]["role"] != "user":
+        return None
+    return match_intent(messages[-1]["content"])
+
+
+def fast_path_reply(function_name: str, arguments: Dict[str, Any], result: Any) -> str:
+    """
+    Render the templated reply for a command run by the fast path.
+
+    Returns:
+        Reply text covering successes and per-item failures
+    """
+    results = result if isinstance(result, list) else [result]
+    failures = [r for r in results if isinstance(r, dict) and "error" in r]
+
+    if function_name == "list_tasks":
+        if failures:
+            return f"Sorry, {failures[0]['error']}"
+        status = "" if arguments["status"] == "all" else f"{arguments['status']} "
+        if not results:
+            return f"You don't have any {status}tasks."
+        lines = [f"• #{t['id']} {t['title']} {'✅' if t['completed'] else '⭕'}" for t in results[:20]]
+        if len(results) > 20:
+            lines.append(f"…and {len(results) - 20} more")
+        return f"Here are your {status}tasks:\n" + "\n".join(lines)
+
+    lines = []
+    done = [r for r in results if isinstance(r, dict) and "title" in r]
+    if done:
+        lines.append(FAST_PATH_TEMPLATES[function_name].format(
+            titles=", ".join(f"'{r['title']}'" for r in done),
+            status="completed" if arguments.get("completed", True) else "pending",
+        ))
+    missing = [f"#{r['task_id']}" for r in failures if "task_id" in r]
+    if missing:
+        lines.append(f"I couldn't find task {', '.join(missing)}.")
+    lines += [f"Sorry, {r['error']}" for r in failures if "task_id" not in r]
+    return "\n".join(lines) or "Sorry, I couldn't do that. Please try again."
 
 
 async def get_ai_response_stream(
@@ -198,120 +549,31 @@ async def get_ai_response_stream(
         str: SSE-formatted chunks of the response
     """
     try:
-        from openai import OpenAI
         import json as json_module
 
-        # Check if OpenAI API key is configured
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        # Exact commands skip the model: run the tool and stream a templated reply
+        intent = fast_path_intent(messages)
+        if intent:
+            function_name, arguments = intent
+            logger.info(f"Fast path: {function_name} with args: {arguments}")
+            yield f"data: {json_module.dumps({'type': 'tool_call', 'tool': function_name, 'parameters': arguments})}\n\n"
+
+            async with aclosing(execute_tool_calls([intent], user_id)) as results:
+                async for _, _, result in results:
+                    reply = fast_path_reply(function_name, arguments, result)
+                    yield f"data: {json_module.dumps({'type': 'content', 'content': reply})}\n\n"
+                    yield f"data: {json_module.dumps({'type': 'tool_result', 'tool': function_name, 'result': result})}\n\n"
+                    yield f"data: {json_module.dumps({'type': 'done', 'full_response': reply})}\n\n"
+            return
+
+        # Shared async client (None if OpenAI API key is not configured)
+        client = get_openai_client()
+        if client is None:
             logger.warning("OPENAI_API_KEY not set, using mock streaming response")
             async for chunk in get_mock_ai_response_stream(messages, user_id):
                 yield chunk
             return
 
-        client = OpenAI(api_key=api_key)
-
-        # Define available MCP tools for OpenAI
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "add_task",
-                    "description": "Create a new task in the user's todo list",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {
-                                "type": "string",
-                                "description": "The task title or description"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Optional detailed description"
-                            }
-                        },
-                        "required": ["title"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "list_tasks",
-                    "description": "Get the user's tasks, optionally filtered by status",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "status": {
-                                "type": "string",
-                                "enum": ["all", "pending", "completed"],
-                                "description": "Filter tasks by status (default: all)"
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "complete_task",
-                    "description": "Toggle the completion status of a task",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "integer",
-                                "description": "The ID of the task to toggle"
-                            }
-                        },
-                        "required": ["task_id"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "delete_task",
-                    "description": "Delete a task from the user's todo list",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "integer",
-                                "description": "The ID of the task to delete"
-                            }
-                        },
-                        "required": ["task_id"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "update_task",
-                    "description": "Update a task's title or description",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "integer",
-                                "description": "The ID of the task to update"
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "New title for the task"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "New description for the task"
-                            }
-                        },
-                        "required": ["task_id"]
-                    }
-                }
-            }
-        ]
-
         # Add system message for AI personality
         system_message = {
             "role": "system",
@@ -323,14 +585,15 @@ async def get_ai_response_stream(
 - Delete tasks
 
 Be friendly, concise, and helpful. When users ask to add tasks, extract the task details and use the add_task function.
+When an action covers several tasks, make one add_tasks, complete_tasks or delete_tasks call instead of one call per task.
 When showing tasks, format them clearly with their IDs. Always confirm actions taken."""
         }
 
         # Call OpenAI API with streaming enabled
-        stream = client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[system_message] + messages,
-            tools=tools,
+            tools=OPENAI_TOOLS,
             tool_choice="auto",
             temperature=0.7,
             max_tokens=500,
@@ -340,94 +603,65 @@ When showing tasks, format them clearly with their IDs. Always confirm actions t
         full_response = ""
         tool_calls_buffer = {}
 
-        # Process streaming response
-        for chunk in stream:
-            delta = chunk.choices[0].delta
-
-            # Handle content chunks
-            if delta.content:
-                full_response += delta.content
-                # Send SSE event with content chunk
-                yield f"data: {json_module.dumps({'type': 'content', 'content': delta.content})}\n\n"
-                await asyncio.sleep(0)  # Allow other tasks to run
-
-            # Handle tool calls
-            if delta.tool_calls:
-                for tool_call in delta.tool_calls:
-                    idx = tool_call.index
-                    if idx not in tool_calls_buffer:
-                        tool_calls_buffer[idx] = {
-                            "id": tool_call.id or "",
-                            "name": "",
-                            "arguments": ""
-                        }
-
-                    if tool_call.function:
-                        if tool_call.function.name:
-                            tool_calls_buffer[idx]["name"] = tool_call.function.name
-                        if tool_call.function.arguments:
-                            tool_calls_buffer[idx]["arguments"] += tool_call.function.arguments
+        # Process streaming response (awaits the network, never blocks the loop)
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+
+                # Handle content chunks
+                if delta.content:
+                    full_response += delta.content
+                    # Send SSE event with content chunk
+                    yield f"data: {json_module.dumps({'type': 'content', 'content': delta.content})}\n\n"
+
+                # Handle tool calls
+                if delta.tool_calls:
+                    for tool_call in delta.tool_calls:
+                        idx = tool_call.index
+                        if idx not in tool_calls_buffer:
+                            tool_calls_buffer[idx] = {
+                                "id": tool_call.id or "",
+                                "name": "",
+                                "arguments": ""
+                            }
+
+                        if tool_call.function:
+                            if tool_call.function.name:
+                                tool_calls_buffer[idx]["name"] = tool_call.function.name
+                            if tool_call.function.arguments:
+                                tool_calls_buffer[idx]["arguments"] += tool_call.function.arguments
+        finally:
+            # Cancelled or abandoned mid-stream: drop the upstream connection so
+            # OpenAI stops generating (and billing) tokens nobody will read
+            await stream.close()
 
         # Execute tool calls if any
         if tool_calls_buffer:
+            tool_calls = []
             for tool_call_data in tool_calls_buffer.values():
                 function_name = tool_call_data["name"]
-                arguments = json_module.loads(tool_call_data["arguments"])
+                arguments = json_module.loads(tool_call_data["arguments"] or "{}")
 
                 logger.info(f"AI calling tool: {function_name} with args: {arguments}")
 
                 # Send tool call notification
                 yield f"data: {json_module.dumps({'type': 'tool_call', 'tool': function_name, 'parameters': arguments})}\n\n"
-
-                # Execute tool
-                result = None
-                if function_name == "add_task":
-                    result = add_task(user_id, arguments.get("title"), arguments.get("description"))
-                    # Generate confirmation message
-                    if result and "title" in result:
-                        confirmation = f"✅ I've added '{result['title']}' to your tasks!"
-                        full_response += confirmation
-                        yield f"data: {json_module.dumps({'type': 'content', 'content': confirmation})}\n\n"
-                elif function_name == "list_tasks":
-                    status = arguments.get("status", "all")
-                    result = list_tasks(user_id, status)
-                    # Generate task list message
-                    if isinstance(result, list):
-                        if len(result) > 0:
-                            task_list = "\n".join([f"• {t.get('title', 'Untitled')} {'✅' if t.get('completed') else '⭕'}" for t in result[:10]])
-                            confirmation = f"Here are your tasks:\n{task_list}"
-                        else:
-                            confirmation = "You don't have any tasks yet!"
-                        full_response += confirmation
-                        yield f"data: {json_module.dumps({'type': 'content', 'content': confirmation})}\n\n"
-                elif function_name == "complete_task":
-                    result = complete_task(user_id, arguments["task_id"])
-                    if result and "title" in result:
-                        status = "completed" if result.get("completed") else "incomplete"
-                        confirmation = f"✅ Marked '{result['title']}' as {status}!"
-                        full_response += confirmation
-                        yield f"data: {json_module.dumps({'type': 'content', 'content': confirmation})}\n\n"
-                elif function_name == "delete_task":
-                    result = delete_task(user_id, arguments["task_id"])
-                    if result and "title" in result:
-                        confirmation = f"🗑️ Deleted '{result['title']}'!"
-                        full_response += confirmation
-                        yield f"data: {json_module.dumps({'type': 'content', 'content': confirmation})}\n\n"
-                elif function_name == "update_task":
-                    result = update_task(
-                        user_id,
-                        arguments["task_id"],
-                        arguments.get("title"),
-                        arguments.get("description")
-                    )
-                    if result and "title" in result:
-                        confirmation = f"✏️ Updated '{result['title']}'!"
+                tool_calls.append((function_name, arguments))
+
+            # Run all calls at once; report each as soon as it finishes. Closing
+            # the results (e.g. on disconnect) cancels calls still running.
+            async with aclosing(execute_tool_calls(tool_calls, user_id)) as results:
+                async for function_name, _arguments, result in results:
+                    confirmation = tool_confirmation(function_name, result)
+                    if confirmation:
                         full_response += confirmation
                         yield f"data: {json_module.dumps({'type': 'content', 'content': confirmation})}\n\n"
 
-                # Send tool result
-                if result:
-                    yield f"data: {json_module.dumps({'type': 'tool_result', 'tool': function_name, 'result': result})}\n\n"
+                    # Send tool result
+                    if result:
+                        yield f"data: {json_module.dumps({'type': 'tool_result', 'tool': function_name, 'result': result})}\n\n"
 
         # Send completion event
         yield f"data: {json_module.dumps({'type': 'done', 'full_response': full_response})}\n\n"
@@ -485,119 +719,25 @@ async def get_ai_response(
         tuple: (response_text, tool_calls_made)
     """
     try:
-        from openai import OpenAI
         import json
 
-        # Check if OpenAI API key is configured
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        # Exact commands skip the model: run the tool and reply from a template
+        intent = fast_path_intent(messages)
+        if intent:
+            function_name, arguments = intent
+            logger.info(f"Fast path: {function_name} with args: {arguments}")
+            async for _, _, result in execute_tool_calls([intent], user_id):
+                reply = fast_path_reply(function_name, arguments, result)
+            return reply, [ToolCall(tool=function_name, parameters=arguments)]
+
+        # Shared async client (None if OpenAI API key is not configured)
+        client = get_openai_client()
+        if client is None:
             logger.warning("OPENAI_API_KEY not set, using mock response")
             return await get_mock_ai_response(messages, user_id)
 
-        client = OpenAI(api_key=api_key)
         tool_calls_made = []
 
-        # Define available MCP tools for OpenAI
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "add_task",
-                    "description": "Create a new task in the user's todo list",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {
-                                "type": "string",
-                                "description": "The task title or description"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Optional detailed description"
-                            }
-                        },
-                        "required": ["title"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "list_tasks",
-                    "description": "Get the user's tasks, optionally filtered by status",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "status": {
-                                "type": "string",
-                                "enum": ["all", "pending", "completed"],
-                                "description": "Filter tasks by status (default: all)"
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "complete_task",
-                    "description": "Toggle the completion status of a task",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "integer",
-                                "description": "The ID of the task to toggle"
-                            }
-                        },
-                        "required": ["task_id"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "delete_task",
-                    "description": "Delete a task from the user's todo list",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "integer",
-                                "description": "The ID of the task to delete"
-                            }
-                        },
-                        "required": ["task_id"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "update_task",
-                    "description": "Update a task's title or description",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "integer",
-                                "description": "The ID of the task to update"
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "New title for the task"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "New description for the task"
-                            }
-                        },
-                        "required": ["task_id"]
-                    }
-                }
-            }
-        ]
-
         # Add system message for AI personality
         system_message = {
             "role": "system",
@@ -609,14 +749,15 @@ async def get_ai_response(
 - Delete tasks
 
 Be friendly, concise, and helpful. When users ask to add tasks, extract the task details and use the add_task function.
+When an action covers several tasks, make one add_tasks, complete_tasks or delete_tasks call instead of one call per task.
 When showing tasks, format them clearly with their IDs. Always confirm actions taken."""
         }
 
         # Call OpenAI API with function calling
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",  # Using cost-effective model
             messages=[system_message] + messages,
-            tools=tools,
+            tools=OPENAI_TOOLS,
             tool_choice="auto",
             temperature=0.7,
             max_tokens=500
@@ -626,39 +767,22 @@ When showing tasks, format them clearly with their IDs. Always confirm actions t
 
         # Check if AI wants to call functions
         if message.tool_calls:
-            # Execute each tool call
+            tool_calls = []
             for tool_call in message.tool_calls:
                 function_name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
+                arguments = json.loads(tool_call.function.arguments or "{}")
 
                 logger.info(f"AI calling tool: {function_name} with args: {arguments}")
+                tool_calls.append((function_name, arguments))
 
-                # Call the appropriate MCP tool
-                if function_name == "add_task":
-                    add_task(user_id, arguments.get("title"), arguments.get("description"))
-                    tool_calls_made.append(ToolCall(tool="add_task", parameters=arguments))
-
-                elif function_name == "list_tasks":
-                    status = arguments.get("status", "all")
-                    list_tasks(user_id, status)
-                    tool_calls_made.append(ToolCall(tool="list_tasks", parameters={"status": status}))
-
-                elif function_name == "complete_task":
-                    complete_task(user_id, arguments["task_id"])
-                    tool_calls_made.append(ToolCall(tool="complete_task", parameters=arguments))
-
-                elif function_name == "delete_task":
-                    delete_task(user_id, arguments["task_id"])
-                    tool_calls_made.append(ToolCall(tool="delete_task", parameters=arguments))
-
-                elif function_name == "update_task":
-                    update_task(
-                        user_id,
-                        arguments["task_id"],
-                        arguments.get("title"),
-                        arguments.get("description")
-                    )
-                    tool_calls_made.append(ToolCall(tool="update_task", parameters=arguments))
+            # Execute all tool calls concurrently
+            async for _ in execute_tool_calls(tool_calls, user_id):
+                pass
+
+            for function_name, arguments in tool_calls:
+                if function_name == "list_tasks":
+                    arguments = {"status": arguments.get("status", "all")}
+                tool_calls_made.append(ToolCall(tool=function_name, parameters=arguments))
 
             # Get final response from AI after tool execution
             # In a full implementation, we'd send tool results back to AI
@@ -700,7 +824,7 @@ async def get_mock_ai_response(
     if "add" in last_message or "create" in last_message:
         task_title = last_message.replace("add", "").replace("create", "").replace("task", "").strip()
         if task_title:
-            result = add_task(user_id, task_title)
+            result = await add_task(user_id, task_title)
             tool_calls.append(ToolCall(tool="add_task", parameters={"title": task_title}))
             if "error" not in result:
                 response = f"✓ Added '{result['title']}' to your todo list!"
@@ -710,7 +834,7 @@ async def get_mock_ai_response(
             response = "What task would you like to add?"
 
     elif "show" in last_message or "list" in last_message or "what" in last_message:
-        result = list_tasks(user_id, "all")
+        result = await list_tasks(user_id, "all")
         tool_calls.append(ToolCall(tool="list_tasks", parameters={"status": "all"}))
         if isinstance(result, list) and len(result) > 0:
             task_list = "\n".join([f"#{t['id']} - {t['title']} {'✓' if t['completed'] else '○'}" for t in result[:10]])
@@ -726,7 +850,7 @@ async def get_mock_ai_response(
                 task_id = int(word)
                 break
         if task_id:
-            result = complete_task(user_id, task_id)
+            result = await complete_task(user_id, task_id)
             tool_calls.append(ToolCall(tool="complete_task", parameters={"task_id": task_id}))
             if "error" not in result:
                 response = f"✓ Marked '{result['title']}' as {result['status']}!"
@@ -743,7 +867,7 @@ async def get_mock_ai_response(
                 task_id = int(word)
                 break
         if task_id:
-            result = delete_task(user_id, task_id)
+            result = await delete_task(user_id, task_id)
             tool_calls.append(ToolCall(tool="delete_task", parameters={"task_id": task_id}))
             if "error" not in result:
                 response = f"✓ Deleted '{result['title']}'!"
@@ -763,7 +887,6 @@ async def get_mock_ai_response(
 async def chat(
     user_id: str,
     request: ChatRequest,
-    db: Session = Depends(get_db)
 ):
     """
     Stateless chat endpoint with OpenAI Agents SDK.
@@ -777,7 +900,6 @@ async def chat(
     Args:
         user_id: User ID from URL path
         request: Chat request with message and optional conversation_id
-        db: Database session
 
     Returns:
         ChatResponse: AI response with conversation_id and tool calls
@@ -788,12 +910,16 @@ async def chat(
     Flow:
         1. (Auth check bypassed for testing)
         2. Get or create conversation
-        3. Load conversation history
-        4. Save user message
-        5. Get AI response (with MCP tools)
-        6. Save assistant response
-        7. Return response
+        3. Load conversation context (cache first), packed into the token budget
+        4. Replay a cached read-only answer if the user's tasks are unchanged
+        5. Otherwise get AI response (with MCP tools)
+        6. Save user message, assistant response and tool calls (one commit)
+        7. Return response (older turns are summarized in the background)
         8. Server forgets everything (stateless!)
+
+    Note:
+        Steps 2-4 and step 6 each borrow a DB connection briefly; none is
+        held during the model call in step 5.
     """
     # Step 1: Auth check temporarily bypassed
     # TODO: Re-enable this when Better Auth is configured:
@@ -801,40 +927,36 @@ async def chat(
     #     logger.warning(f"Authorization failed: token user={token.get('user_id')}, requested user={user_id}")
     #     raise HTTPException(status_code=403, detail="Unauthorized")
 
-    try:
-        # Step 2: Get or create conversation
-        conv_id = await get_or_create_conversation(
-            user_id=user_id,
-            conversation_id=request.conversation_id,
-            db=db
-        )
-
-        # Step 3: Load conversation history
-        history = await load_conversation_history(conv_id, limit=10, db=db)
+    received_at = datetime.utcnow()
 
-        # Step 4: Save user message
-        await save_message(
-            conversation_id=conv_id,
-            user_id=user_id,
-            role="user",
-            content=request.message,
-            db=db
+    try:
+        # Steps 2-4: Get or create conversation, load its context (cache first)
+        # and look for a cached read-only answer, then release the connection
+        conv_id, context, version, cached = await load_turn(
+            user_id, request.conversation_id, request.message
         )
+        history, overflow = build_history(context)
 
-        # Step 5: Build messages for AI agent
-        messages = history + [{"role": "user", "content": request.message}]
-
-        # Step 6: Get AI response (with MCP tools)
-        assistant_message, tool_calls = await get_ai_response(messages, user_id)
+        # Step 4: Reuse a cached read-only answer while the user's tasks are unchanged
+        if cached:
+            assistant_message = cached["response"]
+            tool_calls = [ToolCall(**call) for call in cached["tool_calls"]]
+        else:
+            # Step 5: Get AI response (with MCP tools)
+            messages = history + [{"role": "user", "content": request.message}]
+            assistant_message, tool_calls = await get_ai_response(messages, user_id)
+            await cache_response(user_id, request.message, version, assistant_message, tool_calls)
 
-        # Step 7: Save assistant response
-        await save_message(
+        # Step 6: Save the whole turn in one transaction
+        await save_turn(
             conversation_id=conv_id,
             user_id=user_id,
-            role="assistant",
-            content=assistant_message,
-            db=db
+            user_message=request.message,
+            assistant_message=assistant_message,
+            tool_calls=tool_calls,
+            received_at=received_at
         )
+        schedule_summary(user_id, conv_id, context, overflow)
 
         logger.info(f"Chat completed: user={user_id}, conv={conv_id}, tools={len(tool_calls)}")
 
@@ -858,12 +980,53 @@ async def chat(
         )
 
 
+# How often a stream that is waiting (on the model or a tool) checks whether
+# the client is still connected
+DISCONNECT_POLL_SECONDS = 1.0
+
+
+async def cancel_on_disconnect(
+    http_request: Request,
+    events: AsyncIterator[str]
+) -> AsyncIterator[str]:
+    """
+    Relay SSE events until the client disconnects, then cancel the producer.
+
+    Each event is produced in a task; while it is pending the client's
+    connection is polled, and on disconnect the task is cancelled. The
+    cancellation runs the producer's cleanup: the OpenAI stream is closed,
+    running tool calls are cancelled and the DB session is released.
+    """
+    producer = events.__aiter__()
+    pending = None
+    try:
+        while True:
+            pending = asyncio.ensure_future(producer.__anext__())
+            while not (await asyncio.wait({pending}, timeout=DISCONNECT_POLL_SECONDS))[0]:
+                if await http_request.is_disconnected():
+                    logger.info("Chat stream client disconnected, cancelling")
+                    return
+            try:
+                event = pending.result()
+            except StopAsyncIteration:
+                return
+            pending = None
+            yield event
+    finally:
+        # Also reached when the server stops iterating us (send failed)
+        if pending is not None and not pending.done():
+            pending.cancel()
+            with suppress(asyncio.CancelledError, StopAsyncIteration):
+                await pending
+        await producer.aclose()
+
+
 # SSE Streaming Chat Endpoint
 @router.post("/stream")
 async def chat_stream(
     user_id: str,
     request: ChatRequest,
-    db: Session = Depends(get_db)
+    http_request: Request,
 ):
     """
     Server-Sent Events (SSE) streaming chat endpoint.
@@ -873,11 +1036,20 @@ async def chat_stream(
     Args:
         user_id: User ID from URL path
         request: Chat request with message and optional conversation_id
-        db: Database session
+        http_request: Raw request (to detect client disconnects)
 
     Returns:
         StreamingResponse: SSE stream of AI response chunks
 
+    Raises:
+        HTTPException: 429 if too many streams are already waiting
+
+    Note:
+        The generator borrows a DB session only to load the turn and again
+        to save it, never while the model streams. Streams are admitted through stream_limiter (per-process and
+        per-user caps with a short queue) and cancelled, session and
+        upstream completion included, when the client disconnects.
+
     SSE Event Types:
         - content: Partial response text chunk
         - tool_call: Tool invocation notification
@@ -885,53 +1057,72 @@ async def chat_stream(
         - done: Streaming complete with full response
         - error: Error occurred during processing
     """
+    if not stream_limiter.has_capacity():
+        raise HTTPException(
+            status_code=429,
+            detail="Too many chats in progress. Please try again shortly.",
+            headers={"Retry-After": "5"}
+        )
+
     async def event_generator():
         try:
-            # Get or create conversation
-            conv_id = await get_or_create_conversation(
-                user_id=user_id,
-                conversation_id=request.conversation_id,
-                db=db
+            async with stream_limiter.slot(user_id), aclosing(stream_turn()) as events:
+                async for event in events:
+                    yield event
+        except StreamBusyError as e:
+            logger.warning(f"Chat stream rejected: user={user_id}, reason={e}")
+            yield f"data: {json.dumps({'type': 'error', 'message': 'Too many chats in progress. Please try again shortly.'})}\n\n"
+
+    async def stream_turn():
+        received_at = datetime.utcnow()
+        try:
+            # Get or create conversation, load its context (cache first) and
+            # look for a cached answer; the DB connection is released after
+            conv_id, context, version, cached = await load_turn(
+                user_id, request.conversation_id, request.message
             )
+            history, overflow = build_history(context)
 
             # Send conversation ID immediately
             yield f"data: {json.dumps({'type': 'conversation_id', 'conversation_id': conv_id})}\n\n"
 
-            # Load conversation history
-            history = await load_conversation_history(conv_id, limit=10, db=db)
-
-            # Save user message
-            await save_message(
+            # Replay a cached read-only answer while the user's tasks are unchanged
+            if cached:
+                full_response = cached["response"]
+                tool_calls = [ToolCall(**call) for call in cached["tool_calls"]]
+                yield f"data: {json.dumps({'type': 'content', 'content': full_response})}\n\n"
+                yield f"data: {json.dumps({'type': 'done', 'full_response': full_response})}\n\n"
+            else:
+                # Build messages for AI
+                messages = history + [{"role": "user", "content": request.message}]
+
+                # Stream AI response (no DB connection held meanwhile)
+                full_response = ""
+                tool_calls = []
+                async with aclosing(get_ai_response_stream(messages, user_id)) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+
+                        # Collect tool calls and the full response for persistence
+                        if '"type": "tool_call"' in chunk or '"type": "done"' in chunk:
+                            chunk_data = json.loads(chunk.replace("data: ", "").strip())
+                            if chunk_data["type"] == "tool_call":
+                                tool_calls.append(ToolCall(tool=chunk_data["tool"], parameters=chunk_data["parameters"]))
+                            else:
+                                full_response = chunk_data.get("full_response", "")
+
+                await cache_response(user_id, request.message, version, full_response, tool_calls)
+
+            # Save user message, assistant response and tool calls in one transaction
+            await save_turn(
                 conversation_id=conv_id,
                 user_id=user_id,
-                role="user",
-                content=request.message,
-                db=db
+                user_message=request.message,
+                assistant_message=full_response or None,
+                tool_calls=tool_calls,
+                received_at=received_at
             )
-
-            # Build messages for AI
-            messages = history + [{"role": "user", "content": request.message}]
-
-            # Stream AI response
-            full_response = ""
-            async for chunk in get_ai_response_stream(messages, user_id):
-                yield chunk
-
-                # Extract full response from done event
-                if '"type": "done"' in chunk:
-                    import json as json_module
-                    chunk_data = json_module.loads(chunk.replace("data: ", "").strip())
-                    full_response = chunk_data.get("full_response", "")
-
-            # Save assistant response
-            if full_response:
-                await save_message(
-                    conversation_id=conv_id,
-                    user_id=user_id,
-                    role="assistant",
-                    content=full_response,
-                    db=db
-                )
+            schedule_summary(user_id, conv_id, context, overflow)
 
             logger.info(f"Stream completed: user={user_id}, conv={conv_id}")
 
@@ -940,7 +1131,7 @@ async def chat_stream(
             yield f"data: {json.dumps({'type': 'error', 'message': 'Stream interrupted'})}\n\n"
 
     return StreamingResponse(
-        event_generator(),
+        cancel_on_disconnect(http_request, event_generator()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -957,6 +1148,8 @@ async def chat_health():
     return {
         "status": "healthy",
         "endpoint": "chat",
-        "mcp_tools": ["add_task", "list_tasks", "complete_task", "delete_task", "update_task"],
-        "streaming": True
+        "mcp_tools": list(TOOL_REGISTRY),
+        "tool_stats": tool_stats(),
+        "streaming": True,
+        "streams": stream_limiter.snapshot()
     }
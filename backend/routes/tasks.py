@@ -1,43 +1,88 @@
 """Task management API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
-from sqlmodel import Session, select
-from datetime import datetime
-from typing import Literal, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import AsyncIterator, Literal, Optional
+import asyncio
+import codecs
 import csv
+import hashlib
 import json
-import io
 
-from database import get_db
-from models import Task
+from database import get_db, async_session
 from schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
 from middleware.auth import verify_jwt
-from services.task_service import TaskService
+from services.task_service import TaskService, build_search_query
+from task_events import get_task_event_bus
 
 router = APIRouter(prefix="/api/{user_id}/tasks", tags=["tasks"])
 
+# Idle seconds between keepalive comments on the change feed (also how often
+# a silent feed notices a disconnected client)
+EVENTS_KEEPALIVE_SECONDS = 15.0
+
+
+def task_etag(version: int, *view) -> str:
+    """Weak ETag for a view of the user's tasks (e.g. one list page) at a task version.
+
+    Every task write bumps the version, so the tag changes whenever any of
+    the user's tasks do.
+    """
+    digest = hashlib.sha1(repr(view).encode()).hexdigest()[:16]
+    return f'W/"{version}-{digest}"'
+
+
+def not_modified(request: Request, response: Response, etag: Optional[str]) -> Optional[Response]:
+    """
+    Answer a conditional GET.
+
+    Returns a 304 response if If-None-Match carries etag (weak comparison),
+    else None after setting the ETag header on the full response.
+    """
+    if etag is None:
+        return None
+
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
 
 @router.get("", response_model=TaskListResponse)
 async def list_tasks(
     user_id: str,
+    request: Request,
+    response: Response,
     status: Literal["all", "pending", "completed"] = Query("all"),
-    sort: Literal["created", "title", "updated", "priority", "due_date"] = Query("created"),
+    sort: Literal["created", "title", "updated", "priority", "due_date", "relevance"] = Query("created"),
     search: Optional[str] = Query(None),
     page: int = Query(1, gt=0),
     limit: int = Query(20, gt=0, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     List all tasks for a user with filtering, sorting, search, and pagination.
 
     - **user_id**: User ID from URL path
     - **status**: Filter by completion status (all/pending/completed)
-    - **sort**: Sort order (created/title/updated/priority/due_date)
-    - **search**: Search in title and description
-    - **page**: Page number (starts from 1)
+    - **sort**: Sort order (created/title/updated/priority/due_date/relevance)
+    - **search**: Full-text prefix search in title and description
+    - **page**: Page number (starts from 1, ignored when cursor is set)
     - **limit**: Items per page (max 100)
+    - **cursor**: Keyset cursor from a previous response's next_cursor
+    - **include_total**: Count all matching tasks (set false for faster pages)
+
+    completed/pending are the user's overall counts from task_counters.
+    Responses carry a weak ETag; a matching If-None-Match gets a 304
+    without running the list query.
     """
     # Verify user_id matches token
     if token_data.get("user_id") != user_id:
@@ -46,26 +91,53 @@ async def list_tasks(
             detail="Access forbidden: user_id mismatch"
         )
 
+    counters = await TaskService.get_counters(db, user_id)
+    completed = counters.completed
+    pending = counters.total - counters.completed
+
+    # No ETag until the user has a counters row: its first version comes later
+    etag = None
+    if counters.version is not None:
+        etag = task_etag(counters.version, "list", status, sort, search, page, limit, cursor, include_total)
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    # Without a search term the counters already hold the total
+    counted_total = None
+    if include_total and not search:
+        counted_total = {"all": counters.total, "pending": pending, "completed": completed}[status]
+
     # Use service layer
-    tasks, total_count = TaskService.list_tasks(
-        db=db,
-        user_id=user_id,
-        status=status,
-        sort_by=sort,
-        search=search,
-        page=page,
-        limit=limit
-    )
+    try:
+        tasks, total_count = await TaskService.list_tasks(
+            db=db,
+            user_id=user_id,
+            status=status,
+            sort_by=sort,
+            search=search,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total and counted_total is None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
-    # Calculate statistics for current filter
-    completed = sum(1 for task in tasks if task.completed)
-    pending = len(tasks) - completed
+    # A full page means there may be more rows after the last one.
+    # Relevance-ranked results page by ?page= instead; without a usable
+    # search term "relevance" falls back to created order, which can seek.
+    ranked = sort == "relevance" and search is not None and build_search_query(search) is not None
+    next_cursor = None
+    if len(tasks) == limit and not ranked:
+        next_cursor = TaskService.encode_cursor(tasks[-1], sort)
 
     return TaskListResponse(
         tasks=tasks,
-        total=total_count,
+        total=counted_total if counted_total is not None else total_count,
         completed=completed,
-        pending=pending
+        pending=pending,
+        next_cursor=next_cursor,
     )
 
 
@@ -74,7 +146,7 @@ async def create_task(
     user_id: str,
     task_data: TaskCreate,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create a new task for the authenticated user.
@@ -92,37 +164,166 @@ async def create_task(
             detail="Access forbidden: user_id mismatch"
         )
 
-    # Create task
-    task = Task(
+    task = await TaskService.create_task(
+        db=db,
         user_id=user_id,
         title=task_data.title,
         description=task_data.description,
-        completed=False,
         priority=task_data.priority,
         due_date=task_data.due_date,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
     )
 
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
     return task
 
 
+@router.post("/bulk/delete-matching")
+async def bulk_delete_matching_tasks(
+    user_id: str,
+    match: Literal["all", "pending", "completed", "overdue"] = Query(...),
+    token_data: dict = Depends(verify_jwt),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Delete every task in a selection without listing IDs (e.g. all completed).
+
+    - **user_id**: User ID from URL path
+    - **match**: Selection to delete (all/pending/completed/overdue)
+    """
+    # Verify user_id matches token
+    if token_data.get("user_id") != user_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access forbidden: user_id mismatch"
+        )
+
+    deleted_count = await TaskService.bulk_delete_matching(db, user_id, match)
+
+    return {
+        "message": f"Successfully deleted {deleted_count} task(s)",
+        "deleted_count": deleted_count
+    }
+
+
+@router.post("/bulk/complete-matching")
+async def bulk_complete_matching_tasks(
+    user_id: str,
+    match: Literal["all", "pending", "completed", "overdue"] = Query(...),
+    completed: bool = True,
+    token_data: dict = Depends(verify_jwt),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Set completion on every task in a selection (e.g. complete all overdue).
+
+    - **user_id**: User ID from URL path
+    - **match**: Selection to update (all/pending/completed/overdue)
+    - **completed**: Completion status (true/false)
+    """
+    # Verify user_id matches token
+    if token_data.get("user_id") != user_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access forbidden: user_id mismatch"
+        )
+
+    updated_count = await TaskService.bulk_complete_matching(db, user_id, match, completed)
+
+    return {
+        "message": f"Successfully updated {updated_count} task(s)",
+        "updated_count": updated_count,
+        "completed": completed
+    }
+
+
+@router.get("/stats")
+async def get_task_stats(
+    user_id: str,
+    token_data: dict = Depends(verify_jwt),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get task statistics for a user.
+
+    Declared before /{task_id} so "stats" is not parsed as a task ID.
+
+    - **user_id**: User ID from URL path
+    - Returns totals, completion rate, counts by priority, overdue and due
+      within the next 7 days
+    """
+    # Verify user_id matches token
+    if token_data.get("user_id") != user_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access forbidden: user_id mismatch"
+        )
+
+    stats = await TaskService.get_stats(db, user_id)
+    return stats
+
+
+@router.get("/events")
+async def task_events(
+    user_id: str,
+    request: Request,
+    token_data: dict = Depends(verify_jwt),
+):
+    """
+    Stream the user's task changes as server-sent events.
+
+    - **user_id**: User ID from URL path
+
+    Each event is named by its type (created/updated/deleted/resync, see
+    task_events) with the event as JSON data. Clients apply the deltas to
+    the list they already hold; on "resync", or after reconnecting, they
+    re-fetch the list. Holds no database connection while open.
+    """
+    # Verify user_id matches token
+    if token_data.get("user_id") != user_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access forbidden: user_id mismatch"
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        async with get_task_event_bus().subscribe(user_id) as queue:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), EVENTS_KEEPALIVE_SECONDS)
+                except TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable buffering in nginx
+        }
+    )
+
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     user_id: str,
     task_id: int,
+    request: Request,
+    response: Response,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get a specific task by ID.
 
     - **user_id**: User ID from URL path
     - **task_id**: Task ID to retrieve
+
+    Supports If-None-Match like the task list.
     """
     # Verify user_id matches token
     if token_data.get("user_id") != user_id:
@@ -131,10 +332,14 @@ async def get_task(
             detail="Access forbidden: user_id mismatch"
         )
 
+    version = await TaskService.get_task_version(db, user_id)
+    etag = task_etag(version, "task", task_id) if version is not None else None
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     # Fetch task
-    task = db.exec(
-        select(Task).where(Task.id == task_id, Task.user_id == user_id)
-    ).first()
+    task = await TaskService.get_task(db, user_id, task_id)
 
     if not task:
         raise HTTPException(
@@ -151,7 +356,7 @@ async def update_task(
     task_id: int,
     task_data: TaskUpdate,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Update a task's title, description, priority, and/or due date.
@@ -170,10 +375,15 @@ async def update_task(
             detail="Access forbidden: user_id mismatch"
         )
 
-    # Fetch task
-    task = db.exec(
-        select(Task).where(Task.id == task_id, Task.user_id == user_id)
-    ).first()
+    task = await TaskService.update_task(
+        db=db,
+        user_id=user_id,
+        task_id=task_id,
+        title=task_data.title,
+        description=task_data.description,
+        priority=task_data.priority,
+        due_date=task_data.due_date,
+    )
 
     if not task:
         raise HTTPException(
@@ -181,22 +391,6 @@ async def update_task(
             detail=f"Task {task_id} not found or access forbidden"
         )
 
-    # Update fields if provided
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.priority is not None:
-        task.priority = task_data.priority
-    if task_data.due_date is not None:
-        task.due_date = task_data.due_date
-
-    task.updated_at = datetime.utcnow()
-
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
     return task
 
 
@@ -205,7 +399,7 @@ async def delete_task(
     user_id: str,
     task_id: int,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Delete a task permanently.
@@ -220,20 +414,14 @@ async def delete_task(
             detail="Access forbidden: user_id mismatch"
         )
 
-    # Fetch task
-    task = db.exec(
-        select(Task).where(Task.id == task_id, Task.user_id == user_id)
-    ).first()
+    deleted = await TaskService.delete_task(db, user_id, task_id)
 
-    if not task:
+    if not deleted:
         raise HTTPException(
             status_code=404,
             detail=f"Task {task_id} not found or access forbidden"
         )
 
-    db.delete(task)
-    db.commit()
-
     return {"message": "Task deleted successfully", "task_id": task_id}
 
 
@@ -242,7 +430,7 @@ async def toggle_task_completion(
     user_id: str,
     task_id: int,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Toggle a task's completion status.
@@ -257,10 +445,8 @@ async def toggle_task_completion(
             detail="Access forbidden: user_id mismatch"
         )
 
-    # Fetch task
-    task = db.exec(
-        select(Task).where(Task.id == task_id, Task.user_id == user_id)
-    ).first()
+    # Toggle completion
+    task = await TaskService.toggle_complete(db, user_id, task_id)
 
     if not task:
         raise HTTPException(
@@ -268,14 +454,6 @@ async def toggle_task_completion(
             detail=f"Task {task_id} not found or access forbidden"
         )
 
-    # Toggle completion
-    task.completed = not task.completed
-    task.updated_at = datetime.utcnow()
-
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
     return task
 
 
@@ -285,7 +463,7 @@ async def bulk_delete_tasks(
     user_id: str,
     task_ids: list[int],
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Bulk delete multiple tasks.
@@ -300,7 +478,7 @@ async def bulk_delete_tasks(
             detail="Access forbidden: user_id mismatch"
         )
 
-    deleted_count = TaskService.bulk_delete(db, user_id, task_ids)
+    deleted_count = await TaskService.bulk_delete(db, user_id, task_ids)
 
     return {
         "message": f"Successfully deleted {deleted_count} task(s)",
@@ -314,7 +492,7 @@ async def bulk_complete_tasks(
     task_ids: list[int],
     completed: bool = True,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Bulk update completion status of multiple tasks.
@@ -330,7 +508,7 @@ async def bulk_complete_tasks(
             detail="Access forbidden: user_id mismatch"
         )
 
-    updated_count = TaskService.bulk_complete(db, user_id, task_ids, completed)
+    updated_count = await TaskService.bulk_complete(db, user_id, task_ids, completed)
 
     return {
         "message": f"Successfully updated {updated_count} task(s)",
@@ -339,66 +517,31 @@ async def bulk_complete_tasks(
     }
 
 
-@router.get("/stats")
-async def get_task_stats(
-    user_id: str,
-    token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
-):
-    """
-    Get task statistics for a user.
-
-    - **user_id**: User ID from URL path
-    """
-    # Verify user_id matches token
-    if token_data.get("user_id") != user_id:
-        raise HTTPException(
-            status_code=403,
-            detail="Access forbidden: user_id mismatch"
-        )
+# Export/Import Operations
 
-    stats = TaskService.get_stats(db, user_id)
-    return stats
 
+async def _stream_export(render, user_id: str):
+    """Run an export renderer in its own session.
 
-# Export/Import Operations
+    The response body is produced after the request's dependencies have been
+    torn down, so the request-scoped session cannot be used here.
+    """
+    async with async_session() as db:
+        async for chunk in render(db, user_id):
+            yield chunk
 
 
 @router.get("/export/csv")
 async def export_tasks_csv(
     user_id: str,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
 ):
-    """Export all tasks as CSV file."""
+    """Export all tasks as a streamed CSV file."""
     if token_data.get("user_id") != user_id:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    tasks, _ = TaskService.list_tasks(db, user_id, status="all", limit=10000)
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow(["ID", "Title", "Description", "Priority", "Due Date", "Tags", "Completed", "Created At"])
-
-    # Write tasks
-    for task in tasks:
-        writer.writerow([
-            task.id,
-            task.title,
-            task.description or "",
-            task.priority,
-            task.due_date.isoformat() if task.due_date else "",
-            ",".join(task.tags) if task.tags else "",
-            task.completed,
-            task.created_at.isoformat()
-        ])
-
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        _stream_export(TaskService.export_csv, user_id),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=tasks.csv"}
     )
@@ -408,69 +551,177 @@ async def export_tasks_csv(
 async def export_tasks_json(
     user_id: str,
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
 ):
-    """Export all tasks as JSON file."""
+    """Export all tasks as a streamed JSON array."""
     if token_data.get("user_id") != user_id:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    tasks, _ = TaskService.list_tasks(db, user_id, status="all", limit=10000)
-
-    # Convert to dict
-    tasks_data = [
-        {
-            "id": task.id,
-            "title": task.title,
-            "description": task.description,
-            "priority": task.priority,
-            "due_date": task.due_date.isoformat() if task.due_date else None,
-            "tags": task.tags,
-            "completed": task.completed,
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat()
-        }
-        for task in tasks
-    ]
-
-    json_str = json.dumps(tasks_data, indent=2)
-
     return StreamingResponse(
-        iter([json_str]),
+        _stream_export(TaskService.export_json, user_id),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=tasks.json"}
     )
 
 
-@router.post("/import/json")
-async def import_tasks_json(
+@router.get("/export/ndjson")
+async def export_tasks_ndjson(
     user_id: str,
-    tasks_data: list[dict],
     token_data: dict = Depends(verify_jwt),
-    db: Session = Depends(get_db),
 ):
-    """Import tasks from JSON data."""
+    """Export all tasks as newline-delimited JSON (one task per line)."""
     if token_data.get("user_id") != user_id:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    imported_count = 0
-    errors = []
+    return StreamingResponse(
+        _stream_export(TaskService.export_ndjson, user_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=tasks.ndjson"}
+    )
+
+
+async def _iter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a streamed request body into text lines."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in body:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
 
-    for task_data in tasks_data:
+
+async def _iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple]:
+    """Yield (row number, record dict) from CSV lines with a header row.
+
+    Headers are matched case-insensitively with spaces as underscores, so the
+    CSV export ("Due Date", ...) can be imported back. Quoted fields may span
+    lines: a record is complete once its quote count is even.
+    """
+    header = None
+    buffered: list[str] = []
+    quotes = 0
+    row_number = 0
+
+    async for line in lines:
+        buffered.append(line + "\n")
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+
+        values = next(csv.reader(buffered), [])
+        buffered, quotes = [], 0
+        if not any(value.strip() for value in values):
+            continue
+
+        if header is None:
+            header = [value.strip().lower().replace(" ", "_") for value in values]
+            continue
+
+        row_number += 1
+        # Short rows leave trailing fields out; extra values are dropped
+        yield row_number, dict(zip(header, values, strict=False))
+
+    if buffered:
+        yield row_number + 1, ValueError("Unterminated quoted field")
+
+
+async def _iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple]:
+    """Yield (row number, record dict) from newline-delimited JSON."""
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row_number += 1
         try:
-            TaskService.create_task(
-                db=db,
-                user_id=user_id,
-                title=task_data.get("title", "Untitled"),
-                description=task_data.get("description"),
-                priority=task_data.get("priority", "medium"),
-                due_date=datetime.fromisoformat(task_data["due_date"]) if task_data.get("due_date") else None,
-            )
-            imported_count += 1
-        except Exception as e:
-            errors.append(f"Error importing task '{task_data.get('title', 'Unknown')}': {str(e)}")
+            yield row_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, ValueError(f"Invalid JSON: {e.msg}")
+
+
+async def _import_records(db: AsyncSession, user_id: str, records: AsyncIterator[tuple]) -> dict:
+    """Validate and insert records as they stream in, all or nothing.
+
+    Valid rows are written in batches inside one transaction, so memory
+    stays flat however large the upload; the first invalid row rolls the
+    whole import back and is reported as a 400.
+    """
+    async def validated() -> AsyncIterator[TaskCreate]:
+        async for row_number, record in records:
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                task = TaskService.validate_import_record(record)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Row {row_number}: {e}. Nothing was imported."
+                ) from e
+            yield task
+
+    imported_count = await TaskService.bulk_create(db, user_id, validated())
 
     return {
         "message": f"Successfully imported {imported_count} task(s)",
         "imported": imported_count,
-        "errors": errors
     }
+
+
+async def _enumerate_records(records: list) -> AsyncIterator[tuple]:
+    """Adapt an in-memory list of records to the (row number, record) stream."""
+    for row_number, record in enumerate(records, start=1):
+        yield row_number, record
+
+
+@router.post("/import")
+async def import_tasks(
+    user_id: str,
+    request: Request,
+    format: Literal["csv", "ndjson", "json"] = Query("ndjson"),
+    token_data: dict = Depends(verify_jwt),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Import tasks from an uploaded file, streamed from the request body.
+
+    - **user_id**: User ID from URL path
+    - **format**: Body format - csv (with header row), ndjson (one task per
+      line) or json (an array of tasks)
+
+    Rows are validated and inserted in batches as the body streams in, in
+    one transaction: an invalid row fails the request with 400 and nothing
+    is imported.
+    """
+    if token_data.get("user_id") != user_id:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+
+    if format == "csv":
+        records = _iter_csv_records(_iter_lines(request.stream()))
+    elif format == "ndjson":
+        records = _iter_ndjson_records(_iter_lines(request.stream()))
+    else:
+        try:
+            tasks_data = json.loads(await request.body())
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e.msg}") from e
+        if not isinstance(tasks_data, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of tasks")
+        records = _enumerate_records(tasks_data)
+
+    return await _import_records(db, user_id, records)
+
+
+@router.post("/import/json")
+async def import_tasks_json(
+    user_id: str,
+    tasks_data: list[dict],
+    token_data: dict = Depends(verify_jwt),
+    db: AsyncSession = Depends(get_db),
+):
+    """Import tasks from JSON data."""
+    if token_data.get("user_id") != user_id:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+
+    return await _import_records(db, user_id, _enumerate_records(tasks_data))
@@ -69,6 +69,7 @@ class TaskListResponse(BaseModel):
     """Schema for task list response."""
 
     tasks: list[TaskResponse]
-    total: int
+    total: Optional[int]  # None when include_total=false
     completed: int
     pending: int
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
@@ -1,16 +1,21 @@
 """Conversation service - Business logic for chat/conversation operations."""
 
-from sqlmodel import Session, select
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from models import Conversation, Message
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import json
+import context_cache
+from context_builder import UNSUMMARIZED_LOAD_LIMIT
 
 
 class ConversationService:
     """Service class for conversation-related business logic."""
 
     @staticmethod
-    def create_conversation(db: Session, user_id: str) -> Conversation:
+    async def create_conversation(db: AsyncSession, user_id: str) -> Conversation:
         """Create a new conversation."""
         conversation = Conversation(
             user_id=user_id,
@@ -18,39 +23,39 @@ class ConversationService:
             updated_at=datetime.utcnow(),
         )
         db.add(conversation)
-        db.commit()
-        db.refresh(conversation)
+        await db.commit()
+        await db.refresh(conversation)
         return conversation
 
     @staticmethod
-    def get_conversation(db: Session, user_id: str, conversation_id: int) -> Optional[Conversation]:
+    async def get_conversation(db: AsyncSession, user_id: str, conversation_id: int) -> Optional[Conversation]:
         """Get a conversation by ID."""
         statement = select(Conversation).where(
             Conversation.id == conversation_id,
             Conversation.user_id == user_id
         )
-        return db.exec(statement).first()
+        return (await db.exec(statement)).first()
 
     @staticmethod
-    def get_or_create_conversation(db: Session, user_id: str, conversation_id: Optional[int] = None) -> Conversation:
+    async def get_or_create_conversation(db: AsyncSession, user_id: str, conversation_id: Optional[int] = None) -> Conversation:
         """Get existing conversation or create new one."""
         if conversation_id:
-            conversation = ConversationService.get_conversation(db, user_id, conversation_id)
+            conversation = await ConversationService.get_conversation(db, user_id, conversation_id)
             if conversation:
                 return conversation
 
         # Create new conversation
-        return ConversationService.create_conversation(db, user_id)
+        return await ConversationService.create_conversation(db, user_id)
 
     @staticmethod
-    def add_message(
-        db: Session,
+    async def add_message(
+        db: AsyncSession,
         conversation_id: int,
         user_id: str,
         role: str,
         content: str,
     ) -> Message:
-        """Add a message to a conversation."""
+        """Add a message to a conversation and bump its updated_at in one commit."""
         message = Message(
             conversation_id=conversation_id,
             user_id=user_id,
@@ -59,22 +64,119 @@ class ConversationService:
             created_at=datetime.utcnow(),
         )
         db.add(message)
-        db.commit()
-        db.refresh(message)
-
-        # Update conversation's updated_at
-        statement = select(Conversation).where(Conversation.id == conversation_id)
-        conversation = db.exec(statement).first()
-        if conversation:
-            conversation.updated_at = datetime.utcnow()
-            db.add(conversation)
-            db.commit()
+        await ConversationService._touch(db, conversation_id, message.created_at)
+        await db.commit()
 
+        await context_cache.append_to_window(
+            user_id,
+            conversation_id,
+            [{"id": message.id, "role": role, "content": content}],
+            UNSUMMARIZED_LOAD_LIMIT,
+        )
         return message
 
     @staticmethod
-    def get_messages(
-        db: Session,
+    async def save_turn(
+        db: AsyncSession,
+        conversation_id: int,
+        user_id: str,
+        user_message: str,
+        assistant_message: Optional[str] = None,
+        tool_calls: Optional[List[Dict[str, Any]]] = None,
+        received_at: Optional[datetime] = None,
+    ) -> List[Message]:
+        """Persist one chat turn in a single transaction.
+
+        Writes the user message, the assistant reply (if any) with the tool
+        calls it made, and the conversation's updated_at, then commits once.
+        received_at stamps the user message with when the turn started so it
+        sorts before the reply.
+
+        The context cache is updated write-through after the commit: an
+        already cached context is extended with the new messages. The context
+        the turn was answered from is never written back, since a summary
+        may have been applied to the cache while the turn ran.
+        """
+        now = datetime.utcnow()
+        messages = [
+            Message(
+                conversation_id=conversation_id,
+                user_id=user_id,
+                role="user",
+                content=user_message,
+                created_at=received_at or now,
+            )
+        ]
+        if assistant_message:
+            messages.append(
+                Message(
+                    conversation_id=conversation_id,
+                    user_id=user_id,
+                    role="assistant",
+                    content=assistant_message,
+                    tool_calls=json.dumps(tool_calls) if tool_calls else None,
+                    created_at=now,
+                )
+            )
+
+        db.add_all(messages)
+        await ConversationService._touch(db, conversation_id, now)
+        await db.commit()
+
+        saved = [{"id": m.id, "role": m.role, "content": m.content} for m in messages]
+        await context_cache.append_to_window(user_id, conversation_id, saved, UNSUMMARIZED_LOAD_LIMIT)
+        return messages
+
+    @staticmethod
+    async def update_summary(
+        db: AsyncSession,
+        user_id: str,
+        conversation_id: int,
+        summary: str,
+        summarized_through: int,
+        previous_through: Optional[int],
+    ) -> bool:
+        """Store a new rolling summary covering messages up to summarized_through.
+
+        Only applies if the summary still starts from previous_through, so
+        two overlapping summarizations can't overwrite each other. Returns
+        whether the summary was stored.
+
+        When it doesn't apply, the caller summarized from an outdated context,
+        so the cached context is dropped and the next turn reloads it.
+        """
+        statement = (
+            update(Conversation)
+            .where(
+                Conversation.id == conversation_id,
+                Conversation.user_id == user_id,
+                Conversation.summarized_through.is_not_distinct_from(previous_through),
+            )
+            .values(summary=summary, summarized_through=summarized_through)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.exec(statement)
+        await db.commit()
+        if not result.rowcount:
+            await context_cache.invalidate(user_id, conversation_id)
+            return False
+
+        await context_cache.apply_summary(user_id, conversation_id, summary, summarized_through)
+        return True
+
+    @staticmethod
+    async def _touch(db: AsyncSession, conversation_id: int, when: datetime) -> None:
+        """Set a conversation's updated_at without loading it."""
+        await db.exec(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(updated_at=when)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def get_messages(
+        db: AsyncSession,
         conversation_id: int,
         limit: int = 10
     ) -> List[Message]:
@@ -85,12 +187,12 @@ class ConversationService:
             .order_by(Message.created_at.desc())
             .limit(limit)
         )
-        messages = db.exec(statement).all()
+        messages = (await db.exec(statement)).all()
         # Return in chronological order (oldest first)
         return list(reversed(messages))
 
     @staticmethod
-    def list_conversations(db: Session, user_id: str, limit: int = 20) -> List[Conversation]:
+    async def list_conversations(db: AsyncSession, user_id: str, limit: int = 20) -> List[Conversation]:
         """List user's conversations."""
         statement = (
             select(Conversation)
@@ -98,22 +200,24 @@ class ConversationService:
             .order_by(Conversation.updated_at.desc())
             .limit(limit)
         )
-        return list(db.exec(statement).all())
+        return list((await db.exec(statement)).all())
 
     @staticmethod
-    def delete_conversation(db: Session, user_id: str, conversation_id: int) -> bool:
+    async def delete_conversation(db: AsyncSession, user_id: str, conversation_id: int) -> bool:
         """Delete a conversation and all its messages."""
-        conversation = ConversationService.get_conversation(db, user_id, conversation_id)
+        conversation = await ConversationService.get_conversation(db, user_id, conversation_id)
         if not conversation:
             return False
 
         # Delete all messages first
         statement = select(Message).where(Message.conversation_id == conversation_id)
-        messages = db.exec(statement).all()
+        messages = (await db.exec(statement)).all()
         for message in messages:
-            db.delete(message)
+            await db.delete(message)
 
         # Delete conversation
-        db.delete(conversation)
-        db.commit()
+        await db.delete(conversation)
+        await db.commit()
+
+        await context_cache.invalidate(user_id, conversation_id)
         return True
@@ -1,20 +1,93 @@
 """Task service - Business logic for task operations."""
 
-from sqlmodel import Session, select, or_, func
-from models import Task
-from datetime import datetime
-from typing import List, Optional
+from pydantic import ValidationError
+from sqlalchemy import ARRAY, Integer, and_, any_, delete, exists, insert, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import select, or_, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from models import Task, TaskCounter, TASK_SEARCH_VECTOR
+from schemas.task import TaskCreate, TaskResponse
+from task_events import RESYNC, publish_task_event
+from datetime import datetime, timedelta
+from collections import Counter
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
+import base64
 import csv
 import json
+import re
+import textwrap
 from io import StringIO
 
 
+# Sort key -> (column, descending). Every sort is paired with Task.id in the
+# same direction so keyset cursors have a unique, stable position.
+SORT_COLUMNS = {
+    "created": (Task.created_at, True),
+    "updated": (Task.updated_at, True),
+    "title": (Task.title, False),
+    "priority": (Task.priority, True),
+    "due_date": (Task.due_date, False),
+}
+
+
+# Named selections accepted by the filter-based bulk actions
+BULK_MATCHES = ("all", "pending", "completed", "overdue")
+
+# Priorities tracked by task_counters (column priority_<name>)
+COUNTED_PRIORITIES = ("high", "medium", "low")
+
+# Export streaming: rows per server-side cursor fetch, bytes per CSV chunk
+EXPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Bulk import: rows per multi-row INSERT, the row count from which COPY is
+# used instead, and rows per COPY
+IMPORT_BATCH_SIZE = 500
+IMPORT_COPY_THRESHOLD = 5000
+IMPORT_COPY_BATCH_SIZE = 5000
+IMPORT_COLUMNS = [
+    "user_id", "title", "description", "completed", "priority",
+    "due_date", "tags", "created_at", "updated_at",
+]
+
+COUNTER_COLUMNS = [
+    "user_id", "total", "completed",
+    "priority_high", "priority_medium", "priority_low", "updated_at",
+]
+
+# First key of the per-user advisory lock serializing counter row creation
+COUNTER_LOCK_NAMESPACE = 7007
+
+
+def build_search_query(search: str) -> Optional[str]:
+    """Turn free text into a prefix-matching tsquery ("buy mil" -> "buy:* & mil:*").
+
+    Only word characters are kept, so user input can never inject tsquery
+    operators. Returns None when nothing searchable remains.
+    """
+    terms = re.findall(r"\w+", search.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _tasks_event(event_type: str, tasks: List[Task]) -> Dict[str, Any]:
+    """Change-feed event carrying full tasks (see task_events)."""
+    return {
+        "type": event_type,
+        "tasks": [TaskResponse.model_validate(task).model_dump(mode="json") for task in tasks],
+    }
+
+
 class TaskService:
-    """Service class for task-related business logic."""
+    """Service class for task-related business logic.
+
+    Every write publishes a change-feed event after it commits.
+    """
 
     @staticmethod
-    def create_task(
-        db: Session,
+    async def create_task(
+        db: AsyncSession,
         user_id: str,
         title: str,
         description: Optional[str] = None,
@@ -34,27 +107,224 @@ class TaskService:
             updated_at=datetime.utcnow(),
         )
         db.add(task)
-        db.commit()
-        db.refresh(task)
+        await TaskService._update_counters(db, user_id, total=1, priorities={priority: 1})
+        await db.commit()
+        await db.refresh(task)
+        await publish_task_event(user_id, _tasks_event("created", [task]))
         return task
 
     @staticmethod
-    def get_task(db: Session, user_id: str, task_id: int) -> Optional[Task]:
+    async def create_tasks(db: AsyncSession, user_id: str, items: List[TaskCreate]) -> List[Task]:
+        """Create several tasks in one transaction and return them with their IDs."""
+        now = datetime.utcnow()
+        tasks = [
+            Task(
+                user_id=user_id,
+                title=item.title,
+                description=item.description,
+                priority=item.priority,
+                due_date=item.due_date,
+                created_at=now,
+                updated_at=now,
+            )
+            for item in items
+        ]
+        if not tasks:
+            return tasks
+
+        db.add_all(tasks)
+        await TaskService._update_counters(
+            db,
+            user_id,
+            total=len(tasks),
+            priorities=dict(Counter(task.priority for task in tasks)),
+        )
+        await db.commit()
+        await publish_task_event(user_id, _tasks_event("created", tasks))
+        return tasks
+
+    @staticmethod
+    def validate_import_record(record: Any) -> TaskCreate:
+        """Validate one imported record against the TaskCreate schema.
+
+        Missing titles default to "Untitled" and blank optional fields are
+        treated as absent, matching what the import endpoints always accepted.
+
+        Raises:
+            ValueError: With a readable message if the record is invalid.
+        """
+        if not isinstance(record, dict):
+            raise ValueError("Expected an object with task fields")
+
+        data = {
+            key: value for key, value in record.items()
+            if key in TaskCreate.model_fields and value not in ("", None)
+        }
+        data.setdefault("title", "Untitled")
+        try:
+            return TaskCreate(**data)
+        except ValidationError as e:
+            raise ValueError("; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )) from None
+
+    @staticmethod
+    async def _insert_rows(db: AsyncSession, rows: List[Dict[str, Any]], use_copy: bool) -> None:
+        """Write one batch of task rows with a multi-row INSERT, or with COPY."""
+        if not use_copy:
+            await db.exec(insert(Task.__table__).values(rows))
+            return
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Task.__tablename__,
+            records=[tuple(row[column] for column in IMPORT_COLUMNS) for row in rows],
+            columns=IMPORT_COLUMNS,
+        )
+
+    @staticmethod
+    async def bulk_create(db: AsyncSession, user_id: str, items: AsyncIterable[TaskCreate]) -> int:
+        """Insert a stream of validated tasks in a single transaction.
+
+        Items are written as they arrive, IMPORT_BATCH_SIZE rows per multi-row
+        INSERT; once IMPORT_COPY_THRESHOLD rows are in, the rest go through
+        the Postgres COPY protocol, IMPORT_COPY_BATCH_SIZE rows at a time. Only
+        the current batch is held in memory, however long the stream.
+
+        If the stream raises (e.g. on an invalid record) the transaction is
+        rolled back, so nothing is imported, and the error propagates.
+        Returns the number of tasks created.
+        """
+        now = datetime.utcnow()
+        created = 0
+        priorities: Counter = Counter()
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            async for item in items:
+                batch.append({
+                    "user_id": user_id,
+                    "title": item.title,
+                    "description": item.description,
+                    "completed": False,
+                    "priority": item.priority,
+                    "due_date": item.due_date,
+                    "tags": None,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+                priorities[item.priority] += 1
+
+                # COPY only ever follows INSERT batches, which have already
+                # opened the transaction (the asyncpg adapter begins lazily);
+                # a COPY run first would autocommit apart from the rest
+                use_copy = created >= IMPORT_COPY_THRESHOLD
+                if len(batch) >= (IMPORT_COPY_BATCH_SIZE if use_copy else IMPORT_BATCH_SIZE):
+                    await TaskService._insert_rows(db, batch, use_copy)
+                    created += len(batch)
+                    batch = []
+
+            if batch:
+                await TaskService._insert_rows(db, batch, created >= IMPORT_COPY_THRESHOLD)
+                created += len(batch)
+        except BaseException:
+            await db.rollback()
+            raise
+
+        if not created:
+            return 0
+
+        await TaskService._update_counters(db, user_id, total=created, priorities=dict(priorities))
+        await db.commit()
+        # Imported rows come back without IDs; clients re-fetch instead
+        await publish_task_event(user_id, RESYNC)
+        return created
+
+    @staticmethod
+    async def get_task(db: AsyncSession, user_id: str, task_id: int) -> Optional[Task]:
         """Get a single task by ID."""
         statement = select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        return db.exec(statement).first()
+        return (await db.exec(statement)).first()
 
     @staticmethod
-    def list_tasks(
-        db: Session,
+    def encode_cursor(task: Task, sort_by: str = "created") -> str:
+        """Encode the keyset position of a task for the given sort key."""
+        column, _ = SORT_COLUMNS.get(sort_by, SORT_COLUMNS["created"])
+        value: Any = getattr(task, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps([value, task.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort_by: str = "created") -> tuple:
+        """Decode a cursor into (sort value, task id).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            value, task_id = json.loads(base64.urlsafe_b64decode(padded))
+            if sort_by in ("created", "updated", "due_date") and value is not None:
+                value = datetime.fromisoformat(value)
+            return value, int(task_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    @staticmethod
+    def _keyset_filter(sort_by: str, value: Any, task_id: int):
+        """Build the WHERE clause selecting rows after a cursor position."""
+        column, descending = SORT_COLUMNS[sort_by]
+
+        if sort_by == "due_date":
+            # Ascending with NULLs last (the Postgres default for ASC)
+            if value is None:
+                return and_(column.is_(None), Task.id > task_id)
+            return or_(
+                column > value,
+                and_(column == value, Task.id > task_id),
+                column.is_(None),
+            )
+
+        if descending:
+            return tuple_(column, Task.id) < tuple_(value, task_id)
+        return tuple_(column, Task.id) > tuple_(value, task_id)
+
+    @staticmethod
+    async def list_tasks(
+        db: AsyncSession,
         user_id: str,
         status: str = "all",
         sort_by: str = "created",
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> tuple:
-        """List tasks with filtering, sorting, search, and pagination."""
+        """List tasks with filtering, sorting, search, and pagination.
+
+        When ``cursor`` is given, rows are fetched by keyset (seek) instead of
+        OFFSET, so the cost of a page does not depend on its depth. The total
+        count is only computed when ``include_total`` is true; otherwise it is
+        returned as None.
+
+        ``search`` uses the search_vector GIN index with prefix matching on
+        every word; ``sort_by="relevance"`` orders matches by ts_rank.
+        """
+        # Search in title and description via the full-text index
+        rank = None
+        ts_query = build_search_query(search) if search else None
+        if ts_query is not None:
+            query = func.to_tsquery("simple", ts_query)
+            rank = func.ts_rank(TASK_SEARCH_VECTOR, query)
+
+        if sort_by not in SORT_COLUMNS and not (sort_by == "relevance" and rank is not None):
+            sort_by = "created"
+
         # Base query
         statement = select(Task).where(Task.user_id == user_id)
 
@@ -64,44 +334,43 @@ class TaskService:
         elif status == "completed":
             statement = statement.where(Task.completed)
 
-        # Search in title and description
-        if search:
-            search_term = f"%{search}%"
-            statement = statement.where(
-                or_(
-                    Task.title.ilike(search_term),
-                    Task.description.ilike(search_term) if Task.description.isnot(None) else False
-                )
-            )
-
-        # Get total count
-        count_statement = select(func.count()).select_from(statement.subquery())
-        total_count = db.exec(count_statement).one()
-
-        # Sorting
-        if sort_by == "created":
-            statement = statement.order_by(Task.created_at.desc())
-        elif sort_by == "title":
-            statement = statement.order_by(Task.title.asc())
-        elif sort_by == "updated":
-            statement = statement.order_by(Task.updated_at.desc())
-        elif sort_by == "priority":
-            statement = statement.order_by(Task.priority.desc())
-        elif sort_by == "due_date":
-            statement = statement.order_by(Task.due_date.asc())
+        if ts_query is not None:
+            statement = statement.where(TASK_SEARCH_VECTOR.op("@@")(query))
+
+        # Get total count (optional - it scans every matching row)
+        total_count = None
+        if include_total:
+            count_statement = select(func.count()).select_from(statement.subquery())
+            total_count = (await db.exec(count_statement)).one()
+
+        # Relevance ranking pages by offset; the rank is not a stored column
+        if sort_by == "relevance":
+            statement = statement.order_by(rank.desc(), Task.id.desc())
+            statement = statement.offset((page - 1) * limit).limit(limit)
+            tasks = (await db.exec(statement)).all()
+            return list(tasks), total_count
+
+        # Sorting, with id as tiebreaker
+        column, descending = SORT_COLUMNS[sort_by]
+        if descending:
+            statement = statement.order_by(column.desc(), Task.id.desc())
         else:
-            statement = statement.order_by(Task.created_at.desc())
+            statement = statement.order_by(column.asc(), Task.id.asc())
 
         # Pagination
-        offset = (page - 1) * limit
-        statement = statement.offset(offset).limit(limit)
+        if cursor:
+            value, last_id = TaskService.decode_cursor(cursor, sort_by)
+            statement = statement.where(TaskService._keyset_filter(sort_by, value, last_id))
+        else:
+            statement = statement.offset((page - 1) * limit)
+        statement = statement.limit(limit)
 
-        tasks = db.exec(statement).all()
+        tasks = (await db.exec(statement)).all()
         return list(tasks), total_count
 
     @staticmethod
-    def update_task(
-        db: Session,
+    async def update_task(
+        db: AsyncSession,
         user_id: str,
         task_id: int,
         title: Optional[str] = None,
@@ -111,7 +380,7 @@ class TaskService:
         tags: Optional[List[str]] = None,
     ) -> Optional[Task]:
         """Update a task with optional tags."""
-        task = TaskService.get_task(db, user_id, task_id)
+        task = await TaskService.get_task(db, user_id, task_id)
         if not task:
             return None
 
@@ -119,7 +388,9 @@ class TaskService:
             task.title = title
         if description is not None:
             task.description = description
-        if priority is not None:
+        priorities = None
+        if priority is not None and priority != task.priority:
+            priorities = {task.priority: -1, priority: 1}
             task.priority = priority
         if due_date is not None:
             task.due_date = due_date
@@ -128,130 +399,424 @@ class TaskService:
 
         task.updated_at = datetime.utcnow()
         db.add(task)
-        db.commit()
-        db.refresh(task)
+        await TaskService._update_counters(db, user_id, priorities=priorities)
+        await db.commit()
+        await db.refresh(task)
+        await publish_task_event(user_id, _tasks_event("updated", [task]))
         return task
 
     @staticmethod
-    def delete_task(db: Session, user_id: str, task_id: int) -> bool:
-        """Delete a task."""
-        task = TaskService.get_task(db, user_id, task_id)
-        if not task:
-            return False
+    async def delete_task(db: AsyncSession, user_id: str, task_id: int) -> bool:
+        """Delete a task.
 
-        db.delete(task)
-        db.commit()
-        return True
+        Counter deltas come from the DELETE ... RETURNING row, so of two
+        concurrent deletes of the same task only the one that removed it
+        counts it (and returns True).
+        """
+        return bool(await TaskService._delete_where(db, user_id, [Task.id == task_id]))
 
     @staticmethod
-    def toggle_complete(db: Session, user_id: str, task_id: int) -> Optional[Task]:
-        """Toggle task completion status."""
-        task = TaskService.get_task(db, user_id, task_id)
+    async def toggle_complete(db: AsyncSession, user_id: str, task_id: int) -> Optional[Task]:
+        """Toggle task completion status.
+
+        The flip happens in one UPDATE ... RETURNING, which locks the row, so
+        concurrent toggles each see the other's result and the completed
+        counter follows the state actually written.
+        """
+        statement = (
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .values(completed=~Task.completed, updated_at=datetime.utcnow())
+            .returning(Task)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        task = (await db.exec(statement)).scalars().first()
         if not task:
             return None
 
-        task.completed = not task.completed
-        task.updated_at = datetime.utcnow()
-        db.add(task)
-        db.commit()
-        db.refresh(task)
+        await TaskService._update_counters(db, user_id, completed=1 if task.completed else -1)
+        await db.commit()
+        # No refresh: RETURNING loaded the row as written, and a re-read
+        # could already show a later writer's toggle
+        await publish_task_event(user_id, _tasks_event("updated", [task]))
         return task
 
     @staticmethod
-    def bulk_delete(db: Session, user_id: str, task_ids: List[int]) -> int:
-        """Bulk delete tasks."""
-        statement = select(Task).where(
-            Task.user_id == user_id,
-            Task.id.in_(task_ids)
+    def _match_filter(match: str) -> list:
+        """WHERE criteria for a named bulk selection (see BULK_MATCHES)."""
+        if match == "pending":
+            return [~Task.completed]
+        if match == "completed":
+            return [Task.completed]
+        if match == "overdue":
+            return [~Task.completed, Task.due_date < datetime.utcnow()]
+        if match == "all":
+            return []
+        raise ValueError(f"match must be one of: {', '.join(BULK_MATCHES)}")
+
+    @staticmethod
+    async def _delete_where(db: AsyncSession, user_id: str, criteria: list) -> list:
+        """Delete matching tasks with one DELETE ... RETURNING statement.
+
+        Returns the deleted rows (id, title, completed, priority).
+        """
+        statement = (
+            delete(Task)
+            .where(Task.user_id == user_id, *criteria)
+            .returning(Task.id, Task.title, Task.completed, Task.priority)
+            .execution_options(synchronize_session=False)
         )
-        tasks = db.exec(statement).all()
+        rows = (await db.exec(statement)).all()
+        if not rows:
+            return rows
+
+        await TaskService._update_counters(
+            db,
+            user_id,
+            total=-len(rows),
+            completed=-sum(1 for row in rows if row.completed),
+            priorities={p: -n for p, n in Counter(row.priority for row in rows).items()},
+        )
+        await db.commit()
+        await publish_task_event(user_id, {"type": "deleted", "task_ids": [row.id for row in rows]})
+        return rows
 
-        for task in tasks:
-            db.delete(task)
+    @staticmethod
+    async def _complete_where(db: AsyncSession, user_id: str, criteria: list, completed: bool) -> list:
+        """Set completion on matching tasks with one UPDATE ... RETURNING statement.
+
+        Rows already in the requested state are left untouched (and not
+        returned). Returns the changed rows (id, title).
+        """
+        now = datetime.utcnow()
+        statement = (
+            update(Task)
+            .where(Task.user_id == user_id, Task.completed != completed, *criteria)
+            .values(completed=completed, updated_at=now)
+            .returning(Task.id, Task.title)
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await db.exec(statement)).all()
+
+        await TaskService._update_counters(db, user_id, completed=len(rows) if completed else -len(rows))
+        await db.commit()
+        if rows:
+            await publish_task_event(user_id, {
+                "type": "updated",
+                "task_ids": [row.id for row in rows],
+                "changes": {"completed": completed, "updated_at": now.isoformat()},
+            })
+        return rows
 
-        db.commit()
-        return len(tasks)
+    @staticmethod
+    def _ids_filter(task_ids: List[int]) -> list:
+        """WHERE criteria matching a list of IDs as a single array parameter."""
+        return [Task.id == any_(literal(list(task_ids), ARRAY(Integer)))]
 
     @staticmethod
-    def bulk_complete(db: Session, user_id: str, task_ids: List[int], completed: bool = True) -> int:
-        """Bulk update completion status."""
-        statement = select(Task).where(
-            Task.user_id == user_id,
-            Task.id.in_(task_ids)
+    async def bulk_delete(db: AsyncSession, user_id: str, task_ids: List[int]) -> int:
+        """Bulk delete tasks by ID."""
+        return len(await TaskService._delete_where(db, user_id, TaskService._ids_filter(task_ids)))
+
+    @staticmethod
+    async def bulk_complete(db: AsyncSession, user_id: str, task_ids: List[int], completed: bool = True) -> int:
+        """Bulk update completion status by ID. Returns the number of tasks changed."""
+        return len(await TaskService._complete_where(
+            db, user_id, TaskService._ids_filter(task_ids), completed
+        ))
+
+    @staticmethod
+    async def bulk_delete_matching(db: AsyncSession, user_id: str, match: str) -> int:
+        """Delete every task in a named selection, e.g. "completed"."""
+        return len(await TaskService._delete_where(db, user_id, TaskService._match_filter(match)))
+
+    @staticmethod
+    async def bulk_complete_matching(
+        db: AsyncSession, user_id: str, match: str, completed: bool = True
+    ) -> int:
+        """Set completion on every task in a named selection, e.g. "overdue"."""
+        return len(await TaskService._complete_where(
+            db, user_id, TaskService._match_filter(match), completed
+        ))
+
+    @staticmethod
+    async def delete_tasks(db: AsyncSession, user_id: str, task_ids: List[int]) -> Dict[int, str]:
+        """Delete tasks by ID in one statement. Returns {task_id: title} of deleted tasks."""
+        rows = await TaskService._delete_where(db, user_id, TaskService._ids_filter(task_ids))
+        return {row.id: row.title for row in rows}
+
+    @staticmethod
+    async def complete_tasks(
+        db: AsyncSession, user_id: str, task_ids: List[int], completed: bool = True
+    ) -> Dict[int, str]:
+        """Set completion on tasks by ID in one transaction.
+
+        Tasks already in the requested state are included in the result.
+        Returns {task_id: title} of the user's tasks among task_ids.
+        """
+        criteria = TaskService._ids_filter(task_ids)
+        statement = select(Task.id, Task.title).where(Task.user_id == user_id, *criteria)
+        found = {row.id: row.title for row in (await db.exec(statement)).all()}
+
+        await TaskService._complete_where(db, user_id, criteria, completed)
+        return found
+
+    @staticmethod
+    async def _update_counters(
+        db: AsyncSession,
+        user_id: str,
+        total: int = 0,
+        completed: int = 0,
+        priorities: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Apply deltas to the user's task_counters row and bump its version.
+
+        Every task write calls this, even with no deltas, so the version
+        changes whenever the user's tasks do (see get_task_version). Runs in
+        the caller's transaction, so it must be called before the caller
+        commits.
+
+        A user without a counters row yet (a new user, or tasks created
+        before the table existed) gets one rebuilt from the tasks table, which
+        already includes the pending write because the session autoflushes.
+        Concurrent first writes would each rebuild from their own snapshot
+        and lose each other's counts, so the rebuild runs under a per-user
+        advisory lock: whoever waited for it finds the row created and applies
+        its delta instead.
+        """
+        values: Dict[str, Any] = {"version": TaskCounter.version + 1, "updated_at": datetime.utcnow()}
+        if total:
+            values["total"] = TaskCounter.total + total
+        if completed:
+            values["completed"] = TaskCounter.completed + completed
+        for priority, delta in (priorities or {}).items():
+            if delta and priority in COUNTED_PRIORITIES:
+                column = getattr(TaskCounter, f"priority_{priority}")
+                values[column.key] = column + delta
+
+        statement = (
+            update(TaskCounter)
+            .where(TaskCounter.user_id == user_id)
+            .values(**values)
+            .returning(TaskCounter.user_id)
         )
-        tasks = db.exec(statement).all()
+        if (await db.exec(statement)).first() is not None:
+            return
 
-        for task in tasks:
-            task.completed = completed
-            task.updated_at = datetime.utcnow()
-            db.add(task)
+        # Held until the caller commits, so the row this creates is visible
+        # (READ COMMITTED) to the next writer once it gets the lock
+        await db.exec(select(func.pg_advisory_xact_lock(COUNTER_LOCK_NAMESPACE, func.hashtext(user_id))))
+        if (await db.exec(statement)).first() is None:
+            await TaskService._rebuild_counters(db, user_id)
 
-        db.commit()
-        return len(tasks)
+    @staticmethod
+    async def _rebuild_counters(db: AsyncSession, user_id: Optional[str] = None) -> List[str]:
+        """Recompute counters from the tasks table (one user, or everyone).
+
+        Only rows whose stored values differ from the recount are written (and
+        their version bumped, since the counts they serve change). Returns the
+        user IDs whose counters were inserted or corrected.
+        """
+        aggregate = select(
+            Task.user_id,
+            func.count(),
+            func.count().filter(Task.completed),
+            func.count().filter(Task.priority == "high"),
+            func.count().filter(Task.priority == "medium"),
+            func.count().filter(Task.priority == "low"),
+            func.now(),
+            literal(1),
+        ).group_by(Task.user_id)
+        if user_id is not None:
+            aggregate = aggregate.where(Task.user_id == user_id)
+
+        # New rows start at version 1: a user without a row has no version
+        # (see get_counters), so no tag built before the insert can match
+        stmt = pg_insert(TaskCounter).from_select(COUNTER_COLUMNS + ["version"], aggregate)
+        counted = [column for column in COUNTER_COLUMNS if column not in ("user_id", "updated_at")]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TaskCounter.user_id],
+            set_={
+                **{column: stmt.excluded[column] for column in counted + ["updated_at"]},
+                "version": TaskCounter.version + 1,
+            },
+            where=or_(*(
+                getattr(TaskCounter, column) != stmt.excluded[column] for column in counted
+            )),
+        ).returning(TaskCounter.user_id)
+        fixed = list((await db.exec(stmt)).scalars().all())
+
+        # Users whose tasks were all deleted have no aggregate row: zero them
+        emptied = (
+            update(TaskCounter)
+            .where(
+                ~exists().where(Task.user_id == TaskCounter.user_id),
+                TaskCounter.total != 0,
+            )
+            .values(
+                **dict.fromkeys(counted, 0),
+                version=TaskCounter.version + 1,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(TaskCounter.user_id)
+        )
+        if user_id is not None:
+            emptied = emptied.where(TaskCounter.user_id == user_id)
+        fixed.extend((await db.exec(emptied)).scalars().all())
+
+        return fixed
 
     @staticmethod
-    def get_stats(db: Session, user_id: str) -> dict:
-        """Get task statistics."""
-        statement = select(Task).where(Task.user_id == user_id)
-        tasks = db.exec(statement).all()
+    async def reconcile_counters(db: AsyncSession, user_id: Optional[str] = None) -> List[str]:
+        """Rebuild drifted task counters and commit. Returns corrected user IDs.
+
+        Corrected users get a resync event: their version changed, so
+        anything cached against the old one must be dropped.
+        """
+        fixed = await TaskService._rebuild_counters(db, user_id)
+        await db.commit()
+        for fixed_user_id in fixed:
+            await publish_task_event(fixed_user_id, RESYNC)
+        return fixed
+
+    @staticmethod
+    async def get_counters(db: AsyncSession, user_id: str) -> TaskCounter:
+        """Get the user's task counters (a primary-key lookup).
+
+        A user with no tasks and no counters row gets an unsaved, all-zero
+        TaskCounter whose version is None.
+        """
+        counters = await db.get(TaskCounter, user_id)
+        if counters is None:
+            # First read for this user: build the row from the tasks table
+            await TaskService.reconcile_counters(db, user_id)
+            counters = await db.get(TaskCounter, user_id) or TaskCounter(user_id=user_id, version=None)
+        return counters
+
+    @staticmethod
+    async def get_task_version(db: AsyncSession, user_id: str) -> Optional[int]:
+        """Get the user's task version, or None if they have no counters row yet.
+
+        Any cached view of the user's tasks is current while this is unchanged.
+        """
+        statement = select(TaskCounter.version).where(TaskCounter.user_id == user_id)
+        return (await db.exec(statement)).first()
+
+    @staticmethod
+    async def get_stats(db: AsyncSession, user_id: str) -> dict:
+        """Get task statistics from the materialized counters.
+
+        Overdue and due-this-week depend on the clock rather than on writes, so
+        they are counted live from the (user_id, completed, due_date) index.
+        """
+        now = datetime.utcnow()
+        week_end = now + timedelta(days=7)
+
+        counters = await TaskService.get_counters(db, user_id)
+
+        due_statement = select(
+            func.count().filter(Task.due_date < now),
+            func.count().filter(Task.due_date >= now),
+        ).where(
+            Task.user_id == user_id,
+            ~Task.completed,
+            Task.due_date < week_end,
+        )
+        overdue, due_this_week = (await db.exec(due_statement)).one()
 
-        total = len(tasks)
-        completed = sum(1 for task in tasks if task.completed)
-        pending = total - completed
+        total = counters.total
+        completed = counters.completed
+        pending_count = total - completed
         completion_rate = int((completed / total * 100)) if total > 0 else 0
 
         return {
             "total": total,
             "completed": completed,
-            "pending": pending,
+            "pending": pending_count,
             "completionRate": completion_rate,
+            "byPriority": {
+                "high": counters.priority_high,
+                "medium": counters.priority_medium,
+                "low": counters.priority_low,
+            },
+            "overdue": overdue,  # Pending tasks past their due date
+            "dueThisWeek": due_this_week,  # Pending tasks due in the next 7 days
         }
 
     @staticmethod
-    def export_to_csv(db: Session, user_id: str) -> str:
-        """Export tasks to CSV format."""
-        tasks, _ = TaskService.list_tasks(db, user_id, status="all", limit=1000)
+    async def stream_tasks(db: AsyncSession, user_id: str) -> AsyncIterator[Task]:
+        """Yield all of a user's tasks through a server-side cursor.
+
+        Rows are fetched EXPORT_BATCH_SIZE at a time, so memory stays flat no
+        matter how many tasks the user has.
+        """
+        statement = (
+            select(Task)
+            .where(Task.user_id == user_id)
+            .order_by(Task.created_at.desc(), Task.id.desc())
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        result = await db.stream_scalars(statement)
+        async for task in result:
+            yield task
 
+    @staticmethod
+    async def export_csv(db: AsyncSession, user_id: str) -> AsyncIterator[str]:
+        """Stream tasks as CSV, header first."""
         output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=[
-            'id', 'title', 'description', 'priority', 'due_date',
-            'tags', 'completed', 'created_at', 'updated_at'
-        ])
-        writer.writeheader()
-
-        for task in tasks:
-            writer.writerow({
-                'id': task.id,
-                'title': task.title,
-                'description': task.description or '',
-                'priority': task.priority,
-                'due_date': task.due_date.isoformat() if task.due_date else '',
-                'tags': ','.join(task.tags) if task.tags else '',
-                'completed': task.completed,
-                'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat(),
-            })
+        writer = csv.writer(output)
+        writer.writerow(["ID", "Title", "Description", "Priority", "Due Date", "Tags", "Completed", "Created At"])
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+
+        async for task in TaskService.stream_tasks(db, user_id):
+            writer.writerow([
+                task.id,
+                task.title,
+                task.description or "",
+                task.priority,
+                task.due_date.isoformat() if task.due_date else "",
+                ",".join(task.tags) if task.tags else "",
+                task.completed,
+                task.created_at.isoformat()
+            ])
+            if output.tell() >= EXPORT_CHUNK_SIZE:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+        if output.tell():
+            yield output.getvalue()
 
-        return output.getvalue()
-
-    @staticmethod
-    def export_to_json(db: Session, user_id: str) -> str:
-        """Export tasks to JSON format."""
-        tasks, _ = TaskService.list_tasks(db, user_id, status="all", limit=1000)
-
-        tasks_data = [
-            {
-                'id': task.id,
-                'title': task.title,
-                'description': task.description,
-                'priority': task.priority,
-                'due_date': task.due_date.isoformat() if task.due_date else None,
-                'tags': task.tags or [],
-                'completed': task.completed,
-                'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat(),
-            }
-            for task in tasks
-        ]
+    @staticmethod
+    def _export_dict(task: Task) -> dict:
+        """Serialize a task for JSON/NDJSON export."""
+        return {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority,
+            "due_date": task.due_date.isoformat() if task.due_date else None,
+            "tags": task.tags,
+            "completed": task.completed,
+            "created_at": task.created_at.isoformat(),
+            "updated_at": task.updated_at.isoformat()
+        }
 
-        return json.dumps(tasks_data, indent=2)
+    @staticmethod
+    async def export_json(db: AsyncSession, user_id: str) -> AsyncIterator[str]:
+        """Stream tasks as a JSON array, one element at a time."""
+        separator = "\n"
+        yield "["
+        async for task in TaskService.stream_tasks(db, user_id):
+            item = json.dumps(TaskService._export_dict(task), indent=2)
+            yield separator + textwrap.indent(item, "  ")
+            separator = ",\n"
+        yield "\n]" if separator != "\n" else "]"
+
+    @staticmethod
+    async def export_ndjson(db: AsyncSession, user_id: str) -> AsyncIterator[str]:
+        """Stream tasks as newline-delimited JSON (one object per line)."""
+        async for task in TaskService.stream_tasks(db, user_id):
+            yield json.dumps(TaskService._export_dict(task)) + "\n"
@@ -0,0 +1,96 @@
+"""Admission control for streaming chat responses.
+
+Each open SSE stream holds a model connection and, at times, a pooled DB
+connection. StreamLimiter caps how many run at once per process and per
+user. Streams over a cap wait in a bounded queue for up to
+CHAT_STREAM_QUEUE_TIMEOUT seconds, so an abandoned stream that is still
+being cancelled doesn't bounce the user's next message. A full queue is
+rejected straight away.
+"""
+
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from config import settings
+import asyncio
+
+
+class StreamBusyError(Exception):
+    """No stream slot became available (queue full or wait timed out)."""
+
+
+class StreamLimiter:
+    """Per-process and per-user caps on concurrent streams, with a wait queue."""
+
+    def __init__(self, max_streams: int, max_per_user: int, max_queued: int, queue_timeout: float):
+        self.max_streams = max_streams
+        self.max_per_user = max_per_user
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._process = asyncio.Semaphore(max_streams)
+        self._users: Dict[str, asyncio.Semaphore] = {}
+        self._holders: Counter = Counter()  # user -> streams running or queued
+        self.active = 0
+        self.queued = 0
+
+    def has_capacity(self) -> bool:
+        """Whether a new stream may join the queue (cheap check before accepting it)."""
+        return self.queued < self.max_queued
+
+    @asynccontextmanager
+    async def slot(self, user_id: str) -> AsyncIterator[None]:
+        """
+        Hold a stream slot for the body of the block.
+
+        Raises:
+            StreamBusyError: If the queue is full or no slot frees up in time
+        """
+        if not self.has_capacity():
+            raise StreamBusyError("Too many chat streams waiting")
+
+        user_slots = self._users.setdefault(user_id, asyncio.Semaphore(self.max_per_user))
+        self._holders[user_id] += 1
+        self.queued += 1
+        acquired = []
+        try:
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    for semaphore in (user_slots, self._process):
+                        await semaphore.acquire()
+                        acquired.append(semaphore)
+            except TimeoutError:
+                raise StreamBusyError("Timed out waiting for a chat stream slot") from None
+            finally:
+                self.queued -= 1
+
+            self.active += 1
+            try:
+                yield
+            finally:
+                self.active -= 1
+        finally:
+            for semaphore in acquired:
+                semaphore.release()
+            self._holders[user_id] -= 1
+            if not self._holders[user_id]:
+                del self._holders[user_id]
+                del self._users[user_id]
+
+    def snapshot(self) -> dict:
+        """Current occupancy, for health checks."""
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "max_streams": self.max_streams,
+            "max_per_user": self.max_per_user,
+            "max_queued": self.max_queued,
+        }
+
+
+# Shared by every chat stream in this worker process
+stream_limiter = StreamLimiter(
+    max_streams=settings.CHAT_MAX_STREAMS,
+    max_per_user=settings.CHAT_MAX_STREAMS_PER_USER,
+    max_queued=settings.CHAT_STREAM_QUEUE_SIZE,
+    queue_timeout=settings.CHAT_STREAM_QUEUE_TIMEOUT,
+)
@@ -0,0 +1,238 @@
+"""Task change feed.
+
+TaskService publishes an event after every committed task write (REST
+routes, chat tools and imports alike), and GET /api/{user_id}/tasks/events
+streams a user's events to the browser, so open tabs apply deltas instead
+of re-fetching the task list.
+
+Events are dicts with a "type":
+- "created" / "updated": "tasks" holds the full tasks (TaskResponse fields)
+- "updated" from a bulk change: "task_ids" plus the "changes" applied to them
+- "deleted": "task_ids"
+- "resync": too much changed to describe (or the subscriber fell behind);
+  the client should re-fetch its list
+
+By default events fan out in-process, which only reaches subscribers on the
+worker that made the write. With TASK_EVENTS_BACKEND=postgres they go
+through Postgres LISTEN/NOTIFY, so every worker sees every write.
+"""
+
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+from config import settings
+from database import asyncpg_connect_args
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+
+RESYNC: Event = {"type": "resync"}
+
+# Called with (user_id, event) for every event this process receives, or
+# (None, RESYNC) when events for any user may have been missed
+Listener = Callable[[Optional[str], Event], None]
+
+# Postgres channel, and the payload cap under NOTIFY's 8000-byte limit
+NOTIFY_CHANNEL = "task_events"
+MAX_NOTIFY_BYTES = 7900
+
+# Backoff between attempts to re-establish a lost LISTEN connection (seconds)
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+class TaskEventBus:
+    """In-process fan-out of task events to each user's subscribers."""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._listeners: List[Listener] = []
+
+    def add_listener(self, listener: Listener) -> None:
+        """Have listener called for every event, whoever it belongs to.
+
+        Used by in-process caches keyed on task state (e.g. the chat
+        response cache's task versions) to drop entries as writes happen.
+        Listeners run synchronously on delivery and must not block.
+        """
+        self._listeners.append(listener)
+
+    def _notify_listeners(self, user_id: Optional[str], event: Event) -> None:
+        for listener in self._listeners:
+            try:
+                listener(user_id, event)
+            except Exception as e:
+                logger.warning(f"Task event listener failed: {e}")
+
+    async def listen(self) -> None:
+        """Make sure this process receives every user's events (always, in-process)."""
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Receive the user's events on a queue for the body of the block."""
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers[user_id].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[user_id].discard(queue)
+            if not self._subscribers[user_id]:
+                del self._subscribers[user_id]
+
+    async def publish(self, user_id: str, event: Event) -> None:
+        """Send an event to the user's subscribers."""
+        self.deliver(user_id, event)
+
+    def deliver(self, user_id: str, event: Event) -> None:
+        """Queue an event for this process's subscribers.
+
+        A subscriber whose queue is full has fallen too far behind for
+        deltas to be useful: its backlog is replaced by a single resync.
+        """
+        self._notify_listeners(user_id, event)
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    async def close(self) -> None:
+        """Release backend connections (none in-process)."""
+
+    def snapshot(self) -> dict:
+        """Subscriber counts, for health checks."""
+        return {
+            "users": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+        }
+
+
+class PostgresTaskEventBus(TaskEventBus):
+    """Fan-out across worker processes through Postgres LISTEN/NOTIFY.
+
+    Each worker keeps one dedicated asyncpg connection that listens on
+    NOTIFY_CHANNEL and also sends this worker's events. An event is
+    delivered to local subscribers when its notification comes back, so
+    the writing worker's own subscribers are served the same way as
+    everyone else's.
+
+    If the connection drops (idle timeout, failover) it is re-established
+    in the background with exponential backoff, and every subscriber is
+    sent a resync since events may have been missed meanwhile.
+    """
+
+    def __init__(self, queue_size: int):
+        super().__init__(queue_size)
+        self._connection = None
+        self._connected_before = False
+        self._closing = False
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        self._send_lock = asyncio.Lock()  # one query at a time per asyncpg connection
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._connection is None or self._connection.is_closed():
+                import asyncpg
+
+                connection = await asyncpg.connect(**asyncpg_connect_args())
+                await connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                connection.add_termination_listener(self._on_terminate)
+                self._connection = connection
+
+                if self._connected_before:
+                    logger.info("Task event LISTEN connection re-established")
+                    self._notify_listeners(None, RESYNC)
+                    for user_id in list(self._subscribers):
+                        self.deliver(user_id, RESYNC)
+                self._connected_before = True
+        return self._connection
+
+    def _on_terminate(self, connection) -> None:
+        if self._closing or connection is not self._connection:
+            return
+        logger.warning("Task event LISTEN connection lost, reconnecting")
+        self._notify_listeners(None, RESYNC)
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = RECONNECT_MIN_DELAY
+        while not self._closing:
+            try:
+                await self._connect()
+                return
+            except Exception as e:
+                logger.warning(f"Task event reconnect failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        message = json.loads(payload)
+        self.deliver(message["user_id"], message["event"])
+
+    async def listen(self) -> None:
+        await self._connect()
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str) -> AsyncIterator[asyncio.Queue]:
+        await self._connect()
+        async with super().subscribe(user_id) as queue:
+            yield queue
+
+    async def publish(self, user_id: str, event: Event) -> None:
+        payload = json.dumps({"user_id": user_id, "event": event})
+        if len(payload.encode()) > MAX_NOTIFY_BYTES:
+            payload = json.dumps({"user_id": user_id, "event": RESYNC})
+
+        connection = await self._connect()
+        async with self._send_lock:
+            await connection.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, payload)
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+
+_bus: Optional[TaskEventBus] = None
+
+
+def get_task_event_bus() -> TaskEventBus:
+    """Get the process-wide event bus, creating it on first use."""
+    global _bus
+
+    if _bus is None:
+        if settings.TASK_EVENTS_BACKEND == "postgres":
+            _bus = PostgresTaskEventBus(settings.TASK_EVENTS_QUEUE_SIZE)
+        else:
+            _bus = TaskEventBus(settings.TASK_EVENTS_QUEUE_SIZE)
+
+    return _bus
+
+
+async def close_task_event_bus():
+    """Close the shared bus's connections (on shutdown)."""
+    global _bus
+
+    if _bus is not None:
+        await _bus.close()
+    _bus = None
+
+
+async def publish_task_event(user_id: str, event: Event) -> None:
+    """Publish a committed change. Failures are logged, never raised: the write already happened."""
+    try:
+        await get_task_event_bus().publish(user_id, event)
+    except Exception as e:
+        logger.warning(f"Task event publish failed: {e}")
@@ -0,0 +1,52 @@
+"""Shared test setup.
+
+Backend modules import each other as top-level modules (``from config import
+settings``), so the backend directory goes on sys.path. Tests that need
+Postgres run against TEST_DATABASE_URL (a scratch database: they create
+tables and write to it) and are skipped when it is unset.
+"""
+
+from typing import Any, Awaitable, Callable
+import asyncio
+import os
+import sys
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if os.getenv("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+os.environ.setdefault("ENVIRONMENT", "test")  # No SQL echo
+
+
+@pytest.fixture
+def run_db():
+    """Run an async test body against TEST_DATABASE_URL, with tables created.
+
+    The engine is disposed afterwards, since its pooled connections belong
+    to the event loop asyncio.run creates for each call.
+    """
+    if not os.getenv("TEST_DATABASE_URL"):
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    from database import create_db_and_tables, engine
+
+    def run(body: Callable[[], Awaitable[Any]]) -> Any:
+        async def main():
+            try:
+                await create_db_and_tables()
+                return await body()
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+@pytest.fixture
+def user_id() -> str:
+    """A user no other test (or earlier run) has written tasks for."""
+    return f"test-{uuid.uuid4().hex}"
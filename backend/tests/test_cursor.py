@@ -0,0 +1,117 @@
+"""Keyset cursor encoding (TaskService.encode_cursor / decode_cursor)."""
+
+from datetime import datetime
+from models import Task
+from services.task_service import SORT_COLUMNS, TaskService
+import pytest
+
+
+def make_task(**fields) -> Task:
+    defaults = {
+        "id": 42,
+        "user_id": "user-1",
+        "title": "Buy milk",
+        "priority": "high",
+        "due_date": datetime(2026, 11, 1, 9, 30),
+        "created_at": datetime(2026, 10, 1, 8, 0, 0, 123456),
+        "updated_at": datetime(2026, 10, 2, 17, 45, 5),
+    }
+    return Task(**{**defaults, **fields})
+
+
+@pytest.mark.parametrize("sort_by", list(SORT_COLUMNS))
+def test_round_trip_every_sort_key(sort_by):
+    task = make_task()
+    column, _ = SORT_COLUMNS[sort_by]
+
+    value, task_id = TaskService.decode_cursor(TaskService.encode_cursor(task, sort_by), sort_by)
+
+    assert value == getattr(task, column.key)
+    assert task_id == task.id
+
+
+def test_round_trip_null_due_date():
+    task = make_task(due_date=None)
+
+    cursor = TaskService.encode_cursor(task, "due_date")
+
+    assert TaskService.decode_cursor(cursor, "due_date") == (None, 42)
+
+
+@pytest.mark.parametrize("title", ["", "Café ☕ — über", 'quotes " and \\ slashes', "x" * 200])
+def test_round_trip_awkward_titles(title):
+    task = make_task(title=title)
+
+    cursor = TaskService.encode_cursor(task, "title")
+
+    assert TaskService.decode_cursor(cursor, "title") == (title, 42)
+
+
+def test_cursor_is_url_safe():
+    cursor = TaskService.encode_cursor(make_task(title="???>>>~~~"), "title")
+
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+def test_unknown_sort_key_falls_back_to_created():
+    task = make_task()
+
+    cursor = TaskService.encode_cursor(task, "relevance")
+
+    assert cursor == TaskService.encode_cursor(task, "created")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "bnVsbA", "WzFd", "WyJ4IiwieSJd"])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        TaskService.decode_cursor(cursor, "created")
+
+
+def test_cursor_for_one_sort_rejected_as_another():
+    cursor = TaskService.encode_cursor(make_task(), "title")
+
+    with pytest.raises(ValueError):
+        TaskService.decode_cursor(cursor, "created")
+
+
+@pytest.mark.parametrize("status", ["all", "pending"])
+@pytest.mark.parametrize("sort_by", list(SORT_COLUMNS))
+def test_cursor_pages_match_offset_order(run_db, user_id, sort_by, status):
+    """Walking every page by cursor returns each task once, in the same order."""
+    from database import async_session
+
+    async def body():
+        async with async_session() as db:
+            for i in range(23):
+                # Few distinct values, so most pages break inside a run of ties
+                db.add(make_task(
+                    id=None,
+                    user_id=user_id,
+                    title=f"task {i % 4}",
+                    priority=("high", "medium", "low")[i % 3],
+                    completed=i % 5 == 0,
+                    due_date=None if i % 4 == 0 else datetime(2026, 11, 1 + i % 3),
+                    created_at=datetime(2026, 10, 1 + i % 2),
+                    updated_at=datetime(2026, 10, 1 + i % 6),
+                ))
+            await db.commit()
+
+            expected, _ = await TaskService.list_tasks(db, user_id, status=status, sort_by=sort_by, limit=100)
+            walked, cursor = [], None
+            while True:
+                page, _ = await TaskService.list_tasks(
+                    db, user_id, status=status, sort_by=sort_by, limit=4,
+                    cursor=cursor, include_total=False,
+                )
+                walked.extend(page)
+                if len(page) < 4:
+                    break
+                cursor = TaskService.encode_cursor(page[-1], sort_by)
+
+            return [task.id for task in expected], [task.id for task in walked]
+
+    expected, walked = run_db(body)
+
+    assert len(expected) == (23 if status == "all" else 18)
+    assert walked == expected
@@ -0,0 +1,51 @@
+"""Fast-path grammar (intent_router.match_intent): what it answers, and what it leaves to the model."""
+
+from intent_router import match_intent
+import pytest
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("complete task 3", ("complete_tasks", {"task_ids": [3], "completed": True})),
+    ("Complete tasks 3 and 4, please", ("complete_tasks", {"task_ids": [3, 4], "completed": True})),
+    ("please finish #7", ("complete_tasks", {"task_ids": [7], "completed": True})),
+    ("check off tasks 1, 2 and 3!", ("complete_tasks", {"task_ids": [1, 2, 3], "completed": True})),
+    ("mark task 5 as done", ("complete_tasks", {"task_ids": [5], "completed": True})),
+    ("mark 5 as not done", ("complete_tasks", {"task_ids": [5], "completed": False})),
+    ("reopen task 9", ("complete_tasks", {"task_ids": [9], "completed": False})),
+    ("delete tasks 4 and 5", ("delete_tasks", {"task_ids": [4, 5]})),
+    ("remove task 4 & 4", ("delete_tasks", {"task_ids": [4]})),
+    ("show my tasks", ("list_tasks", {"status": "all"})),
+    ("Can you list my pending tasks?", ("list_tasks", {"status": "pending"})),
+    ("what are my completed tasks", ("list_tasks", {"status": "completed"})),
+    ("show me all of my todos", ("list_tasks", {"status": "all"})),
+    ("add task buy milk", ("add_task", {"title": "buy milk"})),
+    ("Create a new task: call the plumber", ("add_task", {"title": "call the plumber"})),
+    ("add todo sand the table", ("add_task", {"title": "sand the table"})),
+])
+def test_accepts(message, expected):
+    assert match_intent(message) == expected
+
+
+@pytest.mark.parametrize("message", [
+    # Not a command the grammar knows, or extra words around one
+    "hello",
+    "how many tasks do I have?",
+    "complete the task about milk",
+    "delete task 3 and then show my tasks",
+    "complete task 3 if it is overdue",
+    "show my tasks sorted by priority",
+    # Additions carrying dates, times or priorities (the model makes them fields)
+    "add task call mom tomorrow",
+    "add task pay rent by friday",
+    "add task dentist at 3pm",
+    "add task renew passport 12/05",
+    "add task water plants in 3 days",
+    "add task file taxes high priority",
+    "add task fix the leak asap",
+    # Additions listing several tasks (the model may split them with add_tasks)
+    "add task buy milk, eggs and bread",
+    "add task call bob and alice",
+    "add task pack; ship",
+])
+def test_leaves_to_model(message):
+    assert match_intent(message) is None
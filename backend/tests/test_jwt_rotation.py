@@ -0,0 +1,80 @@
+"""verify_token with secret rotation and the verified-token cache."""
+
+from fastapi import HTTPException
+from jose import jwt
+from config import settings
+from middleware import auth
+from middleware.auth import token_cache, verify_token
+import time
+import pytest
+
+CURRENT = "current-secret-0123456789abcdef0123"
+PREVIOUS = "previous-secret-0123456789abcdef012"
+
+
+@pytest.fixture(autouse=True)
+def rotating(monkeypatch):
+    """Mid-rotation: tokens signed with either secret are accepted."""
+    monkeypatch.setattr(settings, "BETTER_AUTH_SECRET", CURRENT)
+    monkeypatch.setattr(settings, "BETTER_AUTH_SECRET_PREVIOUS", PREVIOUS)
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def make_token(secret: str, expires_in: float = 600, **claims) -> str:
+    payload = {"user_id": "u1", "exp": int(time.time() + expires_in), **claims}
+    return jwt.encode(payload, secret, algorithm=settings.JWT_ALGORITHM)
+
+
+@pytest.mark.parametrize("secret", [CURRENT, PREVIOUS])
+def test_accepts_current_and_previous_secret(secret):
+    assert verify_token(make_token(secret))["user_id"] == "u1"
+
+
+def test_rejects_unknown_secret():
+    with pytest.raises(HTTPException) as error:
+        verify_token(make_token("some-other-secret-0123456789abcdef"))
+
+    assert error.value.status_code == 401
+    assert error.value.detail == "Invalid token"
+
+
+def test_rejects_expired_token():
+    with pytest.raises(HTTPException) as error:
+        verify_token(make_token(CURRENT, expires_in=-10))
+
+    assert error.value.status_code == 401
+    assert error.value.detail == "Token expired"
+
+
+def test_cached_token_is_not_decoded_again(monkeypatch):
+    token = make_token(CURRENT)
+    verify_token(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("decoded a cached token")
+
+    monkeypatch.setattr(auth.jwt, "decode", fail)
+    assert verify_token(token)["user_id"] == "u1"
+    assert token_cache.snapshot()["hits"] == 1
+
+
+def test_removing_previous_secret_drops_its_cached_tokens(monkeypatch):
+    old = make_token(PREVIOUS)
+    new = make_token(CURRENT)
+    verify_token(old)
+    verify_token(new)
+
+    monkeypatch.setattr(settings, "BETTER_AUTH_SECRET_PREVIOUS", "")
+
+    with pytest.raises(HTTPException):
+        verify_token(old)
+    assert verify_token(new)["user_id"] == "u1"
+
+
+def test_caller_cannot_mutate_cached_claims():
+    token = make_token(CURRENT)
+    verify_token(token)["user_id"] = "someone-else"
+
+    assert verify_token(token)["user_id"] == "u1"
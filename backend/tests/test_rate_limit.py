@@ -0,0 +1,144 @@
+"""Rate limiting: route costs, bucket refills, bucket keys and the 429 response."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from config import settings
+from middleware.auth import token_cache
+from middleware.rate_limit import (
+    DEFAULT_READ_COST,
+    DEFAULT_WRITE_COST,
+    MemoryBucketStore,
+    RateLimitMiddleware,
+    client_key,
+    rate_limit_enabled,
+    route_cost,
+    set_rate_limit_store,
+)
+import asyncio
+import time
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def take(store, key="k", cost=1, capacity=10, rate=2.0) -> float:
+    return asyncio.run(store.take(key, cost, capacity, rate))
+
+
+@pytest.mark.parametrize("method, path, cost", [
+    ("POST", "/api/u1/chat", 10),
+    ("POST", "/api/u1/chat/stream", 10),
+    ("POST", "/api/u1/tasks/import", 20),
+    ("GET", "/api/u1/tasks/export/csv", 5),
+    ("POST", "/api/u1/tasks/bulk/delete", 5),
+    ("GET", "/api/u1/tasks", DEFAULT_READ_COST),
+    ("DELETE", "/api/u1/tasks/3", DEFAULT_WRITE_COST),
+    ("OPTIONS", "/api/u1/chat", 0),
+    ("GET", "/health", 0),
+])
+def test_route_cost(method, path, cost):
+    assert route_cost(method, path) == cost
+
+
+def test_bucket_spends_then_waits_for_refill():
+    clock = FakeClock()
+    store = MemoryBucketStore(100, clock)
+
+    assert take(store, cost=10) == 0  # A full bucket covers the burst
+    assert take(store, cost=1) == pytest.approx(0.5)  # Empty: 1 token at 2/s
+
+    clock.now += 0.5
+    assert take(store, cost=1) == 0
+
+
+def test_bucket_refill_is_capped_at_capacity():
+    clock = FakeClock()
+    store = MemoryBucketStore(100, clock)
+    take(store, cost=10)
+
+    clock.now += 3600
+    assert take(store, cost=10) == 0
+    assert take(store, cost=1) > 0
+
+
+def test_buckets_are_per_key_and_bounded():
+    store = MemoryBucketStore(2, FakeClock())
+    take(store, key="a", cost=10)
+    take(store, key="b", cost=10)
+
+    assert take(store, key="c", cost=10) == 0  # Evicts "a", the least recently used
+    assert take(store, key="a", cost=10) == 0  # A fresh bucket again
+    assert take(store, key="c", cost=1) > 0
+
+
+def scope(token=None, client=("203.0.113.9", 5000)) -> dict:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return {"type": "http", "headers": headers, "client": client}
+
+
+def test_client_key_uses_cached_claims_only(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_BYPASS", False)
+    token_cache.put("cached-token", settings.BETTER_AUTH_SECRET, {"user_id": "u1", "exp": time.time() + 60})
+
+    assert client_key(scope("cached-token")) == "user:u1"
+    assert client_key(scope("unverified-token")) == "ip:203.0.113.9"
+    assert client_key(scope()) == "ip:203.0.113.9"
+    assert client_key(scope(client=None)) == "ip:unknown"
+
+
+def test_client_key_ignores_tokens_under_auth_bypass(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_BYPASS", True)
+    token_cache.put("cached-token", settings.BETTER_AUTH_SECRET, {"user_id": "u1", "exp": time.time() + 60})
+
+    assert client_key(scope("cached-token")) == "ip:203.0.113.9"
+
+
+@pytest.mark.parametrize("enabled, bypass, expected", [
+    (None, True, False),
+    (None, False, True),
+    (True, True, True),
+    (False, False, False),
+])
+def test_rate_limit_enabled(monkeypatch, enabled, bypass, expected):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", enabled)
+    monkeypatch.setattr(settings, "AUTH_BYPASS", bypass)
+
+    assert rate_limit_enabled() is expected
+
+
+def test_middleware_answers_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_BURST", 3.0)
+    monkeypatch.setattr(settings, "RATE_LIMIT_REFILL_PER_SECOND", 0.5)
+    set_rate_limit_store(MemoryBucketStore(100, FakeClock()))
+
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.get("/api/{user_id}/tasks")
+    async def tasks(user_id: str):
+        return []
+
+    try:
+        client = TestClient(app)
+        statuses = [client.get("/api/u1/tasks").status_code for _ in range(4)]
+        limited = client.get("/api/u1/tasks")
+    finally:
+        set_rate_limit_store(None)
+
+    assert statuses == [200, 200, 200, 429]
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "2"
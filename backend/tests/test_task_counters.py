@@ -0,0 +1,107 @@
+"""task_counters consistency under concurrent writes (needs TEST_DATABASE_URL).
+
+Each write runs in its own session, as concurrent requests would, and the
+counters are compared with a recount of the tasks table afterwards.
+"""
+
+from sqlmodel import func, select
+from models import Task, TaskCounter
+from services.task_service import TaskService
+import asyncio
+
+WRITERS = 5
+
+
+async def in_session(write):
+    from database import async_session
+
+    async with async_session() as db:
+        return await write(db)
+
+
+async def warm_pool():
+    """Open a connection per writer first, so the writes start together."""
+    await asyncio.gather(*(in_session(lambda db: db.exec(select(1))) for _ in range(WRITERS)))
+
+
+async def behind_row_lock(task_id: int, writes: list):
+    """Start writes while another transaction holds the task's row lock.
+
+    Every write gets as far as it can (reads included) and queues on the
+    row; releasing the lock then lets them through one after another, each
+    after the previous one has committed.
+    """
+    from database import async_session
+
+    async with async_session() as db:
+        await db.exec(select(Task).where(Task.id == task_id).with_for_update())
+        pending = asyncio.gather(*writes)
+        await asyncio.sleep(0.5)
+        await db.rollback()
+    return await pending
+
+
+async def counters_and_recount(user_id: str):
+    from database import async_session
+
+    async with async_session() as db:
+        counters = await db.get(TaskCounter, user_id)
+        total, completed = (await db.exec(
+            select(func.count(), func.count().filter(Task.completed)).where(Task.user_id == user_id)
+        )).one()
+    return counters, total, completed
+
+
+def test_concurrent_first_writes_are_all_counted(run_db, user_id):
+    """A user's first writes race to create the counters row; none may be lost."""
+    async def body():
+        await warm_pool()
+        await asyncio.gather(*(
+            in_session(lambda db, i=i: TaskService.create_task(db, user_id, f"task {i}", priority="high"))
+            for i in range(WRITERS)
+        ))
+        return await counters_and_recount(user_id)
+
+    counters, total, _ = run_db(body)
+
+    assert total == WRITERS
+    assert counters.total == WRITERS
+    assert counters.priority_high == WRITERS
+    assert counters.version == WRITERS  # Created at 1, bumped by every later write
+
+
+def test_concurrent_deletes_of_one_task_count_once(run_db, user_id):
+    async def body():
+        tasks = [await in_session(lambda db, i=i: TaskService.create_task(db, user_id, f"task {i}")) for i in range(3)]
+        await warm_pool()
+        deleted = await behind_row_lock(tasks[0].id, [
+            in_session(lambda db: TaskService.delete_task(db, user_id, tasks[0].id))
+            for _ in range(WRITERS)
+        ])
+        return deleted, await counters_and_recount(user_id)
+
+    deleted, (counters, total, _) = run_db(body)
+
+    assert deleted.count(True) == 1
+    assert total == 2
+    assert counters.total == 2
+    assert counters.priority_medium == 2
+
+
+def test_concurrent_toggles_keep_completed_in_step(run_db, user_id):
+    async def body():
+        task = await in_session(lambda db: TaskService.create_task(db, user_id, "toggle me"))
+        await warm_pool()
+        results = await behind_row_lock(task.id, [
+            in_session(lambda db: TaskService.toggle_complete(db, user_id, task.id))
+            for _ in range(WRITERS)
+        ])
+        return results, await counters_and_recount(user_id)
+
+    results, (counters, total, completed) = run_db(body)
+
+    # Every toggle saw the previous one's result: the states alternate
+    assert sorted(task.completed for task in results) == [False, False, True, True, True]
+    assert completed == 1  # An odd number of toggles
+    assert counters.completed == completed
+    assert counters.total == total == 1